@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from collections import Counter
 from datetime import datetime, timezone
-from statistics import mean
-from typing import Dict, List
+from typing import List, Set
 
+from .instrumentation import instrumented
+from .item_table import ItemTable
+from .lexicon import clusters, scan
+from .minhash import NearDuplicateIndex
 from .schemas import AnalysisResult, ContentItem, RiskSignals, Severity
 
 
@@ -12,38 +15,72 @@ def _clamp(value: float) -> float:
     return max(0.0, min(100.0, value))
 
 
-def _cluster_narratives(items: List[ContentItem]) -> Dict[str, int]:
-    clusters: Counter[str] = Counter()
-    for item in items:
-        text = item.text.lower()
-        if "coordinated" in text or "synchronize" in text:
-            clusters["coordinated-amplification"] += 1
-        if "unverifiable" in text or "no cited source" in text:
-            clusters["source-credibility-gap"] += 1
-        if "reused" in text or "re-uploaded" in text or "recycled" in text:
-            clusters["media-recontextualization"] += 1
-        if "claims" in text:
-            clusters["claims-propagation"] += 1
-    return dict(clusters)
-
-
-def _signals(items: List[ContentItem]) -> RiskSignals:
-    if not items:
+class CaseAccumulator:
+    """Running per-case aggregates so analysis cost follows newly appended items.
+
+    Counts over item columns (platforms, languages, authors, entities,
+    engagement) are read from ``table`` with vectorized operations; ``add``
+    only does the text work. A standalone accumulator appends to a table of
+    its own; the in-memory store passes in the case's table, which it has
+    already appended to.
+    """
+
+    def __init__(self, table: ItemTable | None = None) -> None:
+        self.table = table if table is not None else ItemTable()
+        self._owns_table = table is None
+        self.clusters: Counter[str] = Counter()
+        self.has_casualty = False
+        self.has_unverifiable = False
+        # Item IDs whose text carries the suspicious-caption flag, so media verification need not rescan.
+        self.suspicious_captions: Set[str] = set()
+        self.near_duplicates = NearDuplicateIndex()
+
+    @property
+    def count(self) -> int:
+        return len(self.table)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if not self._owns_table:
+            # A shared table is persisted by its owner, which reattaches it after loading.
+            state["table"] = None
+        return state
+
+    @instrumented("accumulator_add")
+    def add(self, items: List[ContentItem]) -> "CaseAccumulator":
+        if self._owns_table:
+            self.table.append(items)
+        for item in items:
+            tags = scan(item.text)
+            self.clusters.update(clusters(tags))
+            self.has_casualty = self.has_casualty or "flag:casualty" in tags
+            self.has_unverifiable = self.has_unverifiable or "flag:unverifiable" in tags
+            if "flag:suspicious-caption" in tags:
+                self.suspicious_captions.add(item.id)
+            self.near_duplicates.add(item.id, item.text, item.author, item.platform.value)
+        return self
+
+
+def _signals(acc: CaseAccumulator) -> RiskSignals:
+    if not acc.count:
         return RiskSignals()
 
-    engagement_values = [item.engagement for item in items]
-    avg_engagement = mean(engagement_values)
-    platform_count = len(set(item.platform for item in items))
-    language_count = len(set(item.language for item in items))
-    authors = [item.author for item in items]
-    duplicate_authors = len(authors) - len(set(authors))
+    table = acc.table
+    avg_engagement = int(table.column("engagement").sum()) / acc.count
+    duplicate_authors = acc.count - table.distinct("author")
+    copies = acc.near_duplicates
+    copy_paste = (
+        copies.duplicated_items / acc.count * 20
+        + max(0, copies.max_author_spread - 1) * 2
+        + max(0, copies.max_platform_spread - 1) * 5
+    )
 
-    harm = _clamp(35 + (8 if any("casualty" in item.text.lower() for item in items) else 0))
-    velocity = _clamp(20 + (len(items) * 2.2))
+    harm = _clamp(35 + (8 if acc.has_casualty else 0))
+    velocity = _clamp(20 + (acc.count * 2.2))
     reach = _clamp(avg_engagement / 6.0)
-    coordination = _clamp(18 + duplicate_authors * 4 + (10 if len(items) > 14 else 0))
-    credibility_gap = _clamp(25 + (12 if any("unverifiable" in item.text.lower() for item in items) else 0))
-    cross_platform = _clamp(platform_count * 15 + language_count * 8)
+    coordination = _clamp(18 + duplicate_authors * 4 + (10 if acc.count > 14 else 0) + copy_paste)
+    credibility_gap = _clamp(25 + (12 if acc.has_unverifiable else 0))
+    cross_platform = _clamp(table.distinct("platform") * 15 + table.distinct("language") * 8)
 
     return RiskSignals(
         harm=harm,
@@ -76,25 +113,23 @@ def _severity(score: float) -> Severity:
     return Severity.r1
 
 
-def analyze_items(items: List[ContentItem]) -> AnalysisResult:
-    signals = _signals(items)
+# The pipeline's analysis stage; recorded under the stage name benchmarks and dashboards use.
+@instrumented("analyze_items")
+def analyze_accumulator(acc: CaseAccumulator) -> AnalysisResult:
+    signals = _signals(acc)
     score = _score_from_signals(signals)
-    clusters = _cluster_narratives(items)
-    entity_counter: Counter[str] = Counter()
-    account_counter: Counter[str] = Counter()
-    language_counter: Counter[str] = Counter()
-    for item in items:
-        entity_counter.update(item.entities)
-        account_counter.update([item.author])
-        language_counter.update([item.language])
 
     return AnalysisResult(
         signals=signals,
         score=round(score, 2),
         severity=_severity(score),
-        narrative_clusters=clusters,
-        top_entities=[name for name, _ in entity_counter.most_common(6)],
-        top_accounts=[name for name, _ in account_counter.most_common(5)],
-        language_distribution=dict(language_counter),
+        narrative_clusters=dict(acc.clusters),
+        top_entities=acc.table.top("entities", 6),
+        top_accounts=acc.table.top("author", 5),
+        language_distribution=dict(acc.table.counts("language")),
         generated_at=datetime.now(timezone.utc),
     )
+
+
+def analyze_items(items: List[ContentItem]) -> AnalysisResult:
+    return analyze_accumulator(CaseAccumulator().add(items))
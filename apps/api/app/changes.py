@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import AsyncIterator, Collection, List, Set, Tuple
+
+from .schemas import ChangeEvent, TimelineEvent
+
+
+class ChangeNotifier:
+    """Wakes async change-feed subscribers when a store records an event.
+
+    Writers run on worker threads, so each subscription is registered with
+    its own event loop and woken through ``call_soon_threadsafe``.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._lock = Lock()
+
+    def notify(self) -> None:
+        with self._lock:
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The subscriber's loop has already shut down.
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Event]:
+        """Yield an event that is set on every write until the block exits.
+
+        Clear it before reading the feed so a write racing the read is not missed.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            yield waiter[1]
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+class ChangesExpired(LookupError):
+    """The cursor is older than the retained change window; the client has to resync."""
+
+    def __init__(self, oldest: int) -> None:
+        super().__init__(f"Changes up to seq {oldest} are no longer retained")
+        self.oldest = oldest
+
+
+class ChangeLog:
+    """Store-wide sequence of timeline events; ``seq`` is the 1-based position since the store began.
+
+    Only the newest events are kept: once more than ``retention`` are held,
+    the oldest are dropped in batches of a quarter of the window. A cursor
+    therefore stays readable for at least ``retention`` events after it was
+    handed out; reading after an older one raises ``ChangesExpired``.
+    """
+
+    def __init__(self, retention: int = 100_000) -> None:
+        self.retention = max(1, retention)
+        self.events: List[TimelineEvent] = []
+        # Events dropped from the front; the seq of ``events[0]`` is ``dropped + 1``.
+        self.dropped = 0
+        self.notifier = ChangeNotifier()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self.dropped + len(self.events)
+
+    def restore(self, events: List[TimelineEvent], dropped: int) -> None:
+        with self._lock:
+            self.events, self.dropped = events, dropped
+            self._trim(0)
+
+    def _trim(self, slack: int) -> None:
+        excess = len(self.events) - self.retention
+        if excess > slack:
+            # A fresh list rather than an in-place delete, so readers scanning the old one are unaffected.
+            self.events = self.events[excess:]
+            self.dropped += excess
+
+    def append(self, event: TimelineEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+            self._trim(self.retention // 4)
+        self.notifier.notify()
+
+    def since(
+        self, after: int, limit: int, event_types: Collection[str] | None = None
+    ) -> Tuple[List[ChangeEvent], int]:
+        """Return matching events after ``after`` and the sequence number scanned up to."""
+        with self._lock:
+            events, dropped = self.events, self.dropped
+        after = max(0, after)
+        if after < dropped:
+            raise ChangesExpired(dropped)
+        changes: List[ChangeEvent] = []
+        cursor = min(after, dropped + len(events))
+        while cursor < dropped + len(events) and len(changes) < limit:
+            event = events[cursor - dropped]
+            cursor += 1
+            if not event_types or event.event_type in event_types:
+                changes.append(ChangeEvent(seq=cursor, **event.model_dump()))
+        return changes, cursor
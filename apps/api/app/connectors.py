@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from hashlib import sha1
-from typing import Dict, List
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Tuple
 
+from .graph import CaseGraphIndex
+from .instrumentation import instrumented
 from .schemas import ConnectorStatus, ContentItem, Platform, SourceCatalogEntry
 
 
@@ -189,28 +197,148 @@ def collect_case_items(case_id: str, query: str, platforms: List[Platform]) -> L
     return items
 
 
-def build_case_graph(items: List[ContentItem]) -> Dict[str, List[Dict[str, str]]]:
-    nodes: Dict[str, Dict[str, str]] = {}
-    edges: List[Dict[str, str]] = []
-    for item in items:
-        account_node = f"acct:{item.author}"
-        platform_node = f"platform:{item.platform.value}"
-        nodes[account_node] = {"id": account_node, "label": item.author, "type": "account"}
-        nodes[platform_node] = {"id": platform_node, "label": item.platform.value, "type": "platform"}
-        edges.append({"source": account_node, "target": platform_node, "type": "posts_on"})
-        for entity in item.entities:
-            entity_node = f"entity:{entity}"
-            nodes[entity_node] = {"id": entity_node, "label": entity, "type": "entity"}
-            edges.append({"source": account_node, "target": entity_node, "type": "mentions"})
-        if item.narrative_key:
-            narrative_node = f"narrative:{item.narrative_key}"
-            nodes[narrative_node] = {
-                "id": narrative_node,
-                "label": item.narrative_key,
-                "type": "narrative",
-            }
-            edges.append({"source": account_node, "target": narrative_node, "type": "amplifies"})
-    return {"nodes": list(nodes.values()), "edges": edges}
+# Connectors are either coroutines or blocking calls; the blocking ones run on the connector's own threads.
+Connector = Callable[[str, str, Platform], Awaitable[List[ContentItem]] | List[ContentItem]]
+
+
+class ConnectorLimit:
+    """Counting semaphore shared by every thread and event loop in the process.
+
+    Collections run on the server's loop and on the job threads' own
+    ``asyncio.run`` loops; an ``asyncio.Semaphore`` is bound to one loop, so
+    waiters park on a future of their own loop and a release hands the slot
+    over with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    granted = False
+                except ValueError:
+                    granted = True
+            if granted:
+                # Cancelled after a release picked this waiter: pass the slot on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot; safe to call from any thread."""
+        with self._lock:
+            if not self._waiters:
+                self._value += 1
+                return
+            loop, future = self._waiters.popleft()
+        try:
+            loop.call_soon_threadsafe(_grant, future)
+        except RuntimeError:
+            # The waiter's loop has closed; its slot goes to the next waiter.
+            self.release()
+
+
+def _grant(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class CollectionEngine:
+    """Fans a case's platforms out concurrently.
+
+    Each connector has its own timeout and a process-wide concurrency limit,
+    shared by request handlers and background jobs alike; a slow or failing
+    connector is reported in the returned errors instead of failing the case.
+    A timeout cannot stop a blocking connector's thread, so its slot is only
+    freed once the call really returns.
+    """
+
+    def __init__(
+        self,
+        connectors: Dict[Platform, Connector] | None = None,
+        timeout: float = 5.0,
+        concurrency: int = 4,
+    ) -> None:
+        self.connectors = connectors or {}
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.limits: Dict[Platform, ConnectorLimit] = {platform: ConnectorLimit(concurrency) for platform in Platform}
+        self.executors: Dict[Platform, ThreadPoolExecutor] = {
+            platform: ThreadPoolExecutor(max(1, concurrency), thread_name_prefix=f"connector-{platform.value}")
+            for platform in Platform
+        }
+
+    async def _run(self, case_id: str, query: str, platform: Platform) -> List[ContentItem]:
+        connector = self.connectors.get(platform, collect_platform_items)
+        limit = self.limits[platform]
+        if inspect.iscoroutinefunction(connector):
+            async with limit:
+                return await asyncio.wait_for(connector(case_id, query, platform), self.timeout)
+        await limit.acquire()
+        try:
+            future = self.executors[platform].submit(connector, case_id, query, platform)
+        except BaseException:
+            limit.release()
+            raise
+        # Fires when the thread returns, or when a call cancelled before it started is dropped.
+        future.add_done_callback(lambda _: limit.release())
+        return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+
+    async def collect(
+        self, case_id: str, query: str, platforms: List[Platform]
+    ) -> Tuple[List[ContentItem], Dict[str, str]]:
+        results = await asyncio.gather(
+            *(self._run(case_id, query, platform) for platform in platforms),
+            return_exceptions=True,
+        )
+        items: List[ContentItem] = []
+        errors: Dict[str, str] = {}
+        for platform, result in zip(platforms, results):
+            if isinstance(result, asyncio.TimeoutError):
+                errors[platform.value] = f"timed out after {self.timeout:g}s"
+            elif isinstance(result, Exception):
+                errors[platform.value] = str(result) or type(result).__name__
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                items.extend(result)
+        return items, errors
+
+
+collection_engine = CollectionEngine(
+    timeout=float(os.getenv("CONNECTOR_TIMEOUT_SECONDS", "5")),
+    concurrency=int(os.getenv("CONNECTOR_CONCURRENCY", "4")),
+)
+
+
+@instrumented("collect_case_items")
+async def collect_case_items_async(
+    case_id: str, query: str, platforms: List[Platform]
+) -> Tuple[List[ContentItem], Dict[str, str]]:
+    return await collection_engine.collect(case_id, query, platforms)
+
+
+def build_case_graph(items: List[ContentItem]) -> Dict[str, List[Dict[str, Any]]]:
+    return CaseGraphIndex().add(items).to_dict()
 
 
 def list_connector_health() -> List[ConnectorStatus]:
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import math
+from hashlib import blake2b
+from typing import List, Set, Tuple
+
+import numpy as np
+
+from .schemas import ContentItem
+
+
+def content_fingerprint(item: ContentItem) -> bytes:
+    key = "\x1f".join((item.platform.value, item.author, item.url, item.text))
+    return blake2b(key.encode("utf-8"), digest_size=8).digest()
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: bytes) -> List[int]:
+        digest = blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, key: bytes) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class IngestIndex:
+    """Per-case index of ingested item IDs and content fingerprints.
+
+    IDs and fingerprints are always tracked exactly. Once a case passes
+    ``bloom_threshold`` items, fingerprints are sealed into a sorted
+    ``uint64`` array (8 bytes each instead of a Python ``bytes`` in a set)
+    fronted by a Bloom filter: a miss in the filter proves an item is new
+    without searching the array, and a hit is confirmed by binary search,
+    so a false positive costs a lookup rather than a dropped item.
+    """
+
+    def __init__(
+        self,
+        bloom_threshold: int | None = None,
+        bloom_capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        self.ids: Set[str] = set()
+        # Exact fingerprints not yet sealed into ``sealed``.
+        self.fingerprints: Set[bytes] = set()
+        self.sealed = np.empty(0, dtype="<u8")
+        self.bloom: BloomFilter | None = None
+        self.bloom_threshold = bloom_threshold
+        self.bloom_capacity = bloom_capacity
+        self.error_rate = error_rate
+
+    def _seen(self, fingerprint: bytes) -> bool:
+        if fingerprint in self.fingerprints:
+            return True
+        if self.bloom is None or fingerprint not in self.bloom:
+            return False
+        key = np.frombuffer(fingerprint, dtype="<u8")[0]
+        position = np.searchsorted(self.sealed, key)
+        return bool(position < len(self.sealed) and self.sealed[position] == key)
+
+    def _remember(self, fingerprint: bytes) -> None:
+        self.fingerprints.add(fingerprint)
+        if self.bloom is not None:
+            self.bloom.add(fingerprint)
+        # Merging costs a pass over ``sealed``, so the pending set may grow with it.
+        if self.bloom_threshold and len(self.fingerprints) >= max(self.bloom_threshold, len(self.sealed) // 16):
+            self._seal()
+
+    def _seal(self) -> None:
+        if self.bloom is None:
+            self.bloom = BloomFilter(max(self.bloom_capacity, self.bloom_threshold * 2), self.error_rate)
+            for known in self.fingerprints:
+                self.bloom.add(known)
+        pending = np.frombuffer(b"".join(self.fingerprints), dtype="<u8")
+        self.sealed = np.union1d(self.sealed, pending).astype("<u8")
+        self.fingerprints = set()
+
+    def filter(self, items: List[ContentItem]) -> Tuple[List[ContentItem], int]:
+        """Return the items not seen before and how many were skipped."""
+        fresh: List[ContentItem] = []
+        for item in items:
+            if item.id in self.ids:
+                continue
+            fingerprint = content_fingerprint(item)
+            if self._seen(fingerprint):
+                continue
+            self.ids.add(item.id)
+            self._remember(fingerprint)
+            fresh.append(item)
+        return fresh, len(items) - len(fresh)
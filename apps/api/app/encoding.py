@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sys
+from typing import Iterable, List
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class RawJSONResponse(Response):
+    media_type = "application/json"
+
+
+def encode(record: BaseModel) -> bytes:
+    return record.model_dump_json().encode("utf-8")
+
+
+def join_array(chunks: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(chunks) + b"]"
+
+
+class EncodedList:
+    """Pre-encoded JSON for an append-only record list, extended lazily on read."""
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.nbytes = sys.getsizeof(self.chunks)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def sync(self, records: List[BaseModel]) -> "EncodedList":
+        for record in records[len(self.chunks) :]:
+            chunk = encode(record)
+            self.chunks.append(chunk)
+            # The bytes object plus its slot in the list.
+            self.nbytes += sys.getsizeof(chunk) + 8
+        return self
+
+    def json(self) -> bytes:
+        return join_array(self.chunks)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from threading import RLock
+from typing import Any, Collection, Dict, List, Set, Tuple
+
+import numpy as np
+
+from .instrumentation import instrumented
+from .schemas import ContentItem
+
+
+EdgeKey = Tuple[str, str, str]
+NODE_TYPES = ("account", "platform", "entity", "narrative")
+EDGE_TYPES = ("posts_on", "mentions", "amplifies")
+
+
+@dataclass
+class GraphArrays:
+    """A consistent copy of the index's integer mirrors, taken under its lock, for array analytics."""
+
+    version: int
+    node_ids: List[str]
+    labels: List[str]
+    node_kinds: np.ndarray
+    edge_sources: np.ndarray
+    edge_targets: np.ndarray
+    edge_kinds: np.ndarray
+    edge_weights: np.ndarray
+
+
+class CaseGraphIndex:
+    """Account/platform/entity/narrative graph kept up to date on ingest.
+
+    Repeated relations collapse into one weighted edge with first/last-seen
+    times. The serialized payload is cached until ``version`` changes.
+    ``add`` and the readers share ``lock``, so a case can be read while it
+    is still collecting.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Dict[str, str]] = {}
+        self.edges: Dict[EdgeKey, List[Any]] = {}
+        # Integer mirrors of nodes/edges in insertion order, for array-based analytics.
+        self.node_index: Dict[str, int] = {}
+        self.node_kinds: List[int] = []
+        self.edge_sources: List[int] = []
+        self.edge_targets: List[int] = []
+        self.edge_kinds: List[int] = []
+        self.adjacency: Dict[str, List[EdgeKey]] = {}
+        self.version = 0
+        self._cached_version = -1
+        self._cached_json = b""
+        self.lock = RLock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.lock = RLock()
+
+    def _node(self, node_id: str, label: str, node_type: str) -> str:
+        if node_id not in self.nodes:
+            self.nodes[node_id] = {"id": node_id, "label": label, "type": node_type}
+            self.node_index[node_id] = len(self.node_kinds)
+            self.node_kinds.append(NODE_TYPES.index(node_type))
+        return node_id
+
+    def _edge(self, source: str, target: str, edge_type: str, seen: datetime) -> None:
+        edge = self.edges.get((source, target, edge_type))
+        if edge is None:
+            self.edges[(source, target, edge_type)] = [1, seen, seen]
+            self.edge_sources.append(self.node_index[source])
+            self.edge_targets.append(self.node_index[target])
+            self.edge_kinds.append(EDGE_TYPES.index(edge_type))
+            self.adjacency.setdefault(source, []).append((source, target, edge_type))
+            self.adjacency.setdefault(target, []).append((source, target, edge_type))
+            return
+        edge[0] += 1
+        if seen < edge[1]:
+            edge[1] = seen
+        if seen > edge[2]:
+            edge[2] = seen
+
+    @instrumented("graph_index_add")
+    def add(self, items: List[ContentItem]) -> "CaseGraphIndex":
+        with self.lock:
+            for item in items:
+                account = self._node(f"acct:{item.author}", item.author, "account")
+                platform = self._node(f"platform:{item.platform.value}", item.platform.value, "platform")
+                self._edge(account, platform, "posts_on", item.observed_at)
+                for entity in item.entities:
+                    entity_node = self._node(f"entity:{entity}", entity, "entity")
+                    self._edge(account, entity_node, "mentions", item.observed_at)
+                if item.narrative_key:
+                    narrative = self._node(f"narrative:{item.narrative_key}", item.narrative_key, "narrative")
+                    self._edge(account, narrative, "amplifies", item.observed_at)
+            if items:
+                self.version += 1
+        return self
+
+    def arrays(self) -> GraphArrays:
+        with self.lock:
+            return GraphArrays(
+                version=self.version,
+                node_ids=list(self.node_index),
+                labels=[node["label"] for node in self.nodes.values()],
+                node_kinds=np.array(self.node_kinds, dtype=np.int64),
+                edge_sources=np.array(self.edge_sources, dtype=np.int64),
+                edge_targets=np.array(self.edge_targets, dtype=np.int64),
+                edge_kinds=np.array(self.edge_kinds, dtype=np.int64),
+                edge_weights=np.fromiter((edge[0] for edge in self.edges.values()), np.float64, len(self.edges)),
+            )
+
+    def _edge_dict(self, key: EdgeKey) -> Dict[str, Any]:
+        weight, first_seen, last_seen = self.edges[key]
+        return {
+            "source": key[0],
+            "target": key[1],
+            "type": key[2],
+            "weight": weight,
+            "first_seen": first_seen.isoformat(),
+            "last_seen": last_seen.isoformat(),
+        }
+
+    @instrumented("build_case_graph")
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        with self.lock:
+            return {
+                "nodes": list(self.nodes.values()),
+                "edges": [self._edge_dict(key) for key in self.edges],
+            }
+
+    def neighborhood(
+        self,
+        seeds: List[str],
+        hops: int = 1,
+        node_types: Collection[str] = (),
+        edge_types: Collection[str] = (),
+        max_nodes: int = 500,
+    ) -> Tuple[List[str], bool]:
+        """Breadth-first k-hop expansion from ``seeds`` within a node budget.
+
+        Returns the visited node IDs in BFS order and whether the budget cut
+        the expansion short. Cost follows the neighborhood, not the case.
+        """
+        with self.lock:
+            visited: Dict[str, None] = {seed: None for seed in seeds if seed in self.nodes}
+            frontier = list(visited)
+            for _ in range(hops):
+                next_frontier: List[str] = []
+                for node in frontier:
+                    for key in self.adjacency.get(node, ()):
+                        if edge_types and key[2] not in edge_types:
+                            continue
+                        other = key[1] if key[0] == node else key[0]
+                        if other in visited or (node_types and self.nodes[other]["type"] not in node_types):
+                            continue
+                        if len(visited) >= max_nodes:
+                            return list(visited), True
+                        visited[other] = None
+                        next_frontier.append(other)
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+            return list(visited), False
+
+    def subgraph(
+        self,
+        seeds: List[str],
+        hops: int = 1,
+        node_types: Collection[str] = (),
+        edge_types: Collection[str] = (),
+        max_nodes: int = 500,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        with self.lock:
+            visited, truncated = self.neighborhood(seeds, hops, node_types, edge_types, max_nodes)
+            members = set(visited)
+            page = visited[offset : offset + limit]
+            edges: Set[EdgeKey] = set()
+            for node in page:
+                for key in self.adjacency.get(node, ()):
+                    if (not edge_types or key[2] in edge_types) and key[0] in members and key[1] in members:
+                        edges.add(key)
+            return {
+                "nodes": [self.nodes[node] for node in page],
+                "edges": [self._edge_dict(key) for key in sorted(edges)],
+                "total_nodes": len(visited),
+                "next_offset": offset + limit if offset + limit < len(visited) else None,
+                "truncated": truncated,
+            }
+
+    def to_json(self) -> bytes:
+        with self.lock:
+            if self._cached_version != self.version:
+                self._cached_json = json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+                self._cached_version = self.version
+            return self._cached_json
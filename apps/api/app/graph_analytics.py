@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from .graph import EDGE_TYPES, NODE_TYPES, CaseGraphIndex, GraphArrays
+from .instrumentation import instrumented
+from .schemas import BridgeAccount, GraphAnalytics, NodeScore
+
+
+_ACCOUNT = NODE_TYPES.index("account")
+_PLATFORM = NODE_TYPES.index("platform")
+_POSTS_ON = EDGE_TYPES.index("posts_on")
+
+_cache: "WeakKeyDictionary[CaseGraphIndex, Tuple[int, GraphAnalytics]]" = WeakKeyDictionary()
+
+
+class CSRGraph:
+    """Undirected weighted adjacency in compressed sparse row form."""
+
+    def __init__(self, node_count: int, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray) -> None:
+        rows = np.concatenate([sources, targets])
+        cols = np.concatenate([targets, sources])
+        data = np.concatenate([weights, weights]).astype(np.float64)
+        order = np.argsort(rows, kind="stable")
+        self.node_count = node_count
+        self.rows = rows[order]
+        self.indices = cols[order]
+        self.data = data[order]
+        self.indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=node_count), out=self.indptr[1:])
+
+    @classmethod
+    def from_arrays(cls, arrays: GraphArrays) -> "CSRGraph":
+        return cls(len(arrays.node_kinds), arrays.edge_sources, arrays.edge_targets, arrays.edge_weights)
+
+    @classmethod
+    def from_index(cls, graph: CaseGraphIndex) -> "CSRGraph":
+        return cls.from_arrays(graph.arrays())
+
+    def degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def weighted_degree(self) -> np.ndarray:
+        return np.bincount(self.rows, weights=self.data, minlength=self.node_count)
+
+    def components(self) -> np.ndarray:
+        labels = np.arange(self.node_count, dtype=np.int64)
+        if not len(self.rows):
+            return labels
+        while True:
+            previous = labels.copy()
+            np.minimum.at(labels, self.rows, labels[self.indices])
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                return labels
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1e-8, max_iter: int = 100) -> np.ndarray:
+        n = self.node_count
+        if not n:
+            return np.zeros(0)
+        strength = self.weighted_degree()
+        dangling = strength == 0
+        share = self.data / np.where(dangling, 1.0, strength)[self.rows]
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            spread = np.bincount(self.indices, weights=rank[self.rows] * share, minlength=n)
+            updated = (1 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            if np.abs(updated - rank).sum() < tol:
+                return updated
+            rank = updated
+        return rank
+
+
+def _top(arrays: GraphArrays, scores: np.ndarray, mask: np.ndarray, limit: int) -> List[NodeScore]:
+    candidates = np.flatnonzero(mask & (scores > 0))
+    ranked = candidates[np.argsort(-scores[candidates], kind="stable")[:limit]]
+    return [
+        NodeScore(
+            id=arrays.node_ids[i],
+            label=arrays.labels[i],
+            type=NODE_TYPES[arrays.node_kinds[i]],
+            score=round(float(scores[i]), 6),
+        )
+        for i in ranked
+    ]
+
+
+@instrumented()
+def analyze_graph(graph: CaseGraphIndex, limit: int = 10) -> GraphAnalytics:
+    cached = _cache.get(graph)
+    if cached and cached[0] == graph.version:
+        return cached[1]
+
+    # One snapshot under the graph's lock; appends landing meanwhile show up in the next version.
+    arrays = graph.arrays()
+    csr = CSRGraph.from_arrays(arrays)
+    kinds = arrays.node_kinds
+    labels = csr.components()
+    sizes = np.bincount(labels, minlength=csr.node_count) if csr.node_count else np.zeros(0, dtype=np.int64)
+    degree = csr.weighted_degree()
+    rank = csr.pagerank()
+
+    # Bridge accounts post on several platforms; weight by how central they are.
+    posts_on = arrays.edge_kinds == _POSTS_ON
+    platforms_per_node = np.bincount(arrays.edge_sources[posts_on], minlength=csr.node_count)
+    platform_total = max(1, int((kinds == _PLATFORM).sum()) - 1)
+    peak = rank.max() if len(rank) else 1.0
+    bridge = np.maximum(platforms_per_node - 1, 0) / platform_total * (rank / peak if peak else rank)
+    accounts = kinds == _ACCOUNT
+    positions = {node_id: i for i, node_id in enumerate(arrays.node_ids)}
+
+    result = GraphAnalytics(
+        node_count=csr.node_count,
+        edge_count=len(arrays.edge_weights),
+        component_count=int((sizes > 0).sum()),
+        largest_component=int(sizes.max()) if len(sizes) else 0,
+        top_central=_top(arrays, rank, np.ones(csr.node_count, dtype=bool), limit),
+        top_degree=_top(arrays, degree, np.ones(csr.node_count, dtype=bool), limit),
+        bridge_accounts=[
+            BridgeAccount(
+                id=score.id,
+                label=score.label,
+                platforms=int(platforms_per_node[positions[score.id]]),
+                score=score.score,
+            )
+            for score in _top(arrays, bridge, accounts, limit)
+        ],
+    )
+    _cache[graph] = (arrays.version, result)
+    return result
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from itertools import islice
+from threading import Event, Lock, Thread, get_ident
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Seconds; the Prometheus client defaults plus a finer sub-millisecond range for in-memory stages.
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+
+class Histogram:
+    """Fixed-bucket histogram; an observation is one bisect and one locked increment."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.sum
+
+
+def _labels(pairs: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    rendered = [f'{key}="{_escape(value)}"' for key, value in pairs]
+    if extra:
+        rendered.append(extra)
+    return "{" + ",".join(rendered) + "}" if rendered else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Tuple[str, Dict[Tuple[Tuple[str, str], ...], Histogram]]] = {}
+        self._lock = Lock()
+
+    def histogram(self, name: str, help_text: str, **labels: str) -> Histogram:
+        key = tuple(sorted(labels.items()))
+        family = self.histograms.get(name)
+        if family is None or key not in family[1]:
+            with self._lock:
+                family = self.histograms.setdefault(name, (help_text, {}))
+                family[1].setdefault(key, Histogram())
+        return family[1][key]
+
+    def render(self, gauges: Iterable[Tuple[str, str, Dict[str, str], float]] = ()) -> str:
+        """Prometheus text exposition for every histogram plus the given (name, help, labels, value) gauges."""
+        lines: List[str] = []
+        for name, (help_text, series) in sorted(self.histograms.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for key, histogram in sorted(series.items()):
+                counts, total = histogram.snapshot()
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, "+Inf"), counts):
+                    cumulative += count
+                    le = f'le="{bound}"'
+                    lines.append(f"{name}_bucket{_labels(key, le)} {cumulative}")
+                lines.append(f"{name}_sum{_labels(key)} {total!r}")
+                lines.append(f"{name}_count{_labels(key)} {cumulative}")
+        seen = set()
+        for name, help_text, labels, value in gauges:
+            if name not in seen:
+                seen.add(name)
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            lines.append(f"{name}{_labels(tuple(sorted(labels.items())))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+STAGE_METRIC = "nexus_stage_duration_seconds"
+STAGE_HELP = "Wall time spent in each pipeline stage."
+
+
+def instrumented(stage: str | None = None) -> Callable[[F], F]:
+    """Record every call's wall time in the stage histogram; works for sync and async functions."""
+
+    def decorate(func: F) -> F:
+        histogram = registry.histogram(STAGE_METRIC, STAGE_HELP, stage=stage or func.__name__)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - started)
+
+            return timed_async  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+
+        return timed  # type: ignore[return-value]
+
+    return decorate
+
+
+REQUEST_METRIC = "nexus_http_request_duration_seconds"
+REQUEST_HELP = "HTTP request latency by route template, including the response body."
+
+
+class RequestTimingMiddleware:
+    """ASGI middleware recording per-route latency without buffering responses."""
+
+    def __init__(self, app: Callable[..., Any]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            registry.histogram(
+                REQUEST_METRIC, REQUEST_HELP, method=scope["method"], route=route, status=str(status)
+            ).observe(time.perf_counter() - started)
+
+
+def _deep_size(obj: Any, seen: set) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(value, seen) for value in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_size(vars(obj), seen)
+    return size
+
+
+def _sampled_size(obj: Any, seen: set, sample: int) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        return size + _sampled_size(vars(obj), seen, sample)
+    if isinstance(obj, dict):
+        parts: Tuple[Any, ...] = (obj.keys(), obj.values())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        parts = (obj,)
+    else:
+        return size
+    for part in parts:
+        if not part:
+            continue
+        picked = list(islice(part, 0, None, max(1, len(part) // sample)))[:sample]
+        # Scale by distinct objects rather than entries, so shared strings and records count once.
+        distinct = len(set(map(id, part))) if len(part) > len(picked) else len(picked)
+        size += int(sum(_sampled_size(value, seen, sample) for value in picked) * distinct / len(picked))
+    return size
+
+
+def estimate_deep_size(*objects: Any, exclude: Iterable[Any] = (), sample: int = 32) -> int:
+    """Approximate deep size of ``objects``, scaling up an evenly spaced sample of every large container.
+
+    Objects in ``exclude`` (and everything reached only through them) are not counted.
+    """
+    seen = {id(obj) for obj in exclude}
+    return sum(_sampled_size(obj, seen, sample) for obj in objects)
+
+
+def estimate_size(records: List[Any], sample: int = 32) -> int:
+    """Approximate deep size of a homogeneous record list from an evenly spaced sample."""
+    if not records:
+        return sys.getsizeof(records)
+    step = max(1, len(records) // sample)
+    picked = records[::step][:sample]
+    per_record = sum(_deep_size(record, set()) for record in picked) / len(picked)
+    return sys.getsizeof(records) + int(per_record * len(records))
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples every thread's stack on a timer.
+
+    Stacks are aggregated in collapsed ``frame;frame;frame count`` form, which
+    flamegraph.pl and speedscope read directly. Nothing runs while stopped.
+    """
+
+    def __init__(self) -> None:
+        self.samples: Counter = Counter()
+        self.interval = 0.005
+        self.started_at: float | None = None
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._control = Lock()
+        self._lock = Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval: float = 0.005) -> None:
+        with self._control:
+            if self.running:
+                return
+            self.samples = Counter()
+            self.interval = interval
+            self.started_at = time.time()
+            self._stop.clear()
+            self._thread = Thread(target=self._sample, name="sampling-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._control:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+            self._thread = None
+
+    def _sample(self) -> None:
+        own = get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack: List[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                with self._lock:
+                    self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        with self._lock:
+            samples = self.samples.copy()
+        return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+
+profiler = SamplingProfiler()
@@ -3,8 +3,12 @@ from __future__ import annotations
 from collections import Counter
 from datetime import datetime, timezone
 from hashlib import sha1
-from typing import List
+from typing import Collection, Dict, List, Sequence, Set, Tuple
 
+from .instrumentation import instrumented
+from .item_table import value_counts, with_value
+from .lexicon import scan
+from .media_index import MediaHashIndex
 from .schemas import (
     AlertRecord,
     AlertStatus,
@@ -12,12 +16,14 @@ from .schemas import (
     CaseReport,
     ContentItem,
     EvidenceRecord,
+    GraphAnalytics,
     MediaVerificationResult,
     Severity,
     VerificationVerdict,
 )
 
 
+@instrumented()
 def build_alerts(case_id: str, analysis: AnalysisResult) -> List[AlertRecord]:
     alerts: List[AlertRecord] = []
     now = datetime.now(timezone.utc)
@@ -54,8 +60,12 @@ def build_alerts(case_id: str, analysis: AnalysisResult) -> List[AlertRecord]:
     return alerts
 
 
-def build_evidence(case_id: str, items: List[ContentItem]) -> List[EvidenceRecord]:
+@instrumented()
+def build_evidence(
+    case_id: str, items: List[ContentItem], captured_at: datetime | None = None
+) -> List[EvidenceRecord]:
     evidence: List[EvidenceRecord] = []
+    captured_at = captured_at or datetime.now(timezone.utc)
     for item in items:
         evidence.append(
             EvidenceRecord(
@@ -66,27 +76,56 @@ def build_evidence(case_id: str, items: List[ContentItem]) -> List[EvidenceRecor
                 source_url=item.url,
                 evidence_hash=sha1((item.text + item.url).encode()).hexdigest(),
                 note="Captured by unified connector pipeline.",
-                captured_at=datetime.now(timezone.utc),
+                captured_at=captured_at,
             )
         )
     return evidence
 
 
-def verify_media(items: List[ContentItem]) -> List[MediaVerificationResult]:
-    hash_counter = Counter(item.media_hash for item in items if item.media_hash)
+@instrumented()
+def verify_media(
+    items: Sequence[ContentItem],
+    media_index: MediaHashIndex | None = None,
+    max_distance: int = 4,
+    suspicious_captions: Collection[str] | None = None,
+) -> List[MediaVerificationResult]:
+    """Verdicts for the items with media.
+
+    ``suspicious_captions`` are the flagged item IDs a case accumulator
+    recorded at ingest; without them each caption is scanned here.
+    """
+    items = with_value(items, "media_hash")
+    hash_counter = Counter(item.media_hash for item in items)
+    # hash -> {(case_id, item_id)} of near-identical media across every indexed case
+    lookups: Dict[str, Set[Tuple[str, str]]] = {}
     results: List[MediaVerificationResult] = []
     for item in items:
-        if not item.media_hash:
-            continue
-        reused = hash_counter[item.media_hash] > 1
-        text_lower = item.text.lower()
-        suspicious_caption = "unverifiable" in text_lower or "without" in text_lower
+        cross_case = False
+        if media_index is not None:
+            if item.media_hash not in lookups:
+                lookups[item.media_hash] = {
+                    (case_id, item_id) for case_id, item_id, _, _ in media_index.query(item.media_hash, max_distance)
+                }
+            refs = lookups[item.media_hash]
+            reused = len(refs - {(item.case_id, item.id)}) > 0
+            cross_case = any(case_id != item.case_id for case_id, _ in refs)
+        else:
+            reused = hash_counter[item.media_hash] > 1
+        if suspicious_captions is not None:
+            suspicious_caption = item.id in suspicious_captions
+        else:
+            suspicious_caption = "flag:suspicious-caption" in scan(item.text)
         checks = {
             "hash_reused": reused,
+            "cross_case_reuse": cross_case,
             "suspicious_caption": suspicious_caption,
             "source_consistent": item.source_name.startswith(item.platform.value),
         }
-        if reused:
+        if cross_case:
+            verdict = VerificationVerdict.reused
+            confidence = 0.91
+            explanation = "Near-identical media appears in other investigations, indicating recycled imagery."
+        elif reused:
             verdict = VerificationVerdict.reused
             confidence = 0.87
             explanation = "Media hash appears in multiple posts, indicating potential recycling."
@@ -110,8 +149,14 @@ def verify_media(items: List[ContentItem]) -> List[MediaVerificationResult]:
     return results
 
 
-def build_case_report(case_id: str, analysis: AnalysisResult, items: List[ContentItem]) -> CaseReport:
-    top_platforms = Counter(item.platform.value for item in items).most_common(3)
+@instrumented()
+def build_case_report(
+    case_id: str,
+    analysis: AnalysisResult,
+    items: Sequence[ContentItem],
+    graph: GraphAnalytics | None = None,
+) -> CaseReport:
+    top_platforms = value_counts(items, "platform").most_common(3)
     platform_summary = ", ".join(f"{name} ({count})" for name, count in top_platforms) or "none"
     clusters = ", ".join(list(analysis.narrative_clusters.keys())[:4]) or "none"
     recommendations = [
@@ -122,6 +167,22 @@ def build_case_report(case_id: str, analysis: AnalysisResult, items: List[Conten
     if analysis.signals.credibility_gap > 35:
         recommendations.insert(0, "Prioritize source credibility audit for top-linked domains.")
 
+    findings = [
+        f"Cross-platform signal: {analysis.signals.cross_platform:.1f}.",
+        f"Coordination signal: {analysis.signals.coordination:.1f}.",
+        f"Credibility gap signal: {analysis.signals.credibility_gap:.1f}.",
+    ]
+    if graph:
+        findings.append(
+            f"Graph has {graph.node_count} nodes in {graph.component_count} components "
+            f"(largest {graph.largest_component})."
+        )
+        if graph.top_central:
+            findings.append(f"Most central nodes: {', '.join(node.id for node in graph.top_central[:3])}.")
+        if graph.bridge_accounts:
+            bridges = ", ".join(f"{b.label} ({b.platforms} platforms)" for b in graph.bridge_accounts[:3])
+            findings.append(f"Cross-platform bridge accounts: {bridges}.")
+
     return CaseReport(
         case_id=case_id,
         headline=f"{analysis.severity.value} disinformation posture for case {case_id}",
@@ -130,11 +191,7 @@ def build_case_report(case_id: str, analysis: AnalysisResult, items: List[Conten
             f"Top narrative clusters: {clusters}.",
             f"Primary platform distribution: {platform_summary}.",
         ],
-        findings=[
-            f"Cross-platform signal: {analysis.signals.cross_platform:.1f}.",
-            f"Coordination signal: {analysis.signals.coordination:.1f}.",
-            f"Credibility gap signal: {analysis.signals.credibility_gap:.1f}.",
-        ],
+        findings=findings,
         recommendations=recommendations,
         generated_at=datetime.now(timezone.utc),
     )
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, overload
+
+import numpy as np
+
+from .schemas import ContentItem, Platform
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+# Rows materialized per step when a table is iterated.
+ITER_CHUNK = 1024
+
+
+def _micros(moment: datetime) -> int:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - EPOCH) // MICROSECOND
+
+
+class _Array:
+    """Append-only NumPy array with amortized doubling growth.
+
+    ``data`` may be a read-only memory map of a saved table; the first append
+    copies it into memory.
+    """
+
+    def __init__(self, dtype: type, capacity: int = 64) -> None:
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.size = 0
+
+    @classmethod
+    def wrap(cls, data: np.ndarray) -> "_Array":
+        array = cls.__new__(cls)
+        array.data = data
+        array.size = len(data)
+        return array
+
+    def extend(self, values: Iterable[int] | np.ndarray) -> None:
+        values = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=self.data.dtype)
+        if not len(values):
+            return
+        needed = self.size + len(values)
+        if needed > len(self.data):
+            grown = np.zeros(max(needed, len(self.data) * 2), dtype=self.data.dtype)
+            grown[: self.size] = self.data[: self.size]
+            self.data = grown
+        self.data[self.size : needed] = values
+        self.size = needed
+
+    def view(self) -> np.ndarray:
+        return self.data[: self.size]
+
+    @property
+    def nbytes(self) -> int:
+        # Mapped pages belong to the page cache, which the kernel can reclaim.
+        return 0 if isinstance(self.data, np.memmap) else self.data.nbytes
+
+
+class _Strings:
+    """UTF-8 strings packed into one buffer, addressed by an offsets array."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.offsets = _Array(np.int64)
+        self.offsets.extend([0])
+
+    def extend(self, values: Iterable[str]) -> None:
+        if not isinstance(self.buffer, bytearray):
+            self.buffer = bytearray(self.buffer)
+        encoded = [value.encode("utf-8") for value in values]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        self.offsets.extend(len(self.buffer) + np.cumsum(lengths))
+        self.buffer += b"".join(encoded)
+
+    def gather(self, rows: np.ndarray) -> List[str]:
+        offsets, buffer = self.offsets.data, self.buffer
+        return [
+            str(buffer[start:end], "utf-8")
+            for start, end in zip(offsets[rows].tolist(), offsets[rows + 1].tolist())
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        return (len(self.buffer) if isinstance(self.buffer, bytearray) else 0) + self.offsets.nbytes
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {"buffer": np.frombuffer(bytes(self.buffer), dtype=np.uint8), "offsets": self.offsets.view()}
+
+    def restore(self, arrays: Dict[str, np.ndarray]) -> None:
+        self.buffer = arrays["buffer"]
+        self.offsets = _Array.wrap(arrays["offsets"])
+
+
+class _Interned:
+    """Dictionary-encoded strings: one int32 code per row, ``-1`` for None.
+
+    Codes are assigned in first-seen order, so counts read back in the same
+    order a ``Counter`` fed row by row would report them.
+    """
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.lookup: Dict[str, int] = {}
+        self.codes = _Array(np.int32)
+
+    def code(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def extend(self, values: Iterable[str | None]) -> None:
+        self.codes.extend([self.code(value) for value in values])
+
+    def gather(self, rows: np.ndarray) -> List[str | None]:
+        values = self.values
+        return [None if code < 0 else values[code] for code in self.codes.data[rows].tolist()]
+
+    def counts(self, codes: np.ndarray | None = None) -> np.ndarray:
+        codes = self.codes.view() if codes is None else codes
+        return np.bincount(codes[codes >= 0], minlength=len(self.values))
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(len(value) + 49 for value in self.values)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {"codes": self.codes.view()}
+
+    def restore(self, arrays: Dict[str, np.ndarray], values: List[str]) -> None:
+        self.values = values
+        self.lookup = {value: code for code, value in enumerate(values)}
+        self.codes = _Array.wrap(arrays["codes"])
+
+
+class _InternedLists(_Interned):
+    """A list of interned strings per row, stored as flat codes plus row offsets."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.offsets = _Array(np.int64)
+        self.offsets.extend([0])
+
+    def extend(self, rows: Iterable[List[str]]) -> None:  # type: ignore[override]
+        flat: List[int] = []
+        ends: List[int] = []
+        end = self.codes.size
+        for values in rows:
+            flat += [self.code(value) for value in values]
+            end += len(values)
+            ends.append(end)
+        self.codes.extend(flat)
+        self.offsets.extend(ends)
+
+    def gather(self, rows: np.ndarray) -> List[List[str]]:  # type: ignore[override]
+        offsets, codes, values = self.offsets.data, self.codes.data, self.values
+        return [
+            [values[code] for code in codes[start:end].tolist()]
+            for start, end in zip(offsets[rows].tolist(), offsets[rows + 1].tolist())
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + self.offsets.nbytes
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {"codes": self.codes.view(), "offsets": self.offsets.view()}
+
+    def restore(self, arrays: Dict[str, np.ndarray], values: List[str]) -> None:
+        super().restore(arrays, values)
+        self.offsets = _Array.wrap(arrays["offsets"])
+
+
+class ItemTable(Sequence[ContentItem]):
+    """Columnar, append-only storage for one case's content items.
+
+    Repeated strings (platform, author, language, source, media hash,
+    narrative key, entities) are interned to int32 codes; engagement and
+    ``observed_at`` (UTC microseconds) are int64 arrays; id, url and text
+    live in packed string buffers. Indexing or iterating materializes
+    ``ContentItem`` models on demand, while ``counts``, ``distinct``,
+    ``top`` and ``column`` answer aggregate questions with vectorized
+    operations over the codes. Appends are serialized; readers see a row
+    only once every column holds it.
+    """
+
+    INTERNED = ("case_id", "platform", "author", "language", "source_name", "media_hash", "narrative_key")
+
+    def __init__(self, items: Iterable[ContentItem] = ()) -> None:
+        self.ids = _Strings()
+        self.texts = _Strings()
+        self.urls = _Strings()
+        self.interned: Dict[str, _Interned] = {name: _Interned() for name in self.INTERNED}
+        self.interned["entities"] = _InternedLists()
+        self.engagement = _Array(np.int64)
+        self.observed_at = _Array(np.int64)
+        self.count = 0
+        self._lock = Lock()
+        self.append(list(items))
+
+    def append(self, items: List[ContentItem]) -> None:
+        if not items:
+            return
+        with self._lock:
+            self.ids.extend(item.id for item in items)
+            self.texts.extend(item.text for item in items)
+            self.urls.extend(item.url for item in items)
+            for name, column in self.interned.items():
+                if name == "platform":
+                    column.extend(item.platform.value for item in items)
+                else:
+                    column.extend(getattr(item, name) for item in items)
+            self.engagement.extend([item.engagement for item in items])
+            self.observed_at.extend([_micros(item.observed_at) for item in items])
+            self.count += len(items)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @overload
+    def __getitem__(self, index: int) -> ContentItem: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ContentItem]: ...
+
+    def __getitem__(self, index: int | slice) -> ContentItem | List[ContentItem]:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self.count)))
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("item index out of range")
+        return self.take([index])[0]
+
+    def __iter__(self) -> Iterator[ContentItem]:
+        count = self.count
+        for start in range(0, count, ITER_CHUNK):
+            yield from self.take(range(start, min(count, start + ITER_CHUNK)))
+
+    def take(self, rows: Iterable[int] | np.ndarray) -> List[ContentItem]:
+        """Materialize the given rows, gathering each column once for the whole batch."""
+        rows = np.asarray(rows if isinstance(rows, (np.ndarray, range)) else list(rows), dtype=np.int64)
+        if not len(rows):
+            return []
+        columns = {name: column.gather(rows) for name, column in self.interned.items()}
+        columns["platform"] = [Platform(value) for value in columns["platform"]]
+        columns["id"] = self.ids.gather(rows)
+        columns["text"] = self.texts.gather(rows)
+        columns["url"] = self.urls.gather(rows)
+        columns["observed_at"] = [EPOCH + value * MICROSECOND for value in self.observed_at.data[rows].tolist()]
+        columns["engagement"] = self.engagement.data[rows].tolist()
+        names = list(columns)
+        # Columns were validated on the way in; skip re-validation when rebuilding the models.
+        return [
+            ContentItem.model_construct(**dict(zip(names, values))) for values in zip(*columns.values())
+        ]
+
+    def ids_at(self, rows: np.ndarray) -> List[str]:
+        return self.ids.gather(rows)
+
+    def sort_key(self, row: int) -> tuple[datetime, str]:
+        return EPOCH + int(self.observed_at.data[row]) * MICROSECOND, self.ids.gather(np.array([row]))[0]
+
+    def column(self, name: str) -> np.ndarray:
+        """The raw array behind ``name``: int codes for interned columns, values for numeric ones."""
+        if name == "engagement":
+            return self.engagement.view()[: self.count]
+        if name == "observed_at":
+            return self.observed_at.view()[: self.count]
+        column = self.interned[name]
+        if isinstance(column, _InternedLists):
+            return column.codes.view()[: column.offsets.data[self.count]]
+        return column.codes.view()[: self.count]
+
+    def counts(self, name: str) -> Counter:
+        """Per-value row counts of an interned column, in first-seen order like ``Counter``."""
+        column = self.interned[name]
+        counts = column.counts(self.column(name))
+        return Counter({column.values[code]: int(counts[code]) for code in np.flatnonzero(counts)})
+
+    def distinct(self, name: str) -> int:
+        return int(np.count_nonzero(self.interned[name].counts(self.column(name))))
+
+    def top(self, name: str, limit: int) -> List[str]:
+        """The ``limit`` most frequent values; ties keep first-seen order, as ``Counter.most_common`` does."""
+        column = self.interned[name]
+        counts = column.counts(self.column(name))
+        order = np.argsort(-counts, kind="stable")[:limit]
+        return [column.values[code] for code in order if counts[code]]
+
+    def rows_with(self, name: str) -> np.ndarray:
+        """Row numbers whose interned column ``name`` is set (neither None nor empty)."""
+        codes = self.column(name)
+        present = codes >= 0
+        empty = self.interned[name].lookup.get("")
+        if empty is not None:
+            present &= codes != empty
+        return np.flatnonzero(present)
+
+    @property
+    def nbytes(self) -> int:
+        """Heap bytes held by the columns; memory-mapped columns count as zero."""
+        arrays = (self.ids, self.texts, self.urls, self.engagement, self.observed_at, *self.interned.values())
+        return sum(array.nbytes for array in arrays)
+
+    def capture(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """The table's columns and manifest as of now; later appends do not change them."""
+        with self._lock:
+            arrays = {"engagement": self.engagement.view(), "observed_at": self.observed_at.view()}
+            for name in ("ids", "texts", "urls"):
+                arrays.update({f"{name}.{part}": array for part, array in getattr(self, name).arrays().items()})
+            for name, column in self.interned.items():
+                arrays.update({f"{name}.{part}": array for part, array in column.arrays().items()})
+            values = {name: list(column.values) for name, column in self.interned.items()}
+            return arrays, {"count": self.count, "values": values}
+
+    def save(self, directory: Path) -> None:
+        """Write every column as a ``.npy`` file plus a JSON manifest of the interned values."""
+        write_columns(directory, *self.capture())
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "ItemTable":
+        """Open a saved table; with ``mmap`` the columns stay on disk until the table is appended to."""
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+
+        def arrays(prefix: str) -> Dict[str, np.ndarray]:
+            return {
+                path.name[len(prefix) + 1 : -4]: np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+                for path in directory.glob(f"{prefix}.*.npy")
+            }
+
+        table = cls()
+        table.engagement = _Array.wrap(np.load(directory / "engagement.npy", mmap_mode="r" if mmap else None))
+        table.observed_at = _Array.wrap(np.load(directory / "observed_at.npy", mmap_mode="r" if mmap else None))
+        for name in ("ids", "texts", "urls"):
+            getattr(table, name).restore(arrays(name))
+        for name, column in table.interned.items():
+            column.restore(arrays(name), manifest["values"][name])
+        table.count = manifest["count"]
+        return table
+
+
+def write_columns(directory: Path, arrays: Dict[str, np.ndarray], manifest: dict) -> None:
+    """Write what ``ItemTable.capture`` returned, in the layout ``ItemTable.load`` reads."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for key, array in arrays.items():
+        np.save(directory / f"{key}.npy", array, allow_pickle=False)
+    (directory / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+
+def value_counts(items: Sequence[ContentItem], name: str) -> Counter:
+    """``Counter`` of an interned column, vectorized for an ``ItemTable`` and a plain loop otherwise."""
+    if isinstance(items, ItemTable):
+        return items.counts(name)
+    if name == "platform":
+        return Counter(item.platform.value for item in items)
+    return Counter(getattr(item, name) for item in items if getattr(item, name) is not None)
+
+
+def with_value(items: Sequence[ContentItem], name: str) -> Sequence[ContentItem]:
+    """Only the items whose ``name`` is set, without materializing the rest of an ``ItemTable``."""
+    if isinstance(items, ItemTable):
+        return items.take(items.rows_with(name))
+    return [item for item in items if getattr(item, name)]
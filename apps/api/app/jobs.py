@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import queue
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterator, List, Protocol, Tuple
+from uuid import uuid4
+
+from .pipeline import PIPELINE_STAGES, analyze_case, collect_case, generate_case_products
+from .schemas import Job, JobStage, JobStatus
+
+
+Runner = Callable[..., Any]
+
+
+class JobQueue(Protocol):
+    def put(self, job_id: str) -> None: ...
+
+    def get(self, timeout: float) -> str | None: ...
+
+
+class LocalJobQueue:
+    """In-process FIFO; the default backend and the stand-in used by tests."""
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[str]" = queue.Queue()
+
+    def put(self, job_id: str) -> None:
+        self._queue.put(job_id)
+
+    def get(self, timeout: float) -> str | None:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class JobManager:
+    """Runs case pipelines on a pool of worker threads.
+
+    A job for a (case, kind) pair that is already queued or running is
+    returned instead of enqueueing another, so repeated clicks and polling
+    workers do not pile up duplicate pipeline runs. Finished jobs are kept
+    for status lookups until ``history`` newer jobs have been submitted.
+    """
+
+    def __init__(
+        self,
+        runners: Dict[str, Runner],
+        stages: Dict[str, List[str]],
+        backend: JobQueue | None = None,
+        workers: int = 2,
+        history: int = 1000,
+    ) -> None:
+        self.runners = runners
+        self.stages = stages
+        self.backend = backend or LocalJobQueue()
+        self.workers = max(1, workers)
+        self.history = history
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self.active: Dict[Tuple[str, str], str] = {}
+        self._threads: List[Thread] = []
+        self._running = False
+        self._lock = Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._threads = [
+                Thread(target=self._work, name=f"job-worker-{n}", daemon=True) for n in range(self.workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        self._running = False
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, kind: str, case_id: str) -> Job:
+        if kind not in self.runners:
+            raise ValueError(f"Unknown job kind: {kind}")
+        with self._lock:
+            existing = self.active.get((case_id, kind))
+            if existing:
+                return self.jobs[existing].model_copy(deep=True)
+            job = Job(
+                id=f"job_{uuid4().hex[:10]}",
+                case_id=case_id,
+                kind=kind,
+                status=JobStatus.queued,
+                created_at=datetime.now(timezone.utc),
+                stages=[JobStage(name=name) for name in self.stages.get(kind, [])],
+            )
+            self.jobs[job.id] = job
+            self.active[(case_id, kind)] = job.id
+            while len(self.jobs) > self.history:
+                oldest = next(iter(self.jobs))
+                if self.jobs[oldest].status not in (JobStatus.succeeded, JobStatus.failed):
+                    break
+                del self.jobs[oldest]
+            snapshot = job.model_copy(deep=True)
+        self.start()
+        self.backend.put(job.id)
+        return snapshot
+
+    def get(self, job_id: str) -> Job:
+        with self._lock:
+            return self.jobs[job_id].model_copy(deep=True)
+
+    def list(self, case_id: str | None = None) -> List[Job]:
+        with self._lock:
+            return [
+                job.model_copy(deep=True)
+                for job in self.jobs.values()
+                if case_id is None or job.case_id == case_id
+            ]
+
+    @contextmanager
+    def _stage(self, job: Job, name: str) -> Iterator[None]:
+        with self._lock:
+            stage = next((s for s in job.stages if s.name == name and s.started_at is None), None)
+            if stage is None:
+                stage = JobStage(name=name)
+                job.stages.append(stage)
+            stage.started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                stage.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+                job.progress = round(sum(1 for s in job.stages if s.duration_ms is not None) / len(job.stages), 4)
+
+    def _work(self) -> None:
+        while self._running:
+            job_id = self.backend.get(timeout=0.2)
+            if job_id is not None:
+                self.run(job_id)
+
+    def run(self, job_id: str) -> None:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != JobStatus.queued:
+                return
+            job.status = JobStatus.running
+            job.started_at = datetime.now(timezone.utc)
+        try:
+            result = self.runners[job.kind](job.case_id, lambda name: self._stage(job, name))
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)
+        except Exception as exc:
+            status, error, result = JobStatus.failed, str(exc) or type(exc).__name__, None
+        else:
+            status, error = JobStatus.succeeded, None
+        with self._lock:
+            job.status = status
+            job.error = error
+            job.result = result
+            job.finished_at = datetime.now(timezone.utc)
+            if status == JobStatus.succeeded:
+                job.progress = 1.0
+            if self.active.get((job.case_id, job.kind)) == job.id:
+                del self.active[(job.case_id, job.kind)]
+
+
+async def _run_all(case_id: str, stage: Callable) -> Any:
+    await collect_case(case_id, stage)
+    return analyze_case(case_id, stage)
+
+
+job_manager = JobManager(
+    runners={
+        "collect": collect_case,
+        "analyze": analyze_case,
+        "run-all": _run_all,
+        "generate-products": generate_case_products,
+    },
+    stages=PIPELINE_STAGES,
+    workers=int(os.getenv("JOB_WORKERS", "2")),
+)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from typing import Dict, List, Tuple
+
+from .schemas import EvidenceRecord
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def leaf_hash(record: EvidenceRecord) -> bytes:
+    captured_us = (record.captured_at - EPOCH) // timedelta(microseconds=1)
+    payload = "\x1f".join(
+        (record.id, record.item_id, record.source_url, record.evidence_hash, str(captured_us))
+    )
+    return sha256(b"\x00" + payload.encode("utf-8")).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return sha256(b"\x01" + left + right).digest()
+
+
+def verify_proof(leaf: bytes, path: List[Tuple[str, str]], root: str) -> bool:
+    acc = leaf
+    for sibling, position in path:
+        acc = node_hash(bytes.fromhex(sibling), acc) if position == "left" else node_hash(acc, bytes.fromhex(sibling))
+    return acc.hex() == root
+
+
+class EvidenceLedger:
+    """Append-only evidence records with an incremental Merkle tree.
+
+    ``levels[h][i]`` is the root of the perfect subtree over leaves
+    ``[i * 2**h, (i + 1) * 2**h)``, so appends cost O(log n). The case root
+    folds the perfect-subtree peaks right to left, and inclusion proofs are
+    the sibling path inside the leaf's peak followed by the neighbouring
+    peaks.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[EvidenceRecord] = []
+        self.positions: Dict[str, int] = {}
+        self.levels: List[List[bytes]] = [[]]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def append(self, records: List[EvidenceRecord]) -> List[EvidenceRecord]:
+        added: List[EvidenceRecord] = []
+        for record in records:
+            if record.id in self.positions:
+                continue
+            self.positions[record.id] = len(self.records)
+            self.records.append(record)
+            self.levels[0].append(leaf_hash(record))
+            height = 0
+            while len(self.levels[height]) % 2 == 0:
+                if len(self.levels) == height + 1:
+                    self.levels.append([])
+                left, right = self.levels[height][-2:]
+                self.levels[height + 1].append(node_hash(left, right))
+                height += 1
+            added.append(record)
+        return added
+
+    def _peaks(self) -> List[Tuple[int, int, int]]:
+        """(height, index within level, first leaf) for each peak, left to right."""
+        peaks: List[Tuple[int, int, int]] = []
+        start = 0
+        size = len(self.records)
+        for height in range(size.bit_length() - 1, -1, -1):
+            if size & (1 << height):
+                peaks.append((height, start >> height, start))
+                start += 1 << height
+        return peaks
+
+    def _bag(self, peaks: List[Tuple[int, int, int]]) -> bytes:
+        acc = self.levels[peaks[-1][0]][peaks[-1][1]]
+        for height, index, _ in reversed(peaks[:-1]):
+            acc = node_hash(self.levels[height][index], acc)
+        return acc
+
+    def root(self) -> str:
+        if not self.records:
+            return sha256(b"").hexdigest()
+        return self._bag(self._peaks()).hex()
+
+    def proof(self, evidence_id: str) -> Tuple[int, List[Tuple[str, str]]]:
+        """Return the leaf index and (sibling hash, side) steps from leaf to root."""
+        position = self.positions[evidence_id]
+        peaks = self._peaks()
+        peak_number = next(n for n, (h, _, start) in enumerate(peaks) if start <= position < start + (1 << h))
+        height = peaks[peak_number][0]
+
+        path: List[Tuple[str, str]] = []
+        for level in range(height):
+            index = position >> level
+            sibling = self.levels[level][index ^ 1]
+            path.append((sibling.hex(), "left" if index & 1 else "right"))
+        if peak_number + 1 < len(peaks):
+            path.append((self._bag(peaks[peak_number + 1 :]).hex(), "right"))
+        for left_height, left_index, _ in reversed(peaks[:peak_number]):
+            path.append((self.levels[left_height][left_index].hex(), "left"))
+        return position, path
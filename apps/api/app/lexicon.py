@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+# term -> tags. "cluster:<name>" feeds narrative clusters; "flag:<name>" feeds risk
+# signals and media checks. Arabic terms are normalized at compile time.
+DEFAULT_LEXICON: Dict[str, List[str]] = {
+    "coordinated": ["cluster:coordinated-amplification"],
+    "synchronize": ["cluster:coordinated-amplification"],
+    "منسق": ["cluster:coordinated-amplification"],
+    "تزامن": ["cluster:coordinated-amplification"],
+    "حملة منظمة": ["cluster:coordinated-amplification"],
+    "unverifiable": [
+        "cluster:source-credibility-gap",
+        "flag:unverifiable",
+        "flag:suspicious-caption",
+    ],
+    "no cited source": ["cluster:source-credibility-gap"],
+    "غير موثق": ["cluster:source-credibility-gap", "flag:unverifiable", "flag:suspicious-caption"],
+    "لا يمكن التحقق": ["cluster:source-credibility-gap", "flag:unverifiable", "flag:suspicious-caption"],
+    "دون مصدر": ["cluster:source-credibility-gap"],
+    "بلا مصدر": ["cluster:source-credibility-gap"],
+    "مصدر مجهول": ["cluster:source-credibility-gap"],
+    "reused": ["cluster:media-recontextualization"],
+    "re-uploaded": ["cluster:media-recontextualization"],
+    "recycled": ["cluster:media-recontextualization"],
+    "إعادة نشر": ["cluster:media-recontextualization"],
+    "معاد نشره": ["cluster:media-recontextualization"],
+    "إعادة تدوير": ["cluster:media-recontextualization"],
+    "مُعاد تدويره": ["cluster:media-recontextualization"],
+    "صورة قديمة": ["cluster:media-recontextualization"],
+    "claims": ["cluster:claims-propagation"],
+    "ادعاء": ["cluster:claims-propagation"],
+    "مزاعم": ["cluster:claims-propagation"],
+    "casualty": ["flag:casualty"],
+    "ضحايا": ["flag:casualty"],
+    "قتلى": ["flag:casualty"],
+    "إصابات": ["flag:casualty"],
+    "without": ["flag:suspicious-caption"],
+    "بدون": ["flag:suspicious-caption"],
+    "من دون": ["flag:suspicious-caption"],
+}
+
+_ARABIC_FOLDING = {
+    ord("أ"): "ا",
+    ord("إ"): "ا",
+    ord("آ"): "ا",
+    ord("ٱ"): "ا",
+    ord("ى"): "ي",
+    ord("ة"): "ه",
+    ord("ـ"): None,  # tatweel
+    ord("ٰ"): None,  # superscript alef
+}
+_ARABIC_FOLDING.update({code: None for code in range(0x064B, 0x0660)})  # harakat
+
+
+def normalize(text: str) -> str:
+    return text.lower().translate(_ARABIC_FOLDING)
+
+
+class Lexicon:
+    """Aho-Corasick automaton over a term -> tags lexicon.
+
+    A single pass over the normalized text reports every term occurrence, so
+    cost grows with text length rather than with the number of terms.
+    """
+
+    def __init__(self, entries: Dict[str, Iterable[str]]) -> None:
+        self.tag_order: Dict[str, int] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terms: List[List[str]] = [[]]
+        self._tags: List[FrozenSet[str]] = [frozenset()]
+        tags_by_term: Dict[str, set] = {}
+        for raw_term, tags in entries.items():
+            term = normalize(raw_term)
+            if not term:
+                continue
+            for tag in tags:
+                self.tag_order.setdefault(tag, len(self.tag_order))
+            tags_by_term.setdefault(term, set()).update(tags)
+        for term, tags in tags_by_term.items():
+            self._insert(term, frozenset(tags))
+        self._link()
+
+    def _insert(self, term: str, tags: FrozenSet[str]) -> None:
+        state = 0
+        for char in term:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._terms.append([])
+                self._tags.append(frozenset())
+                self._goto[state][char] = nxt
+            state = nxt
+        self._terms[state].append(term)
+        self._tags[state] = self._tags[state] | tags
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._terms[nxt] = self._terms[nxt] + self._terms[self._fail[nxt]]
+                self._tags[nxt] = self._tags[nxt] | self._tags[self._fail[nxt]]
+
+    def _states(self, text: str) -> Iterable[Tuple[int, int]]:
+        goto, fail = self._goto, self._fail
+        state = 0
+        for index, char in enumerate(normalize(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if state:
+                yield index, state
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """Return (end offset, normalized term) for every lexicon hit."""
+        return [(index, term) for index, state in self._states(text) for term in self._terms[state]]
+
+    def tags(self, text: str) -> Tuple[str, ...]:
+        found: set = set()
+        for _, state in self._states(text):
+            found |= self._tags[state]
+        return tuple(sorted(found, key=self.tag_order.__getitem__))
+
+
+def load_lexicon() -> Lexicon:
+    path = os.getenv("LEXICON_PATH")
+    if not path:
+        return Lexicon(DEFAULT_LEXICON)
+    with open(path, encoding="utf-8") as handle:
+        return Lexicon(json.load(handle))
+
+
+_lexicon = load_lexicon()
+
+
+def set_lexicon(lexicon: Lexicon) -> None:
+    global _lexicon
+    _lexicon = lexicon
+    scan.cache_clear()
+
+
+@lru_cache(maxsize=65536)
+def scan(text: str) -> Tuple[str, ...]:
+    """Tags for ``text`` under the active lexicon, cached so each text is scanned once."""
+    return _lexicon.tags(text)
+
+
+def clusters(tags: Iterable[str]) -> List[str]:
+    return [tag[len("cluster:"):] for tag in tags if tag.startswith("cluster:")]
@@ -1,41 +1,74 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-
-from .analysis import analyze_items
-from .connectors import (
-    build_case_graph,
-    collect_case_items,
-    list_connector_health,
-    list_source_catalog,
-)
-from .intelligence import build_alerts, build_case_report, build_evidence, verify_media
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from .changes import ChangesExpired
+from .connectors import list_connector_health, list_source_catalog
+from .graph_analytics import analyze_graph
+from .encoding import RawJSONResponse, encode, join_array
+from .instrumentation import RequestTimingMiddleware, profiler, registry
+from .jobs import job_manager
+from .ledger import leaf_hash
+from .pagination import SortKey, decode_cursor, encode_cursor
+from .pipeline import analyze_case, collect_case, generate_case_products
 from .schemas import (
     AlertRecord,
+    BatchCaseRequest,
+    BatchCreateRequest,
+    BatchResponse,
+    BatchResult,
+    CaseBundle,
     CaseGraph,
     CaseRecord,
     CaseReport,
+    ChangeBounds,
+    ChangePage,
     ConnectorStatus,
     ContentItem,
     CreateCaseRequest,
+    DuplicateCluster,
+    EvidenceProof,
     EvidenceRecord,
+    EvidenceRoot,
     GlobalMetrics,
+    GraphAnalytics,
+    Job,
+    JobStatus,
+    MediaMatch,
+    ProofStep,
     MediaVerificationResult,
     SourceCatalogEntry,
     Status,
+    Subgraph,
     TimelineEvent,
 )
 from .storage import store
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Flushes the in-memory store's final snapshot (or the SQL pool) on a clean shutdown.
+    await run_in_threadpool(store.close)
+
+
 app = FastAPI(
     title="Nexus MENA OSINT API",
     version="0.1.0",
     description="Multidomain OSINT API for disinformation and risk monitoring.",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -44,7 +77,127 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+app.add_middleware(RequestTimingMiddleware)
+
+
+MAX_PAGE_SIZE = 1000
+STREAM_CHUNK_SIZE = 500
+# Change-feed streams re-poll this often so writes from other API processes still arrive.
+CHANGE_POLL_SECONDS = 1.0
+SSE_KEEPALIVE_SECONDS = 15.0
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+# The sampling profiler endpoints are only served when explicitly enabled.
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "0") == "1"
+
+
+def _ndjson_chunks(
+    fetch: Callable[[SortKey | None, int], list], key: Callable[[Any], SortKey], after: SortKey | None, limit: int | None
+) -> Iterator[bytes]:
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = STREAM_CHUNK_SIZE if remaining is None else min(STREAM_CHUNK_SIZE, remaining)
+        chunk = fetch(after, size)
+        if not chunk:
+            return
+        yield b"".join(record.model_dump_json().encode("utf-8") + b"\n" for record in chunk)
+        if len(chunk) < size:
+            return
+        after = key(chunk[-1])
+        if remaining is not None:
+            remaining -= len(chunk)
+
+
+async def _sse_changes(after: int, event_types: list[str] | None, limit: int | None) -> AsyncIterator[bytes]:
+    sent = 0
+    idle = 0.0
+    async with store.notifier.subscribe() as wake:
+        while limit is None or sent < limit:
+            wake.clear()
+            size = STREAM_CHUNK_SIZE if limit is None else min(STREAM_CHUNK_SIZE, limit - sent)
+            try:
+                changes, after = await run_in_threadpool(store.get_changes, after, size, event_types)
+            except ChangesExpired as exc:
+                # The subscriber fell behind the retained window; tell it to resync and end the stream.
+                yield f"event: resync\ndata: {json.dumps({'oldest': exc.oldest})}\n\n".encode("utf-8")
+                return
+            for change in changes:
+                yield (
+                    f"id: {change.seq}\nevent: {change.event_type}\ndata: {change.model_dump_json()}\n\n"
+                ).encode("utf-8")
+            sent += len(changes)
+            if changes:
+                idle = 0.0
+                continue
+            try:
+                await asyncio.wait_for(wake.wait(), CHANGE_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                idle += CHANGE_POLL_SECONDS
+                if idle >= SSE_KEEPALIVE_SECONDS:
+                    idle = 0.0
+                    yield b": keepalive\n\n"
+
+
+def _list_response(
+    request: Request,
+    response: Response,
+    fetch: Callable[[SortKey | None, int], list],
+    key: Callable[[Any], SortKey],
+    full: Callable[[], Any],
+    cursor: str | None,
+    limit: int | None,
+    format: str | None,
+):
+    """Full list by default; keyset page when cursor/limit is given; NDJSON stream on request."""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if format == "ndjson" or (format is None and "application/x-ndjson" in request.headers.get("accept", "")):
+        return StreamingResponse(_ndjson_chunks(fetch, key, after, limit), media_type="application/x-ndjson")
+    if cursor is None and limit is None:
+        return full()
+
+    page = fetch(after, limit or MAX_PAGE_SIZE)
+    if len(page) == (limit or MAX_PAGE_SIZE):
+        response.headers["X-Next-Cursor"] = encode_cursor(key(page[-1]))
+    return page
+
+
+def _check_etag(request: Request, etag: str) -> None:
+    """Answer 304 when the client already holds ``etag``; otherwise tag the response with it."""
+    candidates = {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}
+    if etag in candidates or "*" in candidates:
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+    request.state.etag = etag
+
+
+def _case_etag_value(case_id: str, version: int) -> str:
+    # The store's epoch keeps a counter that restarted (new process, recreated database) from matching old tags.
+    return f'W/"{store.epoch}-{case_id}-{version}"'
+
+
+def case_etag(case_id: str, request: Request) -> None:
+    try:
+        version = store.get_version(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    _check_etag(request, _case_etag_value(case_id, version))
+
+
+def global_etag(request: Request) -> None:
+    _check_etag(request, f'W/"{store.epoch}-global-{store.get_global_version()}"')
+
+
+@app.middleware("http")
+async def etag_header(request: Request, call_next):
+    response = await call_next(request)
+    etag = getattr(request.state, "etag", None)
+    if etag and response.status_code == 200:
+        response.headers["ETag"] = etag
+    return response
 
 
 @app.get("/health")
@@ -56,14 +209,16 @@ def health() -> dict:
     }
 
 
-@app.get("/api/v1/cases", response_model=list[CaseRecord])
-def list_cases() -> list[CaseRecord]:
-    return store.list_cases()
+@app.get("/api/v1/cases", response_model=list[CaseRecord], dependencies=[Depends(global_etag)])
+def list_cases(
+    status: list[Status] | None = Query(default=None),
+    min_items: int = Query(default=0, ge=0),
+) -> RawJSONResponse:
+    return RawJSONResponse(store.list_cases_json(status, min_items))
 
 
-@app.post("/api/v1/cases", response_model=CaseRecord)
-def create_case(payload: CreateCaseRequest) -> CaseRecord:
-    case = CaseRecord(
+def _new_case(payload: CreateCaseRequest) -> CaseRecord:
+    return CaseRecord(
         id=f"case_{uuid4().hex[:10]}",
         title=payload.title,
         query=payload.query,
@@ -72,71 +227,242 @@ def create_case(payload: CreateCaseRequest) -> CaseRecord:
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
-    return store.create_case(case)
 
 
-@app.get("/api/v1/cases/{case_id}", response_model=CaseRecord)
-def get_case(case_id: str) -> CaseRecord:
+@app.post("/api/v1/cases", response_model=CaseRecord)
+def create_case(payload: CreateCaseRequest) -> CaseRecord:
+    return store.create_case(_new_case(payload))
+
+
+async def _run_batch(case_ids: list[str], operation: Callable[[str], Awaitable[CaseRecord]]) -> BatchResponse:
+    """Run ``operation`` for each distinct case, at most BATCH_CONCURRENCY at a time, reporting per-case outcomes."""
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run(case_id: str) -> BatchResult:
+        async with semaphore:
+            try:
+                store.get_case(case_id)
+            except KeyError:
+                return BatchResult(case_id=case_id, status_code=404, error="Case not found")
+            try:
+                return BatchResult(case_id=case_id, status_code=200, case=await operation(case_id))
+            except ValueError as exc:
+                return BatchResult(case_id=case_id, status_code=400, error=str(exc))
+            except Exception as exc:
+                return BatchResult(case_id=case_id, status_code=500, error=str(exc) or type(exc).__name__)
+
+    results = await asyncio.gather(*(run(case_id) for case_id in dict.fromkeys(case_ids)))
+    succeeded = sum(1 for result in results if result.status_code == 200)
+    return BatchResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+
+@app.post("/api/v1/cases:batchCreate", response_model=BatchResponse)
+def batch_create(payload: BatchCreateRequest) -> BatchResponse:
+    results: list[BatchResult] = []
+    for request in payload.cases:
+        case = _new_case(request)
+        try:
+            results.append(BatchResult(case_id=case.id, status_code=200, case=store.create_case(case)))
+        except Exception as exc:
+            results.append(BatchResult(case_id=case.id, status_code=500, error=str(exc) or type(exc).__name__))
+    succeeded = sum(1 for result in results if result.status_code == 200)
+    return BatchResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+
+@app.post("/api/v1/cases:batchCollect", response_model=BatchResponse)
+async def batch_collect(payload: BatchCaseRequest) -> BatchResponse:
+    return await _run_batch(payload.case_ids, collect_case)
+
+
+@app.post("/api/v1/cases:batchAnalyze", response_model=BatchResponse)
+async def batch_analyze(payload: BatchCaseRequest) -> BatchResponse:
+    return await _run_batch(payload.case_ids, lambda case_id: run_in_threadpool(analyze_case, case_id))
+
+
+@app.get("/api/v1/cases/{case_id}", response_model=CaseRecord, dependencies=[Depends(case_etag)])
+def get_case(case_id: str) -> RawJSONResponse:
     try:
-        return store.get_case(case_id)
+        return RawJSONResponse(store.get_case_json(case_id))
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
 
 
-@app.post("/api/v1/cases/{case_id}/collect", response_model=CaseRecord)
-def collect(case_id: str) -> CaseRecord:
+def _enqueue(kind: str, case_id: str) -> RawJSONResponse:
+    return RawJSONResponse(encode(job_manager.submit(kind, case_id)), status_code=202)
+
+
+@app.post("/api/v1/cases/{case_id}/collect", response_model=CaseRecord, responses={202: {"model": Job}})
+async def collect(case_id: str, background: bool = False) -> CaseRecord:
     try:
-        case = store.get_case(case_id)
+        store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    new_items = collect_case_items(case.id, case.query, case.platforms)
-    return store.append_items(case_id, new_items)
+    if background:
+        return _enqueue("collect", case_id)
+    return await collect_case(case_id)
 
 
-@app.post("/api/v1/cases/{case_id}/analyze", response_model=CaseRecord)
-def analyze(case_id: str) -> CaseRecord:
+@app.post("/api/v1/cases/{case_id}/analyze", response_model=CaseRecord, responses={202: {"model": Job}})
+def analyze(case_id: str, background: bool = False) -> CaseRecord:
     try:
-        case = store.get_case(case_id)
+        store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    case.status = Status.analyzing
-    items = store.get_items(case_id)
-    analysis = analyze_items(items)
-    case = store.save_analysis(case_id, analysis.score, analysis.severity, analysis)
-    alerts = build_alerts(case_id, analysis)
-    evidence = build_evidence(case_id, items)
-    media_results = verify_media(items)
-    report = build_case_report(case_id, analysis, items)
-    store.save_alerts(case_id, alerts)
-    store.save_evidence(case_id, evidence)
-    store.save_media_verification(case_id, media_results)
-    store.save_report(case_id, report)
-    return case
+    if background:
+        return _enqueue("analyze", case_id)
+    return analyze_case(case_id)
+
+
+BUNDLE_SECTIONS: dict[str, Callable[[str], bytes]] = {
+    "graph": lambda case_id: store.get_graph(case_id).to_json(),
+    "alerts": lambda case_id: join_array(encode(alert) for alert in store.get_alerts(case_id)),
+    "evidence": lambda case_id: join_array(encode(record) for record in store.get_evidence(case_id)),
+    "timeline": lambda case_id: join_array(encode(event) for event in store.get_timeline(case_id)),
+    "media_verification": lambda case_id: join_array(
+        encode(result) for result in store.get_media_verification(case_id)
+    ),
+    "report": lambda case_id: encode(report) if (report := store.get_report(case_id)) else b"null",
+}
+BUNDLE_SNAPSHOT_ATTEMPTS = 3
+
+
+def _bundle_parts(case_id: str, include: list[str], items_limit: int | None) -> list[bytes]:
+    parts = [b'"case":' + store.get_case_json(case_id)]
+    if "items" in include:
+        if items_limit is None:
+            parts.append(b'"items":' + store.get_items_json(case_id))
+        else:
+            page = store.page_items(case_id, None, items_limit)
+            parts.append(b'"items":' + join_array(encode(item) for item in page))
+            if len(page) == items_limit:
+                cursor = encode_cursor((page[-1].observed_at, page[-1].id))
+                parts.append(b'"items_cursor":"' + cursor.encode("ascii") + b'"')
+    for section, build in BUNDLE_SECTIONS.items():
+        if section in include:
+            parts.append(f'"{section}":'.encode("ascii") + build(case_id))
+    return parts
+
+
+@app.get("/api/v1/cases/{case_id}/bundle", response_model=CaseBundle, dependencies=[Depends(case_etag)])
+def case_bundle(
+    case_id: str,
+    request: Request,
+    include: str | None = Query(default=None, description="Comma-separated sections; all when omitted."),
+    items_limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+) -> RawJSONResponse:
+    """Case plus the requested sections, read at a single case version."""
+    sections = ["items", *BUNDLE_SECTIONS]
+    requested = sections if include is None else [name.strip() for name in include.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(sections))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown bundle sections: {', '.join(unknown)}")
+
+    try:
+        # Optimistic snapshot: rebuild if a write landed while the sections were being read.
+        for _ in range(BUNDLE_SNAPSHOT_ATTEMPTS):
+            version = store.get_version(case_id)
+            parts = _bundle_parts(case_id, requested, items_limit)
+            if store.get_version(case_id) == version:
+                break
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    request.state.etag = _case_etag_value(case_id, version)
+    parts.insert(1, f'"version":{version}'.encode("ascii"))
+    return RawJSONResponse(b"{" + b",".join(parts) + b"}")
 
 
-@app.get("/api/v1/cases/{case_id}/graph", response_model=CaseGraph)
-def graph(case_id: str) -> CaseGraph:
+@app.get("/api/v1/cases/{case_id}/graph", response_model=CaseGraph, dependencies=[Depends(case_etag)])
+def graph(case_id: str) -> Response:
     try:
         store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    graph_data = build_case_graph(store.get_items(case_id))
-    return CaseGraph(nodes=graph_data["nodes"], edges=graph_data["edges"])
+    return Response(content=store.get_graph(case_id).to_json(), media_type="application/json")
 
 
-@app.get("/api/v1/cases/{case_id}/items", response_model=list[ContentItem])
-def case_items(case_id: str) -> list[ContentItem]:
+@app.get(
+    "/api/v1/cases/{case_id}/graph/analytics",
+    response_model=GraphAnalytics,
+    dependencies=[Depends(case_etag)],
+)
+def graph_analytics(case_id: str) -> GraphAnalytics:
+    try:
+        store.get_case(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return analyze_graph(store.get_graph(case_id))
+
+
+@app.get("/api/v1/cases/{case_id}/graph/subgraph", response_model=Subgraph, dependencies=[Depends(case_etag)])
+def graph_subgraph(
+    case_id: str,
+    seeds: list[str] = Query(min_length=1),
+    hops: int = Query(default=1, ge=0, le=6),
+    node_types: list[str] = Query(default=[]),
+    edge_types: list[str] = Query(default=[]),
+    max_nodes: int = Query(default=500, ge=1, le=20000),
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> Subgraph:
+    try:
+        store.get_case(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+
+    graph_index = store.get_graph(case_id)
+    if not any(seed in graph_index.nodes for seed in seeds):
+        raise HTTPException(status_code=404, detail="Seed nodes not found")
+    return Subgraph(
+        **graph_index.subgraph(seeds, hops, set(node_types), set(edge_types), max_nodes, offset, limit)
+    )
+
+
+@app.get(
+    "/api/v1/cases/{case_id}/duplicates",
+    response_model=list[DuplicateCluster],
+    dependencies=[Depends(case_etag)],
+)
+def case_duplicates(case_id: str) -> list[DuplicateCluster]:
+    try:
+        store.get_case(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return [DuplicateCluster(**cluster) for cluster in store.get_accumulator(case_id).near_duplicates.clusters()]
+
+
+@app.get("/api/v1/cases/{case_id}/items", response_model=list[ContentItem], dependencies=[Depends(case_etag)])
+def case_items(
+    case_id: str,
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    format: str | None = Query(default=None, pattern="^(json|ndjson)$"),
+):
     try:
         store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
-    return store.get_items(case_id)
+    return _list_response(
+        request,
+        response,
+        lambda after, size: store.page_items(case_id, after, size),
+        lambda item: (item.observed_at, item.id),
+        lambda: RawJSONResponse(store.get_items_json(case_id)),
+        cursor,
+        limit,
+        format,
+    )
 
 
-@app.get("/api/v1/cases/{case_id}/alerts", response_model=list[AlertRecord])
+@app.get(
+    "/api/v1/cases/{case_id}/alerts",
+    response_model=list[AlertRecord],
+    dependencies=[Depends(case_etag)],
+)
 def case_alerts(case_id: str) -> list[AlertRecord]:
     try:
         store.get_case(case_id)
@@ -145,25 +471,109 @@ def case_alerts(case_id: str) -> list[AlertRecord]:
     return store.get_alerts(case_id)
 
 
-@app.get("/api/v1/cases/{case_id}/evidence", response_model=list[EvidenceRecord])
-def case_evidence(case_id: str) -> list[EvidenceRecord]:
+@app.get(
+    "/api/v1/cases/{case_id}/evidence",
+    response_model=list[EvidenceRecord],
+    dependencies=[Depends(case_etag)],
+)
+def case_evidence(
+    case_id: str,
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    format: str | None = Query(default=None, pattern="^(json|ndjson)$"),
+):
     try:
         store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
-    return store.get_evidence(case_id)
+    return _list_response(
+        request,
+        response,
+        lambda after, size: store.page_evidence(case_id, after, size),
+        lambda record: (record.captured_at, record.id),
+        lambda: store.get_evidence(case_id),
+        cursor,
+        limit,
+        format,
+    )
 
 
-@app.get("/api/v1/cases/{case_id}/timeline", response_model=list[TimelineEvent])
-def case_timeline(case_id: str) -> list[TimelineEvent]:
+@app.get(
+    "/api/v1/cases/{case_id}/evidence/root",
+    response_model=EvidenceRoot,
+    dependencies=[Depends(case_etag)],
+)
+def case_evidence_root(case_id: str) -> EvidenceRoot:
     try:
         store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
-    return store.get_timeline(case_id)
+    ledger = store.get_ledger(case_id)
+    return EvidenceRoot(case_id=case_id, root_hash=ledger.root(), leaf_count=len(ledger))
+
 
+@app.get(
+    "/api/v1/cases/{case_id}/evidence/{evidence_id}/proof",
+    response_model=EvidenceProof,
+    dependencies=[Depends(case_etag)],
+)
+def case_evidence_proof(case_id: str, evidence_id: str) -> EvidenceProof:
+    try:
+        store.get_case(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    ledger = store.get_ledger(case_id)
+    try:
+        leaf_index, path = ledger.proof(evidence_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Evidence not found")
+    return EvidenceProof(
+        case_id=case_id,
+        evidence_id=evidence_id,
+        leaf_index=leaf_index,
+        leaf_hash=leaf_hash(ledger.records[leaf_index]).hex(),
+        root_hash=ledger.root(),
+        leaf_count=len(ledger),
+        path=[ProofStep(hash=sibling, position=position) for sibling, position in path],
+    )
 
-@app.get("/api/v1/cases/{case_id}/media-verification", response_model=list[MediaVerificationResult])
+
+@app.get(
+    "/api/v1/cases/{case_id}/timeline",
+    response_model=list[TimelineEvent],
+    dependencies=[Depends(case_etag)],
+)
+def case_timeline(
+    case_id: str,
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    format: str | None = Query(default=None, pattern="^(json|ndjson)$"),
+):
+    try:
+        store.get_case(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return _list_response(
+        request,
+        response,
+        lambda after, size: store.page_timeline(case_id, after, size),
+        lambda event: (event.created_at, event.id),
+        lambda: store.get_timeline(case_id),
+        cursor,
+        limit,
+        format,
+    )
+
+
+@app.get(
+    "/api/v1/cases/{case_id}/media-verification",
+    response_model=list[MediaVerificationResult],
+    dependencies=[Depends(case_etag)],
+)
 def case_media_verification(case_id: str) -> list[MediaVerificationResult]:
     try:
         store.get_case(case_id)
@@ -172,7 +582,7 @@ def case_media_verification(case_id: str) -> list[MediaVerificationResult]:
     return store.get_media_verification(case_id)
 
 
-@app.get("/api/v1/cases/{case_id}/report", response_model=CaseReport)
+@app.get("/api/v1/cases/{case_id}/report", response_model=CaseReport, dependencies=[Depends(case_etag)])
 def case_report(case_id: str) -> CaseReport:
     try:
         store.get_case(case_id)
@@ -184,6 +594,69 @@ def case_report(case_id: str) -> CaseReport:
     return report
 
 
+@app.get("/api/v1/media/lookup", response_model=list[MediaMatch], dependencies=[Depends(global_etag)])
+def media_lookup(
+    media_hash: str = Query(min_length=1, max_length=16),
+    max_distance: int = Query(default=4, ge=0, le=16),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> list[MediaMatch]:
+    try:
+        matches = store.media_index.query(media_hash, max_distance)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="media_hash must be a 64-bit hex string")
+    return [
+        MediaMatch(case_id=case_id, item_id=item_id, media_hash=matched, distance=distance)
+        for case_id, item_id, matched, distance in matches[:limit]
+    ]
+
+
+def _changes_gone(oldest: int) -> HTTPException:
+    return HTTPException(
+        status_code=410,
+        detail={"message": "Cursor is older than the retained changes; resync from a fresh listing", "oldest": oldest},
+    )
+
+
+@app.get("/api/v1/changes", response_model=ChangePage)
+def changes(
+    since: int = Query(default=0, ge=0),
+    types: list[str] | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE),
+) -> ChangePage:
+    try:
+        page, cursor = store.get_changes(since, limit, types)
+    except ChangesExpired as exc:
+        raise _changes_gone(exc.oldest)
+    return ChangePage(changes=page, cursor=cursor)
+
+
+@app.get("/api/v1/changes/head", response_model=ChangeBounds)
+def change_bounds() -> ChangeBounds:
+    """``head`` is the newest seq, a cursor past every event so far; ``tail`` the oldest cursor still accepted."""
+    return ChangeBounds(head=store.get_change_head(), tail=store.get_change_tail())
+
+
+@app.get("/api/v1/changes/stream")
+async def change_stream(
+    request: Request,
+    since: int | None = Query(default=None, ge=0),
+    types: list[str] | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1),
+) -> StreamingResponse:
+    """Server-Sent Events from ``since`` (or ``Last-Event-ID``), defaulting to new events only."""
+    if since is None:
+        last_event_id = request.headers.get("last-event-id", "")
+        since = int(last_event_id) if last_event_id.isdigit() else await run_in_threadpool(store.get_change_head)
+    oldest = await run_in_threadpool(store.get_change_tail)
+    if since < oldest:
+        raise _changes_gone(oldest)
+    return StreamingResponse(
+        _sse_changes(since, types, limit),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/v1/connectors", response_model=list[ConnectorStatus])
 def connectors() -> list[ConnectorStatus]:
     return list_connector_health()
@@ -194,35 +667,103 @@ def source_catalog() -> list[SourceCatalogEntry]:
     return list_source_catalog()
 
 
-@app.get("/api/v1/metrics", response_model=GlobalMetrics)
+@app.get("/api/v1/metrics", response_model=GlobalMetrics, dependencies=[Depends(global_etag)])
 def global_metrics() -> GlobalMetrics:
     return store.get_global_metrics()
 
 
-@app.post("/api/v1/cases/{case_id}/run-all", response_model=CaseRecord)
-def run_all(case_id: str) -> CaseRecord:
+def _quantile(values: list[int], q: float) -> int:
+    return values[min(len(values) - 1, int(q * len(values)))] if values else 0
+
+
+def _runtime_gauges() -> Iterator[tuple[str, str, dict[str, str], float]]:
+    stats = store.get_store_stats()
+    per_case = sorted(stats["items_per_case"])
+    yield "nexus_store_cases", "Cases in the store.", {}, stats["cases"]
+    yield "nexus_store_items", "Content items across all cases.", {}, sum(per_case)
+    for q in ("0.5", "0.9", "0.99", "1"):
+        value = _quantile(per_case, float(q))
+        yield "nexus_store_items_per_case", "Items per case by quantile.", {"quantile": q}, value
+    yield "nexus_store_evidence_records", "Evidence records across all cases.", {}, stats["evidence"]
+    yield "nexus_store_timeline_events", "Timeline events across all cases.", {}, stats["timeline_events"]
+    if "spilled_cases" in stats:
+        yield "nexus_store_spilled_cases", "Cases whose bulky data is spilled to disk.", {}, stats["spilled_cases"]
+    yield (
+        "nexus_store_size_bytes",
+        "Estimated bytes of case data (memory backend) or database size (sql backend).",
+        {},
+        stats["size_bytes"],
+    )
+    jobs = Counter(job.status.value for job in job_manager.list())
+    for status in JobStatus:
+        yield "nexus_jobs", "Background jobs by status.", {"status": status.value}, jobs.get(status.value, 0)
     try:
-        case = store.get_case(case_id)
+        with open("/proc/self/statm") as statm:
+            resident = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        yield "process_resident_memory_bytes", "Resident memory size in bytes.", {}, resident
+    except (OSError, ValueError, IndexError):
+        pass
+    yield "nexus_profiler_running", "1 while the sampling profiler is collecting.", {}, int(profiler.running)
+
+
+@app.get("/api/v1/metrics/prometheus", response_class=PlainTextResponse)
+def prometheus_metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.render(_runtime_gauges()), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def _profiler_status() -> dict:
+    if not PROFILER_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiler is disabled")
+    return {
+        "running": profiler.running,
+        "interval_ms": profiler.interval * 1000,
+        "started_at": profiler.started_at,
+        "samples": sum(profiler.samples.values()),
+    }
+
+
+@app.post("/api/v1/profiler/start")
+def start_profiler(interval_ms: float = Query(default=5.0, ge=1.0, le=1000.0)) -> dict:
+    _profiler_status()
+    profiler.start(interval_ms / 1000)
+    return _profiler_status()
+
+
+@app.post("/api/v1/profiler/stop")
+def stop_profiler() -> dict:
+    _profiler_status()
+    profiler.stop()
+    return _profiler_status()
+
+
+@app.get("/api/v1/profiler", response_class=PlainTextResponse)
+def profiler_stacks() -> PlainTextResponse:
+    """Collapsed stacks (``frame;frame count``) for flamegraph.pl or speedscope."""
+    _profiler_status()
+    return PlainTextResponse(profiler.collapsed())
+
+
+@app.post("/api/v1/cases/{case_id}/run-all", response_model=CaseRecord, responses={202: {"model": Job}})
+async def run_all(case_id: str, background: bool = False) -> CaseRecord:
+    try:
+        store.get_case(case_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    new_items = collect_case_items(case.id, case.query, case.platforms)
-    case = store.append_items(case_id, new_items)
-    analysis = analyze_items(store.get_items(case_id))
-    case = store.save_analysis(case_id, analysis.score, analysis.severity, analysis)
-    alerts = build_alerts(case_id, analysis)
-    evidence = build_evidence(case_id, store.get_items(case_id))
-    media_results = verify_media(store.get_items(case_id))
-    report = build_case_report(case_id, analysis, store.get_items(case_id))
-    store.save_alerts(case_id, alerts)
-    store.save_evidence(case_id, evidence)
-    store.save_media_verification(case_id, media_results)
-    store.save_report(case_id, report)
-    return case
+    if background:
+        return _enqueue("run-all", case_id)
+    await collect_case(case_id)
+    return await run_in_threadpool(analyze_case, case_id)
 
 
-@app.post("/api/v1/cases/{case_id}/generate-products", response_model=CaseRecord)
-def generate_products(case_id: str) -> CaseRecord:
+@app.post(
+    "/api/v1/cases/{case_id}/generate-products",
+    response_model=CaseRecord,
+    responses={202: {"model": Job}},
+)
+def generate_products(case_id: str, background: bool = False) -> CaseRecord:
     try:
         case = store.get_case(case_id)
     except KeyError:
@@ -231,13 +772,23 @@ def generate_products(case_id: str) -> CaseRecord:
     if not case.analysis:
         raise HTTPException(status_code=400, detail="Analyze the case first")
 
-    alerts = build_alerts(case_id, case.analysis)
-    evidence = build_evidence(case_id, store.get_items(case_id))
-    media_results = verify_media(store.get_items(case_id))
-    report = build_case_report(case_id, case.analysis, store.get_items(case_id))
-    store.save_alerts(case_id, alerts)
-    store.save_evidence(case_id, evidence)
-    store.save_media_verification(case_id, media_results)
-    store.save_report(case_id, report)
-    case.updated_at = datetime.now(timezone.utc)
-    return case
+    if background:
+        return _enqueue("generate-products", case_id)
+    return generate_case_products(case_id)
+
+
+@app.get("/api/v1/cases/{case_id}/jobs", response_model=list[Job])
+def case_jobs(case_id: str) -> list[Job]:
+    try:
+        store.get_case(case_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return job_manager.list(case_id)
+
+
+@app.get("/api/v1/jobs/{job_id}", response_model=Job)
+def get_job(job_id: str) -> Job:
+    try:
+        return job_manager.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
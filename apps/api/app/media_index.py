@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Dict, Iterator, List, Set, Tuple
+
+
+HASH_BITS = 64
+CHUNKS = 4
+CHUNK_BITS = HASH_BITS // CHUNKS
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+def parse_hash(value: str) -> int:
+    parsed = int(value, 16)
+    if parsed >> HASH_BITS:
+        raise ValueError("media hash must fit in 64 bits")
+    return parsed
+
+
+def _chunks(value: int) -> List[int]:
+    return [(value >> (i * CHUNK_BITS)) & CHUNK_MASK for i in range(CHUNKS)]
+
+
+def _probes(chunk: int, radius: int) -> Iterator[int]:
+    yield chunk
+    for flips in range(1, radius + 1):
+        for bits in combinations(range(CHUNK_BITS), flips):
+            probe = chunk
+            for bit in bits:
+                probe ^= 1 << bit
+            yield probe
+
+
+class MediaHashIndex:
+    """Multi-index hashing over 64-bit perceptual media hashes.
+
+    The hash is split into four 16-bit chunks with one table each. By the
+    pigeonhole principle, any hash within Hamming distance k agrees with the
+    query to within k // 4 bits on at least one chunk. Only those buckets are
+    probed, so lookups never scan the whole corpus.
+
+    ``refs`` lists every (case_id, item_id, media_hash) in the order it was
+    added and is only ever appended to, so a prefix of it is the index as of
+    an earlier moment.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[int, Set[Tuple[str, str]]] = {}
+        self._tables: List[Dict[int, Set[int]]] = [{} for _ in range(CHUNKS)]
+        self.refs: List[Tuple[str, str, str]] = []
+
+    @classmethod
+    def from_refs(cls, refs: List[Tuple[str, str, str]]) -> "MediaHashIndex":
+        index = cls()
+        for ref in refs:
+            index.add(*ref)
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(refs) for refs in self.entries.values())
+
+    def add(self, case_id: str, item_id: str, media_hash: str) -> None:
+        value = parse_hash(media_hash)
+        refs = self.entries.get(value)
+        if refs is None:
+            refs = self.entries[value] = set()
+            for table, chunk in zip(self._tables, _chunks(value)):
+                table.setdefault(chunk, set()).add(value)
+        if (case_id, item_id) not in refs:
+            refs.add((case_id, item_id))
+            self.refs.append((case_id, item_id, media_hash))
+
+    def query(self, media_hash: str, max_distance: int = 4) -> List[Tuple[str, str, str, int]]:
+        """Return (case_id, item_id, media_hash, distance) for hashes within ``max_distance``."""
+        value = parse_hash(media_hash)
+        radius = max_distance // CHUNKS
+        candidates: Set[int] = set()
+        for table, chunk in zip(self._tables, _chunks(value)):
+            for probe in _probes(chunk, radius):
+                candidates.update(table.get(probe, ()))
+        matches: List[Tuple[str, str, str, int]] = []
+        for candidate in candidates:
+            distance = (candidate ^ value).bit_count()
+            if distance <= max_distance:
+                for case_id, item_id in self.entries[candidate]:
+                    matches.append((case_id, item_id, f"{candidate:016x}", distance))
+        matches.sort(key=lambda match: (match[3], match[0], match[1]))
+        return matches
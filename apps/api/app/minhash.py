@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Dict, List, Set
+
+import numpy as np
+
+from .lexicon import normalize
+
+
+_MERSENNE = np.uint64((1 << 31) - 1)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class DuplicateGroup:
+    __slots__ = ("members", "authors", "platforms")
+
+    def __init__(self) -> None:
+        self.members: List[int] = []
+        self.authors: Set[str] = set()
+        self.platforms: Set[str] = set()
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH banding for near-duplicate item texts.
+
+    Signatures are computed once when an item is added. Candidates come from
+    shared band buckets only, and matches are merged with union-find, so
+    ingest stays sub-quadratic and the aggregate counters read in O(1).
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        threshold: float = 0.8,
+        max_candidates: int = 8,
+        seed: int = 1729,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE), size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, int(_MERSENNE), size=num_perm, dtype=np.uint64)[:, None]
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+
+        self._ids: List[str] = []
+        self._authors: List[str] = []
+        self._platforms: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._signatures: List[np.ndarray] = []
+        self._parent: List[int] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._groups: Dict[int, DuplicateGroup] = {}
+
+        self.duplicated_items = 0
+        self.largest = 0
+        self.max_author_spread = 0
+        self.max_platform_spread = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def signature(self, text: str) -> np.ndarray:
+        text = _WHITESPACE.sub(" ", normalize(text)).strip()
+        size = self.shingle_size
+        shingles = {text[i : i + size] for i in range(max(1, len(text) - size + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        return ((self._a * hashes + self._b) % _MERSENNE).min(axis=1).astype(np.uint32)
+
+    def add(self, item_id: str, text: str, author: str, platform: str) -> None:
+        if item_id in self._positions:
+            return
+        position = len(self._ids)
+        signature = self.signature(text)
+        self._ids.append(item_id)
+        self._authors.append(author)
+        self._platforms.append(platform)
+        self._positions[item_id] = position
+        self._signatures.append(signature)
+        self._parent.append(position)
+
+        for band, buckets in enumerate(self._buckets):
+            key = signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            bucket = buckets.setdefault(key, [])
+            for candidate in bucket[: self.max_candidates]:
+                if self._find(candidate) == self._find(position):
+                    continue
+                if self.similarity(candidate, position) >= self.threshold:
+                    self._union(candidate, position)
+            bucket.append(position)
+
+    def similarity(self, left: int, right: int) -> float:
+        return float(np.count_nonzero(self._signatures[left] == self._signatures[right])) / self.num_perm
+
+    def _find(self, position: int) -> int:
+        parent = self._parent
+        root = position
+        while parent[root] != root:
+            root = parent[root]
+        while parent[position] != root:
+            parent[position], position = root, parent[position]
+        return root
+
+    def _group(self, root: int) -> DuplicateGroup:
+        group = self._groups.get(root)
+        if group is None:
+            group = DuplicateGroup()
+            group.members.append(root)
+            group.authors.add(self._authors[root])
+            group.platforms.add(self._platforms[root])
+        return group
+
+    def _union(self, left: int, right: int) -> None:
+        left, right = self._find(left), self._find(right)
+        if left == right:
+            return
+        big, small = self._group(left), self._group(right)
+        if len(big.members) < len(small.members):
+            big, small = small, big
+            left, right = right, left
+        self.duplicated_items -= sum(len(g.members) for g in (big, small) if len(g.members) > 1)
+        big.members.extend(small.members)
+        big.authors |= small.authors
+        big.platforms |= small.platforms
+        self._parent[right] = left
+        self._groups.pop(right, None)
+        self._groups[left] = big
+        self.duplicated_items += len(big.members)
+        self.largest = max(self.largest, len(big.members))
+        self.max_author_spread = max(self.max_author_spread, len(big.authors))
+        self.max_platform_spread = max(self.max_platform_spread, len(big.platforms))
+
+    def clusters(self) -> List[Dict[str, object]]:
+        groups = sorted(self._groups.values(), key=lambda g: len(g.members), reverse=True)
+        return [
+            {
+                "item_ids": [self._ids[position] for position in group.members],
+                "size": len(group.members),
+                "authors": sorted(group.authors),
+                "platforms": sorted(group.platforms),
+            }
+            for group in groups
+        ]
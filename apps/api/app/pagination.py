@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import base64
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+
+SortKey = Tuple[datetime, str]
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def micros(moment: datetime) -> int:
+    """Microseconds since the epoch, the unit timestamps are sorted in; naive times are UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def encode_cursor(key: SortKey) -> str:
+    raw = f"{key[0].isoformat()}|{key[1]}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        stamp, record_id = raw.split("|", 1)
+        return datetime.fromisoformat(stamp), record_id
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+class _TieIds:
+    """The ids of a run of sorted rows, read one at a time so bisecting gathers only O(log n) of them."""
+
+    def __init__(self, rows: np.ndarray, ids: Callable[[np.ndarray], List[str]]) -> None:
+        self.rows = rows
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index: int) -> str:
+        return self.ids(self.rows[index : index + 1])[0]
+
+
+class KeysetOrder:
+    """Row numbers of an append-only collection sorted by (timestamp, id).
+
+    Only the sorted row numbers and their timestamps are held, as two int64
+    arrays; ids are read back from the collection to break timestamp ties.
+    New rows are merged in lazily on the next read, so keyset pages cost
+    O(log n + limit) instead of a full sort per request.
+    """
+
+    def __init__(self) -> None:
+        # Swapped as one tuple so lock-free readers never pair rows with another version's stamps.
+        self.order: Tuple[np.ndarray, np.ndarray] = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.order[0])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.order)
+
+    def sync(
+        self,
+        count: int,
+        stamps: Callable[[np.ndarray], np.ndarray],
+        ids: Callable[[np.ndarray], List[str]],
+    ) -> None:
+        """Merge rows ``len(self)`` to ``count``; ``stamps`` and ``ids`` read the keys of the given rows."""
+        if len(self) >= count:
+            return
+        with self._lock:
+            rows, sorted_stamps = self.order
+            if len(rows) >= count:
+                return
+            new = np.arange(len(rows), count, dtype=np.int64)
+            new_stamps = np.asarray(stamps(new), dtype=np.int64)
+            new_ids = ids(new)
+            by_key = np.lexsort((np.array(new_ids), new_stamps))
+            new, new_stamps = new[by_key], new_stamps[by_key]
+            positions = np.searchsorted(sorted_stamps, new_stamps, "left")
+            ends = np.searchsorted(sorted_stamps, new_stamps, "right")
+            for index in np.flatnonzero(ends > positions).tolist():
+                # Same microsecond as rows already merged: place by id within that run.
+                start = int(positions[index])
+                tied = _TieIds(rows[start : int(ends[index])], ids)
+                positions[index] = start + bisect_right(tied, new_ids[int(by_key[index])])
+            self.order = (np.insert(rows, positions, new), np.insert(sorted_stamps, positions, new_stamps))
+
+    def page(self, after: SortKey | None, limit: int, ids: Callable[[np.ndarray], List[str]]) -> np.ndarray:
+        """Row numbers of the ``limit`` records after the ``after`` key."""
+        rows, stamps = self.order
+        start = 0
+        if after is not None:
+            stamp = micros(after[0])
+            start = int(np.searchsorted(stamps, stamp, "left"))
+            end = int(np.searchsorted(stamps, stamp, "right"))
+            start += bisect_right(_TieIds(rows[start:end], ids), after[1])
+        return rows[start : start + limit]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import pickle
+import re
+import shutil
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, Tuple
+
+
+# Each log record is framed as (payload length, CRC-32 of payload) followed by the pickled payload.
+FRAME = struct.Struct("<II")
+SNAPSHOT_STATE = "store.pickle"
+_SNAPSHOT_NAME = re.compile(r"snapshot-(\d+)")
+_GENERATION_NAME = re.compile(r"(?:snapshot|log)-(\d+)(?:\.tmp)?")
+
+
+class MutationLog:
+    """Append-only file of framed, checksummed store mutations.
+
+    Records are flushed to the OS on every append, which survives a process
+    crash; pass ``fsync`` to also survive a host crash at the cost of one
+    disk sync per mutation.
+    """
+
+    def __init__(self, path: Path, fsync: bool = False) -> None:
+        self.path = path
+        self.fsync = fsync
+        created = not path.exists()
+        self._file = open(path, "ab")
+        self.size = self._file.tell()
+        if created:
+            sync_directory(path.parent)
+
+    def append(self, op: str, *args: Any) -> None:
+        payload = pickle.dumps((op, args), protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.size += FRAME.size + len(payload)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+
+def read_log(path: Path) -> Iterator[Tuple[str, tuple]]:
+    """Yield ``(op, args)`` records in order, stopping at a torn or corrupt tail."""
+    with open(path, "rb") as handle:
+        while True:
+            header = handle.read(FRAME.size)
+            if len(header) < FRAME.size:
+                return
+            length, checksum = FRAME.unpack(header)
+            payload = handle.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            yield pickle.loads(payload)
+
+
+def generation(path: Path) -> int | None:
+    """The number in a ``snapshot-N``, ``snapshot-N.tmp`` or ``log-N`` name; None for anything else."""
+    match = _GENERATION_NAME.fullmatch(path.name)
+    return int(match.group(1)) if match else None
+
+
+def latest_snapshot(data_dir: Path) -> Tuple[int, Path] | None:
+    """The newest complete snapshot; incomplete ones are still named ``*.tmp``."""
+    found = [
+        (int(match.group(1)), path)
+        for path in data_dir.iterdir()
+        if (match := _SNAPSHOT_NAME.fullmatch(path.name)) and (path / SNAPSHOT_STATE).exists()
+    ]
+    return max(found) if found else None
+
+
+def link_tree(source: Path, target: Path) -> None:
+    """Hard-link every file under ``source`` into ``target``, copying where links are unsupported."""
+    for path in source.rglob("*"):
+        if path.is_dir():
+            continue
+        destination = target / path.relative_to(source)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, destination)
+        except OSError:
+            shutil.copy2(path, destination)
+
+
+def dump_state(state: dict) -> bytes:
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_state(directory: Path, payload: bytes) -> None:
+    (directory / SNAPSHOT_STATE).write_bytes(payload)
+
+
+def read_state(directory: Path) -> dict:
+    with open(directory / SNAPSHOT_STATE, "rb") as handle:
+        return pickle.load(handle)
+
+
+def sync_directory(path: Path) -> None:
+    """Make renames, creations and deletions inside ``path`` durable."""
+    if os.name == "nt":
+        # Directories cannot be opened for fsync on Windows; NTFS journals its metadata.
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def sync_tree(directory: Path) -> None:
+    """fsync every file under ``directory``, then every directory, deepest first."""
+    directories = [directory]
+    for path in directory.rglob("*"):
+        if path.is_dir():
+            directories.append(path)
+            continue
+        with open(path, "rb") as handle:
+            os.fsync(handle.fileno())
+    for path in sorted(directories, key=lambda path: len(path.parts), reverse=True):
+        sync_directory(path)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List
+
+from fastapi.concurrency import run_in_threadpool
+
+from .analysis import analyze_accumulator
+from .connectors import collect_case_items_async
+from .graph_analytics import analyze_graph
+from .intelligence import build_alerts, build_case_report, verify_media
+from .schemas import AnalysisResult, CaseRecord
+from .storage import store
+
+
+Stage = Callable[[str], ContextManager[None]]
+
+PIPELINE_STAGES: Dict[str, List[str]] = {
+    "collect": ["collect"],
+    "analyze": ["analyze", "alerts", "media", "report"],
+    "run-all": ["collect", "analyze", "alerts", "media", "report"],
+    "generate-products": ["alerts", "media", "report"],
+}
+
+
+def _untimed(name: str) -> ContextManager[None]:
+    return nullcontext()
+
+
+async def collect_case(case_id: str, stage: Stage = _untimed) -> CaseRecord:
+    case = store.get_case(case_id)
+    with stage("collect"):
+        new_items, errors = await collect_case_items_async(case.id, case.query, case.platforms)
+        # Ingest (dedup, lexicon, MinHash, or a SQL write) blocks; keep it off the event loop.
+        return await run_in_threadpool(
+            store.append_items, case_id, new_items, {"connector_errors": errors} if errors else None
+        )
+
+
+def build_products(case_id: str, analysis: AnalysisResult, stage: Stage = _untimed) -> None:
+    items = store.get_items(case_id)
+    with stage("alerts"):
+        store.save_alerts(case_id, build_alerts(case_id, analysis))
+    with stage("media"):
+        flagged = store.get_accumulator(case_id).suspicious_captions
+        store.save_media_verification(case_id, verify_media(items, store.media_index, suspicious_captions=flagged))
+    with stage("report"):
+        graph = analyze_graph(store.get_graph(case_id))
+        store.save_report(case_id, build_case_report(case_id, analysis, items, graph))
+
+
+def analyze_case(case_id: str, stage: Stage = _untimed) -> CaseRecord:
+    store.start_analysis(case_id)
+    with stage("analyze"):
+        analysis = analyze_accumulator(store.get_accumulator(case_id))
+        case = store.save_analysis(case_id, analysis.score, analysis.severity, analysis)
+    build_products(case_id, analysis, stage)
+    return case
+
+
+def generate_case_products(case_id: str, stage: Stage = _untimed) -> CaseRecord:
+    case = store.get_case(case_id)
+    if not case.analysis:
+        raise ValueError("Analyze the case first")
+    build_products(case_id, case.analysis, stage)
+    return store.touch(case_id)
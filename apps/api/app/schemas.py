@@ -29,6 +29,13 @@ class Status(str, Enum):
     ready = "ready"
 
 
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
 class AlertStatus(str, Enum):
     open = "open"
     triaged = "triaged"
@@ -53,6 +60,14 @@ class CreateCaseRequest(BaseModel):
     ])
 
 
+class BatchCreateRequest(BaseModel):
+    cases: List[CreateCaseRequest] = Field(min_length=1, max_length=500)
+
+
+class BatchCaseRequest(BaseModel):
+    case_ids: List[str] = Field(min_length=1, max_length=500)
+
+
 class ContentItem(BaseModel):
     id: str
     case_id: str
@@ -103,9 +118,57 @@ class CaseRecord(BaseModel):
     analysis: Optional[AnalysisResult] = None
 
 
+class GraphEdge(BaseModel):
+    source: str
+    target: str
+    type: str
+    weight: int = 1
+    first_seen: datetime
+    last_seen: datetime
+
+
 class CaseGraph(BaseModel):
     nodes: List[Dict[str, str]]
-    edges: List[Dict[str, str]]
+    edges: List[GraphEdge]
+
+
+class Subgraph(BaseModel):
+    nodes: List[Dict[str, str]]
+    edges: List[GraphEdge]
+    total_nodes: int
+    next_offset: Optional[int] = None
+    truncated: bool = False
+
+
+class NodeScore(BaseModel):
+    id: str
+    label: str
+    type: str
+    score: float
+
+
+class BridgeAccount(BaseModel):
+    id: str
+    label: str
+    platforms: int
+    score: float
+
+
+class GraphAnalytics(BaseModel):
+    node_count: int
+    edge_count: int
+    component_count: int
+    largest_component: int
+    top_central: List[NodeScore] = Field(default_factory=list)
+    top_degree: List[NodeScore] = Field(default_factory=list)
+    bridge_accounts: List[BridgeAccount] = Field(default_factory=list)
+
+
+class DuplicateCluster(BaseModel):
+    item_ids: List[str]
+    size: int
+    authors: List[str]
+    platforms: List[Platform]
 
 
 class AlertRecord(BaseModel):
@@ -130,6 +193,27 @@ class EvidenceRecord(BaseModel):
     captured_at: datetime
 
 
+class EvidenceRoot(BaseModel):
+    case_id: str
+    root_hash: str
+    leaf_count: int
+
+
+class ProofStep(BaseModel):
+    hash: str
+    position: str
+
+
+class EvidenceProof(BaseModel):
+    case_id: str
+    evidence_id: str
+    leaf_index: int
+    leaf_hash: str
+    root_hash: str
+    leaf_count: int
+    path: List[ProofStep]
+
+
 class TimelineEvent(BaseModel):
     id: str
     case_id: str
@@ -139,6 +223,20 @@ class TimelineEvent(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class ChangeEvent(TimelineEvent):
+    seq: int
+
+
+class ChangePage(BaseModel):
+    changes: List[ChangeEvent]
+    cursor: int
+
+
+class ChangeBounds(BaseModel):
+    head: int
+    tail: int
+
+
 class ConnectorStatus(BaseModel):
     connector: str
     domain: str
@@ -166,6 +264,13 @@ class MediaVerificationResult(BaseModel):
     explanation: str
 
 
+class MediaMatch(BaseModel):
+    case_id: str
+    item_id: str
+    media_hash: str
+    distance: int
+
+
 class CaseReport(BaseModel):
     case_id: str
     headline: str
@@ -175,6 +280,52 @@ class CaseReport(BaseModel):
     generated_at: datetime
 
 
+class JobStage(BaseModel):
+    name: str
+    started_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+
+
+class Job(BaseModel):
+    id: str
+    case_id: str
+    kind: str
+    status: JobStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: float = 0.0
+    stages: List[JobStage] = Field(default_factory=list)
+    error: Optional[str] = None
+    result: Optional[CaseRecord] = None
+
+
+class CaseBundle(BaseModel):
+    case: CaseRecord
+    version: int
+    items: Optional[List[ContentItem]] = None
+    items_cursor: Optional[str] = None
+    graph: Optional[CaseGraph] = None
+    alerts: Optional[List[AlertRecord]] = None
+    evidence: Optional[List[EvidenceRecord]] = None
+    timeline: Optional[List[TimelineEvent]] = None
+    media_verification: Optional[List[MediaVerificationResult]] = None
+    report: Optional[CaseReport] = None
+
+
+class BatchResult(BaseModel):
+    case_id: Optional[str] = None
+    status_code: int
+    case: Optional[CaseRecord] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BatchResult]
+
+
 class GlobalMetrics(BaseModel):
     total_cases: int
     open_alerts: int
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pickle
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List
+
+import numpy as np
+
+from .analysis import CaseAccumulator
+from .dedup import IngestIndex
+from .graph import CaseGraphIndex
+from .item_table import ItemTable, write_columns
+from .ledger import EvidenceLedger
+from .schemas import MediaVerificationResult
+
+
+STATE_FILE = "state.pickle"
+
+
+@dataclass
+class CaseBulk:
+    """The per-case structures that grow with item count, as one unit to spill or restore."""
+
+    items: ItemTable
+    evidence: EvidenceLedger
+    media_verifications: List[MediaVerificationResult]
+    accumulator: CaseAccumulator
+    ingest_index: IngestIndex
+    graph: CaseGraphIndex
+
+
+@dataclass
+class SpilledCase:
+    """Where a cold case's bulk lives on disk, plus the counts reported without loading it."""
+
+    path: Path
+    evidence: int = 0
+    # True while the files match the case's data in memory, so evicting it again needs no write.
+    clean: bool = False
+
+
+@dataclass
+class CapturedBulk:
+    """A case's bulk serialized in memory, ready to be written without holding the store's lock."""
+
+    columns: Dict[str, np.ndarray]
+    manifest: dict
+    state: bytes
+
+
+def capture_bulk(bulk: CaseBulk) -> CapturedBulk:
+    columns, manifest = bulk.items.capture()
+    state = {
+        "evidence": bulk.evidence,
+        "media_verifications": bulk.media_verifications,
+        "accumulator": bulk.accumulator,
+        "ingest_index": bulk.ingest_index,
+        "graph": bulk.graph,
+    }
+    return CapturedBulk(columns, manifest, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class PendingCapture:
+    """A case's bulk as a snapshot found it, serialized by whichever gets there first: the snapshot or a write.
+
+    The bulk is updated in place, so a write to a case the snapshot has not
+    serialized yet has to capture it before changing anything.
+    """
+
+    def __init__(self, bulk: CaseBulk) -> None:
+        self.bulk: CaseBulk | None = bulk
+        self.captured: CapturedBulk | None = None
+        self._lock = Lock()
+
+    @property
+    def done(self) -> bool:
+        return self.captured is not None
+
+    def capture(self) -> CapturedBulk:
+        with self._lock:
+            if self.captured is None:
+                self.captured = capture_bulk(self.bulk)
+                self.bulk = None
+            return self.captured
+
+
+def write_captured(directory: Path, captured: CapturedBulk) -> None:
+    """Items go out as memory-mappable columns; the rest as a single pickle."""
+    write_columns(directory / "items", captured.columns, captured.manifest)
+    (directory / STATE_FILE).write_bytes(captured.state)
+
+
+def write_bulk(directory: Path, bulk: CaseBulk) -> None:
+    write_captured(directory, capture_bulk(bulk))
+
+
+def read_bulk(directory: Path) -> CaseBulk:
+    items = ItemTable.load(directory / "items")
+    with open(directory / STATE_FILE, "rb") as handle:
+        state = pickle.load(handle)
+    accumulator: CaseAccumulator = state["accumulator"]
+    accumulator.table = items
+    return CaseBulk(
+        items=items,
+        evidence=state["evidence"],
+        media_verifications=state["media_verifications"],
+        accumulator=accumulator,
+        ingest_index=state["ingest_index"],
+        graph=state["graph"],
+    )
+
+
+def discard(directory: Path) -> None:
+    # Mapped files stay readable after unlinking on POSIX; elsewhere a still-open map keeps them around.
+    shutil.rmtree(directory, ignore_errors=True)
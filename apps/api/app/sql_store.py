@@ -0,0 +1,1037 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from queue import Empty, LifoQueue
+from threading import Lock
+from typing import Any, Callable, Collection, Dict, Iterator, List, Sequence, Tuple
+from uuid import uuid4
+
+from .analysis import CaseAccumulator
+from .changes import ChangeNotifier
+from .dedup import content_fingerprint
+from .encoding import encode, join_array
+from .graph import CaseGraphIndex
+from .intelligence import build_evidence
+from .ledger import EvidenceLedger
+from .media_index import MediaHashIndex
+from .pagination import SortKey
+from .schemas import (
+    AlertRecord,
+    AnalysisResult,
+    CaseRecord,
+    CaseReport,
+    ChangeEvent,
+    ContentItem,
+    EvidenceRecord,
+    GlobalMetrics,
+    MediaVerificationResult,
+    Platform,
+    Severity,
+    Status,
+    TimelineEvent,
+)
+
+
+# SQLite mirror of supabase/migrations/0001_init.sql through 0008_evidence_case_order.sql
+# (timeline_events.seq and content_items.seq are the implicit rowid).
+# Postgres deployments are expected to have the migrations applied already.
+SQLITE_SCHEMA = """
+create table if not exists cases (
+  id text primary key,
+  title text not null,
+  query text not null,
+  status text not null default 'draft',
+  risk_score real not null default 0,
+  severity text not null default 'R1',
+  item_count integer not null default 0,
+  analysis text,
+  version integer not null default 0,
+  created_at text not null,
+  updated_at text not null
+);
+
+create table if not exists case_platforms (
+  case_id text not null references cases(id) on delete cascade,
+  platform text not null,
+  primary key (case_id, platform)
+);
+
+create table if not exists content_items (
+  id text primary key,
+  case_id text not null references cases(id) on delete cascade,
+  platform text not null,
+  author text not null,
+  text_content text not null,
+  source_url text,
+  observed_at text not null,
+  language text,
+  engagement integer not null default 0,
+  source_name text not null default '',
+  media_hash text,
+  narrative_key text,
+  entities text not null default '[]',
+  fingerprint text,
+  created_at text not null default current_timestamp
+);
+
+create index if not exists content_items_case_idx on content_items (case_id, observed_at);
+-- Entries are ordered by (case_id, rowid), so rows past a seq are found without a scan.
+create index if not exists content_items_case_seq_idx on content_items (case_id);
+
+create table if not exists risk_scores (
+  id integer primary key autoincrement,
+  case_id text not null references cases(id) on delete cascade,
+  harm real not null default 0,
+  velocity real not null default 0,
+  reach real not null default 0,
+  coordination real not null default 0,
+  credibility_gap real not null default 0,
+  cross_platform real not null default 0,
+  total_score real not null default 0,
+  severity text not null default 'R1',
+  created_at text not null default current_timestamp
+);
+
+create table if not exists evidence (
+  id integer primary key autoincrement,
+  record_id text unique,
+  case_id text not null references cases(id) on delete cascade,
+  item_id text references content_items(id) on delete set null,
+  evidence_hash text not null,
+  source_name text not null,
+  source_url text,
+  note text not null default '',
+  observed_at text not null,
+  captured_at text not null,
+  metadata text not null default '{}',
+  created_at text not null default current_timestamp
+);
+
+create index if not exists evidence_case_idx on evidence (case_id);
+
+create table if not exists alerts (
+  id text primary key,
+  case_id text not null references cases(id) on delete cascade,
+  severity text not null,
+  status text not null default 'open',
+  title text not null,
+  summary text not null,
+  recommended_action text not null,
+  created_at text not null
+);
+
+create table if not exists timeline_events (
+  id text primary key,
+  case_id text not null references cases(id) on delete cascade,
+  event_type text not null,
+  summary text not null,
+  metadata text not null default '{}',
+  created_at text not null
+);
+
+create index if not exists timeline_events_case_idx on timeline_events (case_id, created_at);
+
+create table if not exists media_verifications (
+  case_id text not null references cases(id) on delete cascade,
+  item_id text not null,
+  verdict text not null,
+  confidence real not null default 0,
+  checks text not null default '{}',
+  explanation text not null,
+  primary key (case_id, item_id)
+);
+
+create table if not exists case_reports (
+  case_id text primary key references cases(id) on delete cascade,
+  payload text not null,
+  generated_at text not null
+);
+
+create table if not exists store_meta (
+  key text primary key,
+  value text not null
+);
+"""
+
+CASE_COLUMNS = (
+    "id",
+    "title",
+    "query",
+    "status",
+    "risk_score",
+    "severity",
+    "item_count",
+    "analysis",
+    "created_at",
+    "updated_at",
+)
+ITEM_COLUMNS = (
+    "id",
+    "case_id",
+    "platform",
+    "author",
+    "text_content",
+    "source_url",
+    "observed_at",
+    "language",
+    "engagement",
+    "source_name",
+    "media_hash",
+    "narrative_key",
+    "entities",
+)
+ALERT_COLUMNS = (
+    "id",
+    "case_id",
+    "severity",
+    "status",
+    "title",
+    "summary",
+    "recommended_action",
+    "created_at",
+)
+EVIDENCE_COLUMNS = (
+    "record_id",
+    "case_id",
+    "item_id",
+    "evidence_hash",
+    "source_name",
+    "source_url",
+    "note",
+    "captured_at",
+)
+MEDIA_COLUMNS = ("case_id", "item_id", "verdict", "confidence", "checks", "explanation")
+TIMELINE_COLUMNS = ("id", "case_id", "event_type", "summary", "metadata", "created_at")
+PLATFORM_ORDER = {platform: index for index, platform in enumerate(Platform)}
+
+
+def _ts(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _dump(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _load(value: Any) -> Any:
+    # sqlite hands back TEXT, psycopg already decodes jsonb.
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _item_from_row(row: Sequence[Any]) -> ContentItem:
+    data = dict(zip(ITEM_COLUMNS, row))
+    return ContentItem(
+        id=data["id"],
+        case_id=data["case_id"],
+        platform=data["platform"],
+        author=data["author"],
+        text=data["text_content"],
+        url=data["source_url"] or "",
+        observed_at=data["observed_at"],
+        language=data["language"] or "",
+        engagement=data["engagement"],
+        source_name=data["source_name"],
+        media_hash=data["media_hash"],
+        narrative_key=data["narrative_key"],
+        entities=_load(data["entities"]) or [],
+    )
+
+
+def _evidence_from_row(row: Sequence[Any]) -> EvidenceRecord:
+    data = dict(zip(EVIDENCE_COLUMNS, row))
+    return EvidenceRecord(
+        id=data["record_id"],
+        case_id=data["case_id"],
+        item_id=data["item_id"] or "",
+        source_name=data["source_name"],
+        source_url=data["source_url"] or "",
+        evidence_hash=data["evidence_hash"],
+        note=data["note"],
+        captured_at=data["captured_at"],
+    )
+
+
+def _event_from_row(row: Sequence[Any]) -> TimelineEvent:
+    data = dict(zip(TIMELINE_COLUMNS, row))
+    data["metadata"] = _load(data["metadata"]) or {}
+    return TimelineEvent(**data)
+
+
+@dataclass
+class _Derived:
+    """A case's analysis state and evidence ledger, built from its rows up to ``seq`` and
+    ``evidence_id`` and topped up from there."""
+
+    accumulator: CaseAccumulator = field(default_factory=CaseAccumulator)
+    graph: CaseGraphIndex = field(default_factory=CaseGraphIndex)
+    ledger: EvidenceLedger = field(default_factory=EvidenceLedger)
+    seq: int = 0
+    evidence_id: int = 0
+
+
+class ConnectionPool:
+    def __init__(self, connect: Callable[[], Any], size: int) -> None:
+        self._connect = connect
+        self._size = max(1, size)
+        self._idle: LifoQueue = LifoQueue(maxsize=self._size)
+        self._created = 0
+        self._lock = Lock()
+
+    def _acquire(self) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                return self._connect()
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self._acquire()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                break
+
+
+class SQLStore:
+    """Drop-in replacement for InMemoryStore backed by the Supabase schema.
+
+    Collections are written with multi-row INSERT statements inside one
+    transaction, so a collect costs one round trip per ``max_params`` values
+    instead of one per item.
+
+    Accumulators, graphs and evidence ledgers of the ``derived_cases`` most recently used
+    cases are kept in memory and extended with the rows added since they
+    were last read, so analysis cost follows new items here too.
+    """
+
+    def __init__(self, url: str, pool_size: int = 5, derived_cases: int = 64) -> None:
+        if url.startswith("sqlite://"):
+            path = url[len("sqlite:///"):] or ":memory:"
+            if path == ":memory:":
+                # Every sqlite connection to :memory: is a separate database.
+                pool_size = 1
+            self.placeholder = "?"
+            self.max_params = 999
+            self.seq_column = "rowid"
+            self.pool = ConnectionPool(lambda: self._connect_sqlite(path), pool_size)
+            with self.pool.connection() as conn:
+                conn.executescript(SQLITE_SCHEMA)
+                conn.execute("insert or ignore into store_meta (key, value) values ('epoch', ?)", (uuid4().hex[:12],))
+                columns = [row[1] for row in conn.execute("pragma table_info(cases)")]
+                if "version" not in columns:
+                    conn.execute("alter table cases add column version integer not null default 0")
+                columns = [row[1] for row in conn.execute("pragma table_info(content_items)")]
+                if "fingerprint" not in columns:
+                    conn.execute("alter table content_items add column fingerprint text")
+                self._backfill_fingerprints(conn)
+                conn.execute(
+                    "create unique index if not exists content_items_fingerprint_idx "
+                    "on content_items (case_id, fingerprint)"
+                )
+                columns = [row[1] for row in conn.execute("pragma table_info(evidence)")]
+                if "captured_at" not in columns:
+                    # Older rows kept the capture time in observed_at.
+                    conn.execute("alter table evidence add column captured_at text")
+                    conn.execute("update evidence set captured_at = observed_at")
+        elif url.startswith(("postgres://", "postgresql://")):
+            try:
+                import psycopg
+            except ImportError as exc:
+                raise RuntimeError("psycopg is required for PostgreSQL store backends") from exc
+            self.placeholder = "%s"
+            self.max_params = 65535
+            self.seq_column = "seq"
+            self.pool = ConnectionPool(lambda: psycopg.connect(url), pool_size)
+            with self.pool.connection() as conn:
+                self._backfill_fingerprints(conn)
+        else:
+            raise ValueError(f"Unsupported DATABASE_URL: {url}")
+
+        with self.pool.connection() as conn:
+            # Set once per database, so versions counted in a recreated one never match tags from the old one.
+            self.epoch = self._fetchall(conn, "select value from store_meta where key = 'epoch'")[0][0]
+
+        # Wakes change-feed subscribers in this process; writes from other processes
+        # are picked up when subscribers re-poll.
+        self.notifier = ChangeNotifier()
+
+        self.derived_cases = derived_cases
+        self._derived: "OrderedDict[str, _Derived]" = OrderedDict()
+        self._derived_lock = Lock()
+
+        # Process-local, built from the items up to ``_media_seq`` and topped up on each read.
+        self._media_index = MediaHashIndex()
+        self._media_seq = 0
+        self._media_rows = 0
+        self._media_lock = Lock()
+
+    def _connect_sqlite(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("pragma foreign_keys = on")
+        if path != ":memory:":
+            conn.execute("pragma journal_mode = wal")
+        limit = getattr(sqlite3, "SQLITE_LIMIT_VARIABLE_NUMBER", None)
+        if limit is not None and hasattr(conn, "getlimit"):
+            self.max_params = conn.getlimit(limit)
+        return conn
+
+    def _backfill_fingerprints(self, conn: Any) -> None:
+        """Fingerprint rows written before the column existed; later copies of a fingerprint stay null."""
+        rows = self._fetchall(
+            conn,
+            "select id, case_id, platform, author, source_url, text_content from content_items "
+            "where fingerprint is null order by created_at, id",
+        )
+        if not rows:
+            return
+        seen = set(self._fetchall(conn, "select case_id, fingerprint from content_items where fingerprint is not null"))
+        for item_id, case_id, platform, author, url, text in rows:
+            item = ContentItem.model_construct(platform=Platform(platform), author=author, url=url or "", text=text)
+            key = (case_id, content_fingerprint(item).hex())
+            if key in seen:
+                continue
+            seen.add(key)
+            conn.execute(self._sql("update content_items set fingerprint = ? where id = ?"), (key[1], item_id))
+
+    @contextmanager
+    def _write(self) -> Iterator[Any]:
+        with self.pool.connection() as conn:
+            yield conn
+        self.notifier.notify()
+
+    def _sql(self, statement: str) -> str:
+        return statement if self.placeholder == "?" else statement.replace("?", self.placeholder)
+
+    def _fetchall(self, conn: Any, statement: str, params: Sequence[Any] = ()) -> List[tuple]:
+        return list(conn.execute(self._sql(statement), params).fetchall())
+
+    def _insert_many(
+        self,
+        conn: Any,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        conflict: str = "",
+        returning: str = "",
+    ) -> List[tuple]:
+        """Insert ``rows`` in as few statements as the parameter limit allows; rows from ``returning``."""
+        returned: List[tuple] = []
+        if not rows:
+            return returned
+        width = len(columns)
+        row_sql = "(" + ", ".join([self.placeholder] * width) + ")"
+        per_statement = max(1, self.max_params // width)
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start : start + per_statement]
+            statement = (
+                f"insert into {table} ({', '.join(columns)}) values "
+                f"{', '.join([row_sql] * len(chunk))}{conflict}{returning}"
+            )
+            cursor = conn.execute(statement, [value for row in chunk for value in row])
+            if returning:
+                returned.extend(cursor.fetchall())
+        return returned
+
+    def _add_timeline_event(
+        self,
+        conn: Any,
+        case_id: str,
+        event_type: str,
+        summary: str,
+        metadata: Dict | None = None,
+    ) -> None:
+        # Random rather than counted, so concurrent writers to one database cannot collide.
+        row = (
+            f"evt_{uuid4().hex}",
+            case_id,
+            event_type,
+            summary,
+            _dump(metadata or {}),
+            _ts(datetime.now(timezone.utc)),
+        )
+        self._insert_many(conn, "timeline_events", TIMELINE_COLUMNS, [row])
+
+    def _bump(self, conn: Any, case_id: str) -> None:
+        conn.execute(self._sql("update cases set version = version + 1 where id = ?"), (case_id,))
+
+    def _case_from_row(self, row: Sequence[Any], platforms: List[str]) -> CaseRecord:
+        data = dict(zip(CASE_COLUMNS, row))
+        analysis = _load(data.pop("analysis"))
+        data["risk_score"] = float(data["risk_score"])
+        return CaseRecord(
+            **data,
+            platforms=sorted(platforms, key=lambda p: PLATFORM_ORDER[Platform(p)]),
+            analysis=AnalysisResult.model_validate(analysis) if analysis else None,
+        )
+
+    def _get_case(self, conn: Any, case_id: str) -> CaseRecord:
+        rows = self._fetchall(conn, f"select {', '.join(CASE_COLUMNS)} from cases where id = ?", (case_id,))
+        if not rows:
+            raise KeyError(case_id)
+        platforms = self._fetchall(conn, "select platform from case_platforms where case_id = ?", (case_id,))
+        return self._case_from_row(rows[0], [p for (p,) in platforms])
+
+    def create_case(self, case: CaseRecord) -> CaseRecord:
+        with self._write() as conn:
+            self._insert_many(
+                conn,
+                "cases",
+                CASE_COLUMNS,
+                [
+                    (
+                        case.id,
+                        case.title,
+                        case.query,
+                        case.status.value,
+                        case.risk_score,
+                        case.severity.value,
+                        case.item_count,
+                        case.analysis.model_dump_json() if case.analysis else None,
+                        _ts(case.created_at),
+                        _ts(case.updated_at),
+                    )
+                ],
+            )
+            self._insert_many(
+                conn,
+                "case_platforms",
+                ("case_id", "platform"),
+                [(case.id, platform.value) for platform in case.platforms],
+            )
+            self._add_timeline_event(conn, case.id, "case_created", "Investigation case created.")
+            self._bump(conn, case.id)
+        return case
+
+    def list_cases(self, statuses: Collection[Status] | None = None, min_items: int = 0) -> List[CaseRecord]:
+        statement = f"select {', '.join(CASE_COLUMNS)} from cases where item_count >= ?"
+        params: List[Any] = [min_items]
+        if statuses:
+            statement += f" and status in ({', '.join('?' * len(statuses))})"
+            params += [Status(status).value for status in statuses]
+        with self.pool.connection() as conn:
+            rows = self._fetchall(conn, f"{statement} order by updated_at desc", params)
+            platforms: Dict[str, List[str]] = {}
+            for case_id, platform in self._fetchall(conn, "select case_id, platform from case_platforms"):
+                platforms.setdefault(case_id, []).append(platform)
+        return [self._case_from_row(row, platforms.get(row[0], [])) for row in rows]
+
+    def list_cases_json(self, statuses: Collection[Status] | None = None, min_items: int = 0) -> bytes:
+        return join_array(encode(case) for case in self.list_cases(statuses, min_items))
+
+    def get_case(self, case_id: str) -> CaseRecord:
+        with self.pool.connection() as conn:
+            return self._get_case(conn, case_id)
+
+    def get_case_json(self, case_id: str) -> bytes:
+        return encode(self.get_case(case_id))
+
+    def touch(self, case_id: str) -> CaseRecord:
+        with self._write() as conn:
+            case = self._get_case(conn, case_id)
+            case.updated_at = datetime.now(timezone.utc)
+            conn.execute(self._sql("update cases set updated_at = ? where id = ?"), (_ts(case.updated_at), case_id))
+            self._bump(conn, case_id)
+        return case
+
+    def append_items(
+        self, case_id: str, new_items: List[ContentItem], metadata: Dict | None = None
+    ) -> CaseRecord:
+        with self._write() as conn:
+            case = self._get_case(conn, case_id)
+            # Conflicts on the item ID or on the case's (case_id, fingerprint) index skip the row,
+            # matching the in-memory store's ID and content dedup.
+            returned = self._insert_many(
+                conn,
+                "content_items",
+                ITEM_COLUMNS + ("fingerprint",),
+                [
+                    (
+                        item.id,
+                        case_id,
+                        item.platform.value,
+                        item.author,
+                        item.text,
+                        item.url,
+                        _ts(item.observed_at),
+                        item.language,
+                        item.engagement,
+                        item.source_name,
+                        item.media_hash,
+                        item.narrative_key,
+                        _dump(item.entities),
+                        content_fingerprint(item).hex(),
+                    )
+                    for item in new_items
+                ],
+                conflict=" on conflict do nothing",
+                returning=" returning id",
+            )
+            inserted_ids = {item_id for (item_id,) in returned}
+            fresh: List[ContentItem] = []
+            for item in new_items:
+                if item.id in inserted_ids:
+                    inserted_ids.discard(item.id)
+                    fresh.append(item)
+            (count,) = self._fetchall(conn, "select count(*) from content_items where case_id = ?", (case_id,))[0]
+            self._insert_many(
+                conn,
+                "evidence",
+                EVIDENCE_COLUMNS + ("observed_at",),
+                [
+                    (
+                        record.id,
+                        case_id,
+                        record.item_id,
+                        record.evidence_hash,
+                        record.source_name,
+                        record.source_url,
+                        record.note,
+                        _ts(record.captured_at),
+                        _ts(item.observed_at),
+                    )
+                    for record, item in zip(build_evidence(case_id, fresh), fresh)
+                ],
+                conflict=" on conflict (record_id) do nothing",
+            )
+            inserted = len(fresh)
+            # A re-collection that finds nothing new leaves the case, its status and its version alone.
+            if inserted:
+                case.status = Status.collecting
+                case.updated_at = datetime.now(timezone.utc)
+                case.item_count = count
+                conn.execute(
+                    self._sql("update cases set status = ?, item_count = ?, updated_at = ? where id = ?"),
+                    (case.status.value, case.item_count, _ts(case.updated_at), case_id),
+                )
+            self._add_timeline_event(
+                conn,
+                case_id,
+                "collection_completed",
+                f"Collected {inserted} new items.",
+                {
+                    "item_count": inserted,
+                    "inserted": inserted,
+                    "skipped": len(new_items) - inserted,
+                    **(metadata or {}),
+                },
+            )
+            if inserted:
+                self._add_timeline_event(
+                    conn, case_id, "evidence_captured", f"Captured {inserted} evidence records."
+                )
+                self._bump(conn, case_id)
+        return case
+
+    def get_items(self, case_id: str) -> List[ContentItem]:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(
+                conn,
+                f"select {', '.join(ITEM_COLUMNS)} from content_items where case_id = ? order by observed_at, id",
+                (case_id,),
+            )
+        return [_item_from_row(row) for row in rows]
+
+    def get_items_json(self, case_id: str) -> bytes:
+        return join_array(encode(item) for item in self.get_items(case_id))
+
+    def _page(
+        self,
+        table: str,
+        columns: Sequence[str],
+        time_column: str,
+        id_column: str,
+        case_id: str,
+        after: SortKey | None,
+        limit: int,
+    ) -> List[tuple]:
+        statement = f"select {', '.join(columns)} from {table} where case_id = ?"
+        params: List[Any] = [case_id]
+        if after:
+            statement += f" and ({time_column} > ? or ({time_column} = ? and {id_column} > ?))"
+            params += [_ts(after[0]), _ts(after[0]), after[1]]
+        statement += f" order by {time_column}, {id_column} limit ?"
+        with self.pool.connection() as conn:
+            return self._fetchall(conn, statement, params + [limit])
+
+    def page_items(self, case_id: str, after: SortKey | None, limit: int) -> List[ContentItem]:
+        rows = self._page("content_items", ITEM_COLUMNS, "observed_at", "id", case_id, after, limit)
+        return [_item_from_row(row) for row in rows]
+
+    def _derived_state(self, case_id: str) -> _Derived:
+        with self._derived_lock:
+            derived = self._derived.pop(case_id, None) or _Derived()
+            with self.pool.connection() as conn:
+                # Read before the rows: every item it counts is committed, so a top-up that
+                # falls short means a row with a lower seq committed late (another process).
+                counted = self._fetchall(conn, "select item_count from cases where id = ?", (case_id,))
+                item_count = int(counted[0][0]) if counted else 0
+                self._top_up(conn, case_id, derived)
+                # Each stored item has exactly one evidence record, written in the same transaction.
+                if derived.accumulator.count < item_count or len(derived.ledger) < item_count:
+                    derived = _Derived()
+                    self._top_up(conn, case_id, derived)
+            self._derived[case_id] = derived
+            while len(self._derived) > self.derived_cases:
+                self._derived.popitem(last=False)
+            return derived
+
+    def _top_up(self, conn: Any, case_id: str, derived: _Derived) -> None:
+        seq = self.seq_column
+        rows = self._fetchall(
+            conn,
+            f"select {seq}, {', '.join(ITEM_COLUMNS)} from content_items "
+            f"where case_id = ? and {seq} > ? order by {seq}",
+            (case_id, derived.seq),
+        )
+        if rows:
+            items = [_item_from_row(row[1:]) for row in rows]
+            derived.accumulator.add(items)
+            derived.graph.add(items)
+            derived.seq = int(rows[-1][0])
+        rows = self._fetchall(
+            conn,
+            f"select id, {', '.join(EVIDENCE_COLUMNS)} from evidence where case_id = ? and id > ? order by id",
+            (case_id, derived.evidence_id),
+        )
+        if rows:
+            derived.ledger.append([_evidence_from_row(row[1:]) for row in rows])
+            derived.evidence_id = int(rows[-1][0])
+
+    @property
+    def media_index(self) -> MediaHashIndex:
+        """The media hash index over every case, first topped up with the items committed since the last read.
+
+        Items written by any process sharing the database are picked up. Like
+        the derived state, the index is rebuilt if it counts fewer items than
+        the cases do, which means a row with a lower seq committed late.
+        """
+        seq = self.seq_column
+        with self._media_lock, self.pool.connection() as conn:
+            # Read before the rows, so every item it counts is among them unless one committed out of order.
+            (counted,) = self._fetchall(conn, "select coalesce(sum(item_count), 0) from cases")[0]
+            rows = self._fetchall(
+                conn,
+                f"select {seq}, case_id, id, media_hash from content_items where {seq} > ? order by {seq}",
+                (self._media_seq,),
+            )
+            if self._media_rows + len(rows) < int(counted):
+                self._media_index, self._media_seq, self._media_rows = MediaHashIndex(), 0, 0
+                rows = self._fetchall(
+                    conn, f"select {seq}, case_id, id, media_hash from content_items order by {seq}"
+                )
+            for _, case_id, item_id, media_hash in rows:
+                if media_hash:
+                    self._media_index.add(case_id, item_id, media_hash)
+            if rows:
+                self._media_seq = int(rows[-1][0])
+                self._media_rows += len(rows)
+            return self._media_index
+
+    def get_accumulator(self, case_id: str) -> CaseAccumulator:
+        return self._derived_state(case_id).accumulator
+
+    def get_graph(self, case_id: str) -> CaseGraphIndex:
+        return self._derived_state(case_id).graph
+
+    def start_analysis(self, case_id: str) -> CaseRecord:
+        with self._write() as conn:
+            case = self._get_case(conn, case_id)
+            case.status = Status.analyzing
+            case.updated_at = datetime.now(timezone.utc)
+            conn.execute(
+                self._sql("update cases set status = ?, updated_at = ? where id = ?"),
+                (case.status.value, _ts(case.updated_at), case_id),
+            )
+            self._add_timeline_event(conn, case_id, "analysis_started", "Analysis started.")
+            self._bump(conn, case_id)
+        return case
+
+    def save_analysis(self, case_id: str, score: float, severity: Severity, analysis) -> CaseRecord:
+        with self._write() as conn:
+            case = self._get_case(conn, case_id)
+            case.status = Status.ready
+            case.risk_score = score
+            case.severity = severity
+            case.analysis = analysis
+            case.updated_at = datetime.now(timezone.utc)
+            conn.execute(
+                self._sql(
+                    "update cases set status = ?, risk_score = ?, severity = ?, analysis = ?, updated_at = ? "
+                    "where id = ?"
+                ),
+                (
+                    case.status.value,
+                    score,
+                    severity.value,
+                    analysis.model_dump_json(),
+                    _ts(case.updated_at),
+                    case_id,
+                ),
+            )
+            signals = analysis.signals
+            self._insert_many(
+                conn,
+                "risk_scores",
+                (
+                    "case_id",
+                    "harm",
+                    "velocity",
+                    "reach",
+                    "coordination",
+                    "credibility_gap",
+                    "cross_platform",
+                    "total_score",
+                    "severity",
+                ),
+                [
+                    (
+                        case_id,
+                        signals.harm,
+                        signals.velocity,
+                        signals.reach,
+                        signals.coordination,
+                        signals.credibility_gap,
+                        signals.cross_platform,
+                        score,
+                        severity.value,
+                    )
+                ],
+            )
+            self._add_timeline_event(
+                conn,
+                case_id,
+                "analysis_completed",
+                f"Analysis completed with score {score:.2f} ({severity.value}).",
+                {"score": score, "severity": severity.value},
+            )
+            self._bump(conn, case_id)
+        return case
+
+    def save_alerts(self, case_id: str, alerts: List[AlertRecord]) -> None:
+        with self._write() as conn:
+            conn.execute(self._sql("delete from alerts where case_id = ?"), (case_id,))
+            self._insert_many(
+                conn,
+                "alerts",
+                ALERT_COLUMNS,
+                [
+                    (
+                        alert.id,
+                        case_id,
+                        alert.severity.value,
+                        alert.status.value,
+                        alert.title,
+                        alert.summary,
+                        alert.recommended_action,
+                        _ts(alert.created_at),
+                    )
+                    for alert in alerts
+                ],
+            )
+            self._add_timeline_event(conn, case_id, "alerts_generated", f"Generated {len(alerts)} alerts.")
+            self._bump(conn, case_id)
+
+    def get_alerts(self, case_id: str) -> List[AlertRecord]:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(
+                conn,
+                f"select {', '.join(ALERT_COLUMNS)} from alerts where case_id = ? order by created_at, id",
+                (case_id,),
+            )
+        return [AlertRecord(**dict(zip(ALERT_COLUMNS, row))) for row in rows]
+
+    def get_evidence(self, case_id: str) -> List[EvidenceRecord]:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(
+                conn,
+                f"select {', '.join(EVIDENCE_COLUMNS)} from evidence where case_id = ? order by id",
+                (case_id,),
+            )
+        return [_evidence_from_row(row) for row in rows]
+
+    def page_evidence(self, case_id: str, after: SortKey | None, limit: int) -> List[EvidenceRecord]:
+        rows = self._page("evidence", EVIDENCE_COLUMNS, "captured_at", "record_id", case_id, after, limit)
+        return [_evidence_from_row(row) for row in rows]
+
+    def get_ledger(self, case_id: str) -> EvidenceLedger:
+        return self._derived_state(case_id).ledger
+
+    def save_media_verification(self, case_id: str, results: List[MediaVerificationResult]) -> None:
+        with self._write() as conn:
+            conn.execute(self._sql("delete from media_verifications where case_id = ?"), (case_id,))
+            self._insert_many(
+                conn,
+                "media_verifications",
+                MEDIA_COLUMNS,
+                [
+                    (
+                        case_id,
+                        result.item_id,
+                        result.verdict.value,
+                        result.confidence,
+                        _dump(result.checks),
+                        result.explanation,
+                    )
+                    for result in results
+                ],
+                conflict=" on conflict (case_id, item_id) do nothing",
+            )
+            self._add_timeline_event(
+                conn,
+                case_id,
+                "media_verified",
+                f"Media verification completed for {len(results)} items.",
+            )
+            self._bump(conn, case_id)
+
+    def get_media_verification(self, case_id: str) -> List[MediaVerificationResult]:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(
+                conn,
+                f"select {', '.join(MEDIA_COLUMNS)} from media_verifications where case_id = ? order by item_id",
+                (case_id,),
+            )
+        results: List[MediaVerificationResult] = []
+        for row in rows:
+            data = dict(zip(MEDIA_COLUMNS, row))
+            results.append(
+                MediaVerificationResult(
+                    item_id=data["item_id"],
+                    verdict=data["verdict"],
+                    confidence=float(data["confidence"]),
+                    checks=_load(data["checks"]),
+                    explanation=data["explanation"],
+                )
+            )
+        return results
+
+    def save_report(self, case_id: str, report: CaseReport) -> None:
+        with self._write() as conn:
+            conn.execute(self._sql("delete from case_reports where case_id = ?"), (case_id,))
+            self._insert_many(
+                conn,
+                "case_reports",
+                ("case_id", "payload", "generated_at"),
+                [(case_id, report.model_dump_json(), _ts(report.generated_at))],
+            )
+            self._add_timeline_event(conn, case_id, "report_generated", "Executive and technical report generated.")
+            self._bump(conn, case_id)
+
+    def get_report(self, case_id: str) -> CaseReport | None:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(conn, "select payload from case_reports where case_id = ?", (case_id,))
+        return CaseReport.model_validate(_load(rows[0][0])) if rows else None
+
+    def get_timeline(self, case_id: str) -> List[TimelineEvent]:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(
+                conn,
+                f"select {', '.join(TIMELINE_COLUMNS)} from timeline_events where case_id = ? order by created_at, id",
+                (case_id,),
+            )
+        return [_event_from_row(row) for row in rows]
+
+    def page_timeline(self, case_id: str, after: SortKey | None, limit: int) -> List[TimelineEvent]:
+        rows = self._page("timeline_events", TIMELINE_COLUMNS, "created_at", "id", case_id, after, limit)
+        return [_event_from_row(row) for row in rows]
+
+    def get_version(self, case_id: str) -> int:
+        with self.pool.connection() as conn:
+            rows = self._fetchall(conn, "select version from cases where id = ?", (case_id,))
+        if not rows:
+            raise KeyError(case_id)
+        return int(rows[0][0])
+
+    def get_global_version(self) -> int:
+        with self.pool.connection() as conn:
+            (total,) = self._fetchall(conn, "select coalesce(sum(version), 0) from cases")[0]
+        return int(total)
+
+    def get_changes(
+        self, after: int, limit: int, event_types: Collection[str] | None = None
+    ) -> Tuple[List[ChangeEvent], int]:
+        seq = self.seq_column
+        # Read the head first so events landing mid-scan are left for the next call.
+        head = self.get_change_head()
+        with self.pool.connection() as conn:
+            statement = (
+                f"select {seq}, {', '.join(TIMELINE_COLUMNS)} from timeline_events "
+                f"where {seq} > ? and {seq} <= ?"
+            )
+            params: List[Any] = [after, head]
+            if event_types:
+                statement += f" and event_type in ({', '.join('?' * len(event_types))})"
+                params += list(event_types)
+            rows = self._fetchall(conn, f"{statement} order by {seq} limit ?", params + [limit])
+        changes = [ChangeEvent(seq=row[0], **_event_from_row(row[1:]).model_dump()) for row in rows]
+        if len(changes) < limit:
+            return changes, head
+        return changes, changes[-1].seq
+
+    def get_change_head(self) -> int:
+        with self.pool.connection() as conn:
+            (head,) = self._fetchall(conn, f"select coalesce(max({self.seq_column}), 0) from timeline_events")[0]
+        return int(head)
+
+    def get_change_tail(self) -> int:
+        # Timeline rows are never deleted, so every cursor stays readable.
+        return 0
+
+    def get_store_stats(self) -> Dict[str, Any]:
+        with self.pool.connection() as conn:
+            (cases,) = self._fetchall(conn, "select count(*) from cases")[0]
+            items_per_case = [int(count) for (count,) in self._fetchall(conn, "select item_count from cases")]
+            (evidence,) = self._fetchall(conn, "select count(*) from evidence")[0]
+            (timeline_events,) = self._fetchall(conn, "select count(*) from timeline_events")[0]
+            if self.placeholder == "?":
+                (pages,) = self._fetchall(conn, "pragma page_count")[0]
+                (page_size,) = self._fetchall(conn, "pragma page_size")[0]
+                size_bytes = pages * page_size
+            else:
+                (size_bytes,) = self._fetchall(conn, "select pg_database_size(current_database())")[0]
+        return {
+            "cases": int(cases),
+            "items_per_case": items_per_case,
+            "evidence": int(evidence),
+            "timeline_events": int(timeline_events),
+            "size_bytes": int(size_bytes),
+        }
+
+    def get_global_metrics(self) -> GlobalMetrics:
+        with self.pool.connection() as conn:
+            total_cases, avg_risk, high = self._fetchall(
+                conn,
+                "select count(*), coalesce(avg(risk_score), 0), "
+                "coalesce(sum(case when severity in ('R3', 'R4') then 1 else 0 end), 0) from cases",
+            )[0]
+            (open_alerts,) = self._fetchall(conn, "select count(*) from alerts where status = 'open'")[0]
+        return GlobalMetrics(
+            total_cases=total_cases,
+            open_alerts=open_alerts,
+            avg_risk=round(float(avg_risk), 2),
+            high_severity_cases=high,
+        )
+
+    def close(self) -> None:
+        self.pool.close()
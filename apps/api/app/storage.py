@@ -1,11 +1,45 @@
 from __future__ import annotations
 
+import os
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List
+from pathlib import Path
+from threading import Lock, RLock, Thread
+from typing import Any, Callable, Collection, Dict, Iterator, List, Tuple
+from uuid import uuid4
 
+import numpy as np
+
+from .analysis import CaseAccumulator
+from .changes import ChangeLog
+from .dedup import IngestIndex
+from .encoding import EncodedList, encode, join_array
+from .graph import CaseGraphIndex
+from .instrumentation import estimate_deep_size, estimate_size
+from .intelligence import build_evidence
+from .item_table import ItemTable
+from .ledger import EvidenceLedger
+from .media_index import MediaHashIndex
+from .pagination import KeysetOrder, SortKey, micros
+from .persistence import (
+    MutationLog,
+    dump_state,
+    generation,
+    latest_snapshot,
+    link_tree,
+    read_log,
+    read_state,
+    sync_directory,
+    sync_tree,
+    write_state,
+)
+from .spill import CaseBulk, PendingCapture, SpilledCase, discard, read_bulk, write_bulk, write_captured
 from .schemas import (
     AlertRecord,
     CaseRecord,
+    ChangeEvent,
     CaseReport,
     ContentItem,
     EvidenceRecord,
@@ -17,105 +51,621 @@ from .schemas import (
 )
 
 
+# The methods the mutation log may name; anything else in a log is rejected on replay.
+LOGGED_MUTATIONS = frozenset(
+    {
+        "create_case",
+        "touch",
+        "_append",
+        "start_analysis",
+        "save_analysis",
+        "save_alerts",
+        "save_media_verification",
+        "save_report",
+    }
+)
+# A case's derived structures are re-measured each time its item count grows by this factor;
+# in between, their size is extrapolated from the last measurement's bytes per item.
+DERIVED_REMEASURE_GROWTH = 2
+
+
 class InMemoryStore:
-    def __init__(self) -> None:
+    """Process-local store.
+
+    With a ``memory_budget`` (bytes), the bulky per-case data (items,
+    evidence, media verifications and the derived indexes) of the least
+    recently used cases is spilled to ``spill_dir`` whenever the estimated
+    resident total goes over budget, and loaded back, items memory-mapped,
+    on the next access. Case records, alerts, timelines and reports always
+    stay in memory, so listing cases never touches disk.
+
+    With a ``data_dir``, every mutation is appended to a log there and the
+    store is periodically compacted into a snapshot (case state plus each
+    case's bulk in the spill format). Start-up loads the newest snapshot,
+    leaving case bulk on disk until first accessed, and replays the log
+    written since. Replayed mutations are re-applied, so their timeline
+    events and ``updated_at`` carry the replay time.
+    """
+
+    def __init__(
+        self,
+        bloom_threshold: int | None = None,
+        memory_budget: int | None = None,
+        spill_dir: str | Path | None = None,
+        data_dir: str | Path | None = None,
+        snapshot_log_bytes: int = 8 * 1024 * 1024,
+        log_fsync: bool = False,
+        change_retention: int = 100_000,
+    ) -> None:
+        self.bloom_threshold = bloom_threshold
+        self.memory_budget = memory_budget
+        if memory_budget is not None and spill_dir is None:
+            spill_dir = tempfile.mkdtemp(prefix="nexus-spill-")
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
         self.cases: Dict[str, CaseRecord] = {}
-        self.items: Dict[str, List[ContentItem]] = {}
+        self.bulk: Dict[str, CaseBulk] = {}
+        self.spilled: Dict[str, SpilledCase] = {}
+        # Resident cases, least recently used first, with their estimated bytes.
+        self.resident: OrderedDict[str, int] = OrderedDict()
+        self.resident_bytes = 0
+        # Per case: the item count at the last measurement of its derived structures, and their bytes per item.
+        self.derived_sizes: Dict[str, Tuple[int, float]] = {}
+        # Serializes mutations (and their log records) with spills and snapshots.
+        self._lock = RLock()
         self.alerts: Dict[str, List[AlertRecord]] = {}
-        self.evidence: Dict[str, List[EvidenceRecord]] = {}
         self.timeline: Dict[str, List[TimelineEvent]] = {}
         self.reports: Dict[str, CaseReport] = {}
-        self.media_verifications: Dict[str, List[MediaVerificationResult]] = {}
+        self.media_index = MediaHashIndex()
+        self.page_indexes: Dict[Tuple[str, str], KeysetOrder] = {}
+        self.case_json: Dict[str, bytes] = {}
+        self.item_json: Dict[str, EncodedList] = {}
+        self._case_list_json: bytes | None = None
+        self.versions: Dict[str, int] = {}
+        self.global_version = 0
+        # Versions start over in every process, and replay re-stamps ``updated_at``, so tags built on them carry this.
+        self.epoch = uuid4().hex[:12]
+        self.changes = ChangeLog(change_retention)
+        self.notifier = self.changes.notifier
+        self.data_dir = Path(data_dir) if data_dir is not None else None
+        self.snapshot_log_bytes = snapshot_log_bytes
+        self.log_fsync = log_fsync
+        self.log: MutationLog | None = None
+        self.snapshot_id = 0
+        self._snapshot_pending = False
+        # One snapshot at a time; held across the unlocked write phase.
+        self._snapshotting = Lock()
+        # Bumped whenever a case's bulk changes, so a snapshot can tell which cases it still matches.
+        self.bulk_changes: Dict[str, int] = {}
+        # Dirty cases the running snapshot has yet to serialize; see ``_writing``.
+        self.uncaptured: Dict[str, PendingCapture] = {}
+        # One load from disk at a time per spilled case; see ``_case_bulk``.
+        self._loads: Dict[str, Lock] = {}
+        if self.data_dir is not None:
+            self._restore()
 
     def _add_timeline_event(self, case_id: str, event_type: str, summary: str, metadata: Dict | None = None) -> None:
         events = self.timeline.setdefault(case_id, [])
-        events.append(
-            TimelineEvent(
-                id=f"evt_{len(events) + 1}_{case_id[-4:]}",
-                case_id=case_id,
-                event_type=event_type,
-                summary=summary,
-                created_at=datetime.now(timezone.utc),
-                metadata=metadata or {},
+        event = TimelineEvent(
+            id=f"evt_{len(events) + 1}_{case_id[-4:]}",
+            case_id=case_id,
+            event_type=event_type,
+            summary=summary,
+            created_at=datetime.now(timezone.utc),
+            metadata=metadata or {},
+        )
+        events.append(event)
+        self.changes.append(event)
+
+    def _bump(self, case_id: str) -> None:
+        self.versions[case_id] = self.versions.get(case_id, 0) + 1
+        self.global_version += 1
+
+    def _invalidate(self, case_id: str) -> None:
+        self._bump(case_id)
+        self.case_json.pop(case_id, None)
+        self._case_list_json = None
+
+    def get_version(self, case_id: str) -> int:
+        return self.versions[case_id]
+
+    def get_global_version(self) -> int:
+        return self.global_version
+
+    def _case_bulk(self, case_id: str) -> CaseBulk:
+        """The case's bulky data, loading it back from disk if it was spilled; KeyError for unknown cases.
+
+        The files are read outside ``_lock``, one load at a time per case, and
+        the result installed under it. Callers already holding ``_lock`` use
+        ``_locked_bulk``: waiting for a load that needs the lock would deadlock.
+        """
+        bulk = self.bulk.get(case_id)
+        if bulk is not None:
+            if self.memory_budget is not None:
+                with self._lock:
+                    if case_id in self.resident:
+                        self.resident.move_to_end(case_id)
+            return bulk
+        while True:
+            with self._lock:
+                bulk = self.bulk.get(case_id)
+                if bulk is not None:
+                    return bulk
+                location = self.spilled[case_id]
+                guard = self._loads.setdefault(case_id, Lock())
+            with guard:
+                with self._lock:
+                    if case_id in self.bulk or self.spilled.get(case_id) is not location:
+                        # Another load got there first, or the case moved while we waited.
+                        continue
+                loaded = read_bulk(location.path)
+                size = self._measure(case_id, loaded) if self.memory_budget is not None else 0
+                with self._lock:
+                    if case_id not in self.bulk and self.spilled.get(case_id) is location:
+                        self.bulk[case_id] = loaded
+                        self._account(case_id, size)
+                        return loaded
+
+    def _locked_bulk(self, case_id: str) -> CaseBulk:
+        """``_case_bulk`` for callers holding ``_lock``, loading in place if the case was spilled meanwhile."""
+        bulk = self.bulk.get(case_id)
+        if bulk is None:
+            bulk = self.bulk[case_id] = read_bulk(self.spilled[case_id].path)
+            self._resize(case_id)
+        return bulk
+
+    def _resize(self, case_id: str) -> None:
+        """Re-estimate a resident case after it grew, then spill others until back under budget."""
+        if self.memory_budget is None:
+            return
+        with self._lock:
+            bulk = self.bulk.get(case_id)
+            if bulk is None:
+                return
+            self._account(case_id, self._measure(case_id, bulk))
+
+    def _measure(self, case_id: str, bulk: CaseBulk) -> int:
+        """Estimated resident bytes of the case's bulk and its read caches."""
+        size = bulk.items.nbytes + self._derived_size(case_id, bulk)
+        size += estimate_size(bulk.media_verifications)
+        encoded = self.item_json.get(case_id)
+        size += encoded.nbytes if encoded is not None else 0
+        size += sum(
+            index.nbytes
+            for kind in ("items", "evidence")
+            if (index := self.page_indexes.get((kind, case_id))) is not None
+        )
+        return size
+
+    def _account(self, case_id: str, size: int) -> None:
+        """Record a resident case's size and spill others until back under budget; call with ``_lock`` held."""
+        if self.memory_budget is None:
+            return
+        self.resident_bytes += size - self.resident.get(case_id, 0)
+        self.resident[case_id] = size
+        self.resident.move_to_end(case_id)
+        while self.resident_bytes > self.memory_budget and len(self.resident) > 1:
+            coldest, coldest_size = self.resident.popitem(last=False)
+            self.resident_bytes -= coldest_size
+            self._spill(coldest)
+
+    def _derived_size(self, case_id: str, bulk: CaseBulk) -> int:
+        """Estimated bytes of the case's evidence, accumulator, ingest index and graph."""
+        count = len(bulk.items)
+        measured, per_item = self.derived_sizes.get(case_id, (0, 0.0))
+        if count >= max(1, measured * DERIVED_REMEASURE_GROWTH):
+            size = estimate_deep_size(
+                bulk.evidence, bulk.accumulator, bulk.ingest_index, bulk.graph, exclude=(bulk.items,)
             )
+            measured, per_item = self.derived_sizes[case_id] = (count, size / count)
+        return int(per_item * count)
+
+    def _spill(self, case_id: str) -> None:
+        bulk = self.bulk.pop(case_id)
+        for kind in ("items", "evidence"):
+            self.page_indexes.pop((kind, case_id), None)
+        self.item_json.pop(case_id, None)
+        previous = self.spilled.get(case_id)
+        if previous is not None and previous.clean:
+            return
+        path = self.spill_dir / f"{case_id}-{uuid4().hex[:8]}"
+        write_bulk(path, bulk)
+        self._relocate(case_id, SpilledCase(path, evidence=len(bulk.evidence), clean=True))
+
+    def _relocate(self, case_id: str, location: SpilledCase) -> None:
+        previous = self.spilled.get(case_id)
+        self.spilled[case_id] = location
+        # Snapshot copies belong to the snapshot; only spill files are ours to delete.
+        if previous is not None and previous.path != location.path and previous.path.parent == self.spill_dir:
+            discard(previous.path)
+
+    def _changed(self, case_id: str) -> None:
+        self.bulk_changes[case_id] = self.bulk_changes.get(case_id, 0) + 1
+        spilled = self.spilled.get(case_id)
+        if spilled is not None:
+            spilled.clean = False
+
+    @contextmanager
+    def _writing(self, case_id: str) -> Iterator[None]:
+        """Hold ``_lock`` for a write to the case's bulk.
+
+        A snapshot serializes dirty cases after releasing the lock, so a write
+        to one it has not reached yet captures it first, outside the lock.
+        """
+        while True:
+            with self._lock:
+                pending = self.uncaptured.get(case_id)
+                if pending is None or pending.done:
+                    yield
+                    return
+            pending.capture()
+
+    def _record(self, op: str, *args: Any) -> None:
+        """Log a mutation that was just applied; call with ``_lock`` held."""
+        if self.log is None:
+            return
+        self.log.append(op, *args)
+        if self.log.size >= self.snapshot_log_bytes and not self._snapshot_pending:
+            self._snapshot_pending = True
+            Thread(target=self.snapshot, name="store-snapshot", daemon=True).start()
+
+    def _restore(self) -> None:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        found = latest_snapshot(self.data_dir)
+        if found is not None:
+            self.snapshot_id, path = found
+            state = read_state(path)
+            self.cases = state["cases"]
+            self.alerts = state["alerts"]
+            self.timeline = state["timeline"]
+            self.reports = state["reports"]
+            self.versions = state["versions"]
+            self.global_version = state["global_version"]
+            self.changes.restore(state["changes"], state.get("changes_dropped", 0))
+            self.media_index = MediaHashIndex.from_refs(state["media_refs"])
+            for case_id, evidence in state["evidence"].items():
+                self.spilled[case_id] = SpilledCase(path / "cases" / case_id, evidence=evidence, clean=True)
+        # A snapshot that never completed leaves its predecessor's log and its own, both to replay.
+        logs = sorted(
+            (number, path)
+            for path in self.data_dir.glob("log-*")
+            if (number := generation(path)) is not None and number >= self.snapshot_id
         )
+        replayed = False
+        for number, path in logs:
+            for op, args in read_log(path):
+                if op not in LOGGED_MUTATIONS:
+                    raise ValueError(f"Unknown mutation {op!r} in {path}")
+                getattr(self, op)(*args)
+            replayed = replayed or path.stat().st_size > 0
+            self.snapshot_id = max(self.snapshot_id, number)
+        if replayed:
+            # Compact now rather than append after a possibly torn tail.
+            self.snapshot()
+        else:
+            self.log = MutationLog(self.data_dir / f"log-{self.snapshot_id}", self.log_fsync)
+
+    def snapshot(self) -> None:
+        """Write a complete snapshot, start a fresh log and drop the previous snapshot and logs.
+
+        Mutations wait only while the store's containers are copied and the
+        log is switched. Append-only lists are cut by length; dirty cases are
+        serialized afterwards, and a write that reaches one first captures it
+        itself. Unchanged cases already on disk are hard-linked rather than
+        rewritten. The previous generation is deleted only once the new one
+        is durable.
+        """
+        if self.data_dir is None:
+            return
+        with self._snapshotting:
+            with self._lock:
+                self._snapshot_pending = False
+                number = self.snapshot_id + 1
+                target = self.data_dir / f"snapshot-{number}"
+                staging = self.data_dir / f"snapshot-{number}.tmp"
+                discard(staging)
+                staging.mkdir(parents=True)
+                evidence: Dict[str, int] = {}
+                for case_id in self.cases:
+                    bulk = self.bulk.get(case_id)
+                    on_disk = self.spilled.get(case_id)
+                    if bulk is not None and (on_disk is None or not on_disk.clean):
+                        self.uncaptured[case_id] = PendingCapture(bulk)
+                        evidence[case_id] = len(bulk.evidence)
+                    else:
+                        # Linked now: once the lock is released a re-spill may delete the source.
+                        link_tree(on_disk.path, staging / "cases" / case_id)
+                        evidence[case_id] = on_disk.evidence
+                pending = dict(self.uncaptured)
+                cases = {case_id: case.model_copy() for case_id, case in self.cases.items()}
+                timeline = {case_id: (events, len(events)) for case_id, events in self.timeline.items()}
+                held = {
+                    "alerts": dict(self.alerts),
+                    "reports": dict(self.reports),
+                    "versions": dict(self.versions),
+                    "global_version": self.global_version,
+                }
+                change_events, dropped = self.changes.events, self.changes.dropped
+                change_count = len(change_events)
+                media_count = len(self.media_index.refs)
+                changes = dict(self.bulk_changes)
+                # Mutations from here on belong to the new generation.
+                if self.log is not None:
+                    self.log.close()
+                self.log = MutationLog(self.data_dir / f"log-{number}", self.log_fsync)
+                self.snapshot_id = number
+
+            try:
+                for case_id, capture in pending.items():
+                    write_captured(staging / "cases" / case_id, capture.capture())
+                state = dump_state(
+                    {
+                        "cases": cases,
+                        "timeline": {case_id: events[:count] for case_id, (events, count) in timeline.items()},
+                        **held,
+                        "changes": change_events[:change_count],
+                        "changes_dropped": dropped,
+                        "media_refs": self.media_index.refs[:media_count],
+                        "evidence": evidence,
+                    }
+                )
+                write_state(staging, state)
+                sync_tree(staging)
+                os.replace(staging, target)
+                sync_directory(self.data_dir)
+            finally:
+                with self._lock:
+                    self.uncaptured.clear()
+
+            with self._lock:
+                for case_id, count in evidence.items():
+                    if self.bulk_changes.get(case_id) == changes.get(case_id):
+                        self._relocate(case_id, SpilledCase(target / "cases" / case_id, evidence=count, clean=True))
+            for path in self.data_dir.iterdir():
+                older = generation(path)
+                if older is not None and older < number:
+                    if path.is_dir():
+                        discard(path)
+                    else:
+                        path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Snapshot and close the log so the next start-up has nothing to replay."""
+        if self.log is not None:
+            self.snapshot()
+            self.log.close()
+            self.log = None
 
     def create_case(self, case: CaseRecord) -> CaseRecord:
-        self.cases[case.id] = case
-        self.items[case.id] = []
-        self.alerts[case.id] = []
-        self.evidence[case.id] = []
-        self.timeline[case.id] = []
-        self.media_verifications[case.id] = []
-        self._add_timeline_event(case.id, "case_created", "Investigation case created.")
+        with self._lock:
+            self.cases[case.id] = case
+            table = ItemTable()
+            self.bulk[case.id] = CaseBulk(
+                items=table,
+                evidence=EvidenceLedger(),
+                media_verifications=[],
+                accumulator=CaseAccumulator(table),
+                ingest_index=IngestIndex(self.bloom_threshold),
+                graph=CaseGraphIndex(),
+            )
+            self.alerts[case.id] = []
+            self.timeline[case.id] = []
+            self._add_timeline_event(case.id, "case_created", "Investigation case created.")
+            self._invalidate(case.id)
+            self._record("create_case", case)
+            self._resize(case.id)
         return case
 
-    def list_cases(self) -> List[CaseRecord]:
-        return sorted(self.cases.values(), key=lambda x: x.updated_at, reverse=True)
+    def list_cases(self, statuses: Collection[Status] | None = None, min_items: int = 0) -> List[CaseRecord]:
+        cases = self.cases.values()
+        if statuses or min_items:
+            cases = [
+                case
+                for case in cases
+                if (not statuses or case.status in statuses) and case.item_count >= min_items
+            ]
+        return sorted(cases, key=lambda x: x.updated_at, reverse=True)
+
+    def list_cases_json(self, statuses: Collection[Status] | None = None, min_items: int = 0) -> bytes:
+        if statuses or min_items:
+            return join_array(self.get_case_json(case.id) for case in self.list_cases(statuses, min_items))
+        if self._case_list_json is None:
+            self._case_list_json = join_array(self.get_case_json(case.id) for case in self.list_cases())
+        return self._case_list_json
 
     def get_case(self, case_id: str) -> CaseRecord:
         return self.cases[case_id]
 
-    def append_items(self, case_id: str, new_items: List[ContentItem]) -> CaseRecord:
+    def get_case_json(self, case_id: str) -> bytes:
+        cached = self.case_json.get(case_id)
+        if cached is None:
+            cached = self.case_json[case_id] = encode(self.get_case(case_id))
+        return cached
+
+    def touch(self, case_id: str) -> CaseRecord:
+        with self._lock:
+            case = self.get_case(case_id)
+            case.updated_at = datetime.now(timezone.utc)
+            self._invalidate(case_id)
+            self._record("touch", case_id)
+        return case
+
+    def append_items(
+        self, case_id: str, new_items: List[ContentItem], metadata: Dict | None = None
+    ) -> CaseRecord:
+        return self._append(case_id, new_items, metadata, datetime.now(timezone.utc))
+
+    def _append(self, case_id: str, new_items: List[ContentItem], metadata: Dict | None, at: datetime) -> CaseRecord:
         case = self.get_case(case_id)
-        case.status = Status.collecting
-        case.updated_at = datetime.now(timezone.utc)
-        self.items[case_id].extend(new_items)
-        case.item_count = len(self.items[case_id])
-        self._add_timeline_event(
-            case_id,
-            "collection_completed",
-            f"Collected {len(new_items)} new items.",
-            {"item_count": len(new_items)},
-        )
+        # Loaded before taking the lock, then held throughout so the case cannot be spilled half-appended.
+        self._case_bulk(case_id)
+        with self._writing(case_id):
+            bulk = self._locked_bulk(case_id)
+            fresh, skipped = bulk.ingest_index.filter(new_items)
+            captured = []
+            if fresh:
+                # A re-collection that finds nothing new leaves the case, its status and its version alone.
+                self._changed(case_id)
+                case.status = Status.collecting
+                case.updated_at = at
+                bulk.items.append(fresh)
+                bulk.accumulator.add(fresh)
+                bulk.graph.add(fresh)
+                captured = bulk.evidence.append(build_evidence(case_id, fresh, at))
+                case.item_count = len(bulk.items)
+                for item in fresh:
+                    if item.media_hash:
+                        self.media_index.add(case_id, item.id, item.media_hash)
+            self._add_timeline_event(
+                case_id,
+                "collection_completed",
+                f"Collected {len(fresh)} new items.",
+                {"item_count": len(fresh), "inserted": len(fresh), "skipped": skipped, **(metadata or {})},
+            )
+            if captured:
+                self._add_timeline_event(case_id, "evidence_captured", f"Captured {len(captured)} evidence records.")
+            if fresh:
+                self._invalidate(case_id)
+            # Only the items that got in are logged; the skip count rides along so replay reports it unchanged,
+            # and the capture time so replayed evidence hashes into the same ledger root.
+            self._record("_append", case_id, fresh, {"skipped": skipped, **(metadata or {})}, at)
+            self._resize(case_id)
         return case
 
-    def get_items(self, case_id: str) -> List[ContentItem]:
-        return self.items.get(case_id, [])
+    def get_items(self, case_id: str) -> ItemTable:
+        """The case's item table; index or iterate it to materialize ``ContentItem`` models."""
+        try:
+            return self._case_bulk(case_id).items
+        except KeyError:
+            return ItemTable()
+
+    def get_items_json(self, case_id: str) -> bytes:
+        encoded = self.item_json.get(case_id)
+        if encoded is None:
+            encoded = self.item_json[case_id] = EncodedList()
+        items = self.get_items(case_id)
+        if len(encoded) < len(items):
+            encoded.sync(items)
+            self._resize(case_id)
+        return encoded.json()
+
+    def _page(
+        self,
+        kind: str,
+        case_id: str,
+        count: int,
+        stamps: Callable[[np.ndarray], np.ndarray],
+        ids: Callable[[np.ndarray], List[str]],
+        after: SortKey | None,
+        limit: int,
+    ) -> np.ndarray:
+        index = self.page_indexes.get((kind, case_id))
+        if index is None:
+            index = self.page_indexes.setdefault((kind, case_id), KeysetOrder())
+        if len(index) < count:
+            index.sync(count, stamps, ids)
+            self._resize(case_id)
+        return index.page(after, limit, ids)
+
+    def _page_records(
+        self, kind: str, case_id: str, records: List[Any], stamp: str, after: SortKey | None, limit: int
+    ) -> List[Any]:
+        def stamps(rows: np.ndarray) -> np.ndarray:
+            return np.array([micros(getattr(records[row], stamp)) for row in rows.tolist()], dtype=np.int64)
+
+        def ids(rows: np.ndarray) -> List[str]:
+            return [records[row].id for row in rows.tolist()]
+
+        rows = self._page(kind, case_id, len(records), stamps, ids, after, limit)
+        return [records[row] for row in rows.tolist()]
+
+    def page_items(self, case_id: str, after: SortKey | None, limit: int) -> List[ContentItem]:
+        # Sort row numbers over the item columns so paging never holds materialized items.
+        table = self.get_items(case_id)
+        stamps = table.column("observed_at")
+        return table.take(self._page("items", case_id, len(stamps), stamps.__getitem__, table.ids_at, after, limit))
+
+    def get_accumulator(self, case_id: str) -> CaseAccumulator:
+        return self._case_bulk(case_id).accumulator
+
+    def get_graph(self, case_id: str) -> CaseGraphIndex:
+        return self._case_bulk(case_id).graph
+
+    def start_analysis(self, case_id: str) -> CaseRecord:
+        with self._lock:
+            case = self.get_case(case_id)
+            case.status = Status.analyzing
+            case.updated_at = datetime.now(timezone.utc)
+            self._add_timeline_event(case_id, "analysis_started", "Analysis started.")
+            self._invalidate(case_id)
+            self._record("start_analysis", case_id)
+        return case
 
     def save_analysis(self, case_id: str, score: float, severity: Severity, analysis) -> CaseRecord:
-        case = self.get_case(case_id)
-        case.status = Status.ready
-        case.risk_score = score
-        case.severity = severity
-        case.analysis = analysis
-        case.updated_at = datetime.now(timezone.utc)
-        self._add_timeline_event(
-            case_id,
-            "analysis_completed",
-            f"Analysis completed with score {score:.2f} ({severity.value}).",
-            {"score": score, "severity": severity.value},
-        )
+        with self._lock:
+            case = self.get_case(case_id)
+            case.status = Status.ready
+            case.risk_score = score
+            case.severity = severity
+            case.analysis = analysis
+            case.updated_at = datetime.now(timezone.utc)
+            self._add_timeline_event(
+                case_id,
+                "analysis_completed",
+                f"Analysis completed with score {score:.2f} ({severity.value}).",
+                {"score": score, "severity": severity.value},
+            )
+            self._invalidate(case_id)
+            self._record("save_analysis", case_id, score, severity, analysis)
         return case
 
     def save_alerts(self, case_id: str, alerts: List[AlertRecord]) -> None:
-        self.alerts[case_id] = alerts
-        self._add_timeline_event(case_id, "alerts_generated", f"Generated {len(alerts)} alerts.")
+        with self._lock:
+            self.alerts[case_id] = alerts
+            self._add_timeline_event(case_id, "alerts_generated", f"Generated {len(alerts)} alerts.")
+            self._bump(case_id)
+            self._record("save_alerts", case_id, alerts)
 
     def get_alerts(self, case_id: str) -> List[AlertRecord]:
         return self.alerts.get(case_id, [])
 
-    def save_evidence(self, case_id: str, evidence: List[EvidenceRecord]) -> None:
-        self.evidence[case_id] = evidence
-        self._add_timeline_event(case_id, "evidence_captured", f"Captured {len(evidence)} evidence records.")
-
     def get_evidence(self, case_id: str) -> List[EvidenceRecord]:
-        return self.evidence.get(case_id, [])
+        try:
+            return self._case_bulk(case_id).evidence.records
+        except KeyError:
+            return []
+
+    def page_evidence(self, case_id: str, after: SortKey | None, limit: int) -> List[EvidenceRecord]:
+        return self._page_records("evidence", case_id, self.get_evidence(case_id), "captured_at", after, limit)
+
+    def get_ledger(self, case_id: str) -> EvidenceLedger:
+        return self._case_bulk(case_id).evidence
 
     def save_media_verification(self, case_id: str, results: List[MediaVerificationResult]) -> None:
-        self.media_verifications[case_id] = results
-        self._add_timeline_event(
-            case_id,
-            "media_verified",
-            f"Media verification completed for {len(results)} items.",
-        )
+        self._case_bulk(case_id)
+        with self._writing(case_id):
+            self._locked_bulk(case_id).media_verifications = results
+            self._changed(case_id)
+            self._add_timeline_event(
+                case_id,
+                "media_verified",
+                f"Media verification completed for {len(results)} items.",
+            )
+            self._bump(case_id)
+            self._record("save_media_verification", case_id, results)
+            self._resize(case_id)
 
     def get_media_verification(self, case_id: str) -> List[MediaVerificationResult]:
-        return self.media_verifications.get(case_id, [])
+        try:
+            return self._case_bulk(case_id).media_verifications
+        except KeyError:
+            return []
 
     def save_report(self, case_id: str, report: CaseReport) -> None:
-        self.reports[case_id] = report
-        self._add_timeline_event(case_id, "report_generated", "Executive and technical report generated.")
+        with self._lock:
+            self.reports[case_id] = report
+            self._add_timeline_event(case_id, "report_generated", "Executive and technical report generated.")
+            self._bump(case_id)
+            self._record("save_report", case_id, report)
 
     def get_report(self, case_id: str) -> CaseReport | None:
         return self.reports.get(case_id)
@@ -123,6 +673,37 @@ class InMemoryStore:
     def get_timeline(self, case_id: str) -> List[TimelineEvent]:
         return self.timeline.get(case_id, [])
 
+    def page_timeline(self, case_id: str, after: SortKey | None, limit: int) -> List[TimelineEvent]:
+        return self._page_records("timeline", case_id, self.get_timeline(case_id), "created_at", after, limit)
+
+    def get_changes(
+        self, after: int, limit: int, event_types: Collection[str] | None = None
+    ) -> Tuple[List[ChangeEvent], int]:
+        return self.changes.since(after, limit, event_types)
+
+    def get_change_head(self) -> int:
+        return len(self.changes)
+
+    def get_change_tail(self) -> int:
+        """The oldest cursor ``get_changes`` still accepts."""
+        return self.changes.dropped
+
+    def get_store_stats(self) -> Dict[str, Any]:
+        """Record counts plus a sampled estimate of the bytes held in memory by case data."""
+        resident = dict(self.bulk)
+        evidence = [bulk.evidence.records for bulk in resident.values()]
+        timelines = list(self.timeline.values())
+        spilled = [entry for case_id, entry in list(self.spilled.items()) if case_id not in resident]
+        return {
+            "cases": len(self.cases),
+            "items_per_case": [case.item_count for case in self.cases.values()],
+            "evidence": sum(len(records) for records in evidence) + sum(entry.evidence for entry in spilled),
+            "timeline_events": len(self.changes),
+            "spilled_cases": len(spilled),
+            "size_bytes": sum(bulk.items.nbytes for bulk in resident.values())
+            + sum(estimate_size(records) for records in evidence + timelines),
+        }
+
     def get_global_metrics(self) -> GlobalMetrics:
         all_cases = list(self.cases.values())
         total_cases = len(all_cases)
@@ -137,4 +718,28 @@ class InMemoryStore:
         )
 
 
-store = InMemoryStore()
+def create_store():
+    backend = os.getenv("STORE_BACKEND", "memory")
+    if backend == "memory":
+        threshold = int(os.getenv("INGEST_BLOOM_THRESHOLD", "0"))
+        budget_mb = int(os.getenv("STORE_MEMORY_BUDGET_MB", "0"))
+        return InMemoryStore(
+            bloom_threshold=threshold or None,
+            memory_budget=budget_mb * 1024 * 1024 or None,
+            spill_dir=os.getenv("STORE_SPILL_DIR") or None,
+            data_dir=os.getenv("STORE_DATA_DIR") or None,
+            snapshot_log_bytes=int(os.getenv("STORE_SNAPSHOT_LOG_MB", "8")) * 1024 * 1024,
+            log_fsync=os.getenv("STORE_LOG_FSYNC", "").lower() in {"1", "true", "yes"},
+            change_retention=int(os.getenv("CHANGE_FEED_RETENTION", "100000")),
+        )
+    if backend == "sql":
+        from .sql_store import SQLStore
+
+        return SQLStore(
+            os.getenv("DATABASE_URL", "sqlite:///nexus.db"),
+            pool_size=int(os.getenv("DATABASE_POOL_SIZE", "5")),
+        )
+    raise ValueError(f"Unknown STORE_BACKEND: {backend}")
+
+
+store = create_store()
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Set
+
+from app.analysis import analyze_items
+from app.connectors import build_case_graph
+from app.graph import CaseGraphIndex
+from app.graph_analytics import analyze_graph
+from app.intelligence import build_alerts, build_case_report, build_evidence, verify_media
+from app.lexicon import scan
+from app.media_index import MediaHashIndex
+from app.schemas import AnalysisResult, CaseRecord, ContentItem, GraphAnalytics, Platform, Status
+from app.storage import InMemoryStore
+
+from .synthetic import SyntheticSpec, generate_items
+
+
+DEFAULT_SIZES = (1_000, 10_000)
+# Store-level targets spread the corpus over cases of this size.
+ITEMS_PER_CASE = 100
+# Differences below this many seconds are treated as timer noise when comparing runs.
+MIN_REGRESSION_SECONDS = 0.005
+
+
+@dataclass
+class Fixture:
+    case_id: str
+    items: List[ContentItem]
+    media_index: MediaHashIndex
+    # Flagged at ingest by the case accumulator in the store; computed directly here.
+    suspicious_captions: Set[str]
+    analysis: AnalysisResult
+    graph: GraphAnalytics
+    store: InMemoryStore
+
+
+def build_fixture(size: int, spec: SyntheticSpec) -> Fixture:
+    case_id = f"case_bench_{size}"
+    items = generate_items(case_id, size, spec)
+    media_index = MediaHashIndex()
+    for item in items:
+        if item.media_hash:
+            media_index.add(case_id, item.id, item.media_hash)
+    suspicious_captions = {item.id for item in items if "flag:suspicious-caption" in scan(item.text)}
+    analysis = analyze_items(items)
+
+    store = InMemoryStore()
+    now = datetime.now(timezone.utc)
+    alerts = build_alerts(case_id, analysis)
+    for n in range(max(1, size // ITEMS_PER_CASE)):
+        case = store.create_case(
+            CaseRecord(
+                id=f"case_bench_{size}_{n}",
+                title=f"Benchmark case {n}",
+                query="energy claims",
+                platforms=list(Platform),
+                status=Status.ready,
+                created_at=now,
+                updated_at=now,
+                item_count=ITEMS_PER_CASE,
+                risk_score=analysis.score,
+                severity=analysis.severity,
+                analysis=analysis,
+            )
+        )
+        store.save_alerts(case.id, alerts)
+    graph = analyze_graph(CaseGraphIndex().add(items))
+    return Fixture(case_id, items, media_index, suspicious_captions, analysis, graph, store)
+
+
+TARGETS: Dict[str, Callable[[Fixture], Any]] = {
+    "analyze_items": lambda f: analyze_items(f.items),
+    "build_case_graph": lambda f: build_case_graph(f.items),
+    "verify_media": lambda f: verify_media(f.items, f.media_index, suspicious_captions=f.suspicious_captions),
+    "build_evidence": lambda f: build_evidence(f.case_id, f.items),
+    "build_case_report": lambda f: build_case_report(f.case_id, f.analysis, f.items, f.graph),
+    "InMemoryStore.list_cases": lambda f: f.store.list_cases(),
+    "get_global_metrics": lambda f: f.store.get_global_metrics(),
+}
+
+
+def measure(target: Callable[[Fixture], Any], fixture: Fixture, repeat: int, memory: bool) -> Dict[str, Any]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        target(fixture)
+        timings.append(time.perf_counter() - started)
+    result: Dict[str, Any] = {
+        "seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "repeat": repeat,
+    }
+    if memory:
+        # Separate pass: tracemalloc slows allocation-heavy code too much to time under it.
+        gc.collect()
+        tracemalloc.start()
+        target(fixture)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run(
+    sizes: List[int], targets: List[str], spec: SyntheticSpec, repeat: int | None = None, memory: bool = True
+) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        fixture = build_fixture(size, spec)
+        for name in targets:
+            runs = repeat or (5 if size <= 10_000 else 1)
+            results.append({"target": name, "items": size, **measure(TARGETS[name], fixture, runs, memory)})
+            print(f"{name:<26} {size:>9,} items  {results[-1]['seconds'] * 1000:>11.2f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "spec": {
+                key: getattr(spec, key)
+                for key in ("author_ratio", "media_ratio", "media_reuse", "duplicate_ratio", "seed")
+            },
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Return the (target, size) entries slower or hungrier than the baseline by more than ``tolerance``."""
+    previous = {(entry["target"], entry["items"]): entry for entry in baseline["results"]}
+    regressions: List[Dict[str, Any]] = []
+    for entry in current["results"]:
+        before = previous.get((entry["target"], entry["items"]))
+        if before is None:
+            continue
+        for metric, floor in (("seconds", MIN_REGRESSION_SECONDS), ("peak_bytes", 0)):
+            if metric not in entry or metric not in before:
+                continue
+            if entry[metric] > before[metric] * (1 + tolerance) and entry[metric] - before[metric] > floor:
+                regressions.append(
+                    {
+                        "target": entry["target"],
+                        "items": entry["items"],
+                        "metric": metric,
+                        "baseline": before[metric],
+                        "current": entry[metric],
+                        "ratio": round(entry[metric] / before[metric], 3) if before[metric] else None,
+                    }
+                )
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Pipeline scaling benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated item counts")
+    parser.add_argument("--targets", default=",".join(TARGETS), help="comma-separated subset of targets")
+    parser.add_argument("--repeat", type=int, help="timed runs per target (default 5 up to 10k items, else 1)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")
+    parser.add_argument("--seed", type=int, default=SyntheticSpec.seed)
+    parser.add_argument("--duplicate-ratio", type=float, default=SyntheticSpec.duplicate_ratio)
+    parser.add_argument("--author-ratio", type=float, default=SyntheticSpec.author_ratio)
+    parser.add_argument("--media-ratio", type=float, default=SyntheticSpec.media_ratio)
+    parser.add_argument("--media-reuse", type=float, default=SyntheticSpec.media_reuse)
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="results JSON to compare against; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio over the baseline")
+    args = parser.parse_args(argv)
+
+    targets = [name.strip() for name in args.targets.split(",") if name.strip()]
+    unknown = sorted(set(targets) - set(TARGETS))
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(unknown)}")
+    spec = SyntheticSpec(
+        author_ratio=args.author_ratio,
+        media_ratio=args.media_ratio,
+        media_reuse=args.media_reuse,
+        duplicate_ratio=args.duplicate_ratio,
+        seed=args.seed,
+    )
+    report = run([int(size) for size in args.sizes.split(",")], targets, spec, args.repeat, not args.no_memory)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['target']} @ {regression['items']:,} items: {regression['metric']} "
+                f"{regression['baseline']} -> {regression['current']}",
+                file=sys.stderr,
+            )
+        status = 1 if regressions else 0
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+    return status
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from hashlib import sha1
+from typing import Dict, List
+
+from app.connectors import SEED_TEXT, _entity_extract
+from app.schemas import ContentItem, Platform
+
+
+ARABIC_TEXT = [
+    "حملة منظمة تنشر مزاعم دون مصدر حول قطاع الطاقة",
+    "منشور معاد نشره مع صورة قديمة وتعليق غير موثق",
+    "تقارير عن ضحايا لا يمكن التحقق منها تنتشر بسرعة",
+    "حسابات متعددة تتزامن في نشر نفس الادعاء",
+]
+FRENCH_TEXT = [
+    "Des comptes coordonnés relaient la même affirmation sans source",
+    "Une vidéo recyclée circule avec une légende trompeuse",
+]
+FILLER = ["energy", "policy", "mena", "regional", "report", "update", "breaking", "thread", "video", "claims"]
+
+
+@dataclass
+class SyntheticSpec:
+    """Shape of a generated case; defaults mirror the seeded connectors at scale."""
+
+    platform_mix: Dict[Platform, float] = field(
+        default_factory=lambda: {
+            Platform.x: 0.35,
+            Platform.telegram: 0.25,
+            Platform.youtube: 0.15,
+            Platform.instagram: 0.15,
+            Platform.web: 0.10,
+        }
+    )
+    language_mix: Dict[str, float] = field(default_factory=lambda: {"ar": 0.5, "en": 0.4, "fr": 0.1})
+    # Distinct authors as a fraction of items; lower means heavier account reuse.
+    author_ratio: float = 0.2
+    # Fraction of items carrying a media hash, and of those, how many reuse an earlier hash.
+    media_ratio: float = 0.4
+    media_reuse: float = 0.3
+    # Fraction of items whose text is copied (with a small edit) from an earlier item.
+    duplicate_ratio: float = 0.15
+    seed: int = 7
+
+
+def _pick(rng: random.Random, weights: Dict, count: int) -> List:
+    return rng.choices(list(weights), weights=list(weights.values()), k=count)
+
+
+def _text(rng: random.Random, platform: Platform, language: str) -> str:
+    if language == "ar":
+        base = rng.choice(ARABIC_TEXT)
+    elif language == "fr":
+        base = rng.choice(FRENCH_TEXT)
+    else:
+        base = rng.choice(SEED_TEXT[platform])
+    return f"{base} {' '.join(rng.sample(FILLER, 3))} #{rng.randrange(10_000)}"
+
+
+def generate_items(case_id: str, count: int, spec: SyntheticSpec | None = None) -> List[ContentItem]:
+    """``collect_platform_items``-shaped items with controllable platform, language and reuse mix."""
+    spec = spec or SyntheticSpec()
+    rng = random.Random(f"{spec.seed}:{case_id}:{count}")
+    now = datetime.now(timezone.utc)
+    platforms = _pick(rng, spec.platform_mix, count)
+    languages = _pick(rng, spec.language_mix, count)
+    authors = max(1, int(count * spec.author_ratio))
+    texts: List[str] = []
+    hashes: List[int] = []
+    items: List[ContentItem] = []
+    for i in range(count):
+        platform, language = platforms[i], languages[i]
+        if texts and rng.random() < spec.duplicate_ratio:
+            text = f"{rng.choice(texts)} {rng.choice(FILLER)}"
+        else:
+            text = _text(rng, platform, language)
+        texts.append(text)
+
+        media_hash = None
+        if rng.random() < spec.media_ratio:
+            if hashes and rng.random() < spec.media_reuse:
+                # Re-encoded copies differ from the original by a few bits.
+                value = rng.choice(hashes)
+                for _ in range(rng.randrange(4)):
+                    value ^= 1 << rng.randrange(64)
+            else:
+                value = rng.getrandbits(64)
+            hashes.append(value)
+            media_hash = f"{value:016x}"
+
+        author = f"{platform.value}_account_{rng.randrange(authors)}"
+        fingerprint = sha1(f"{case_id}:{i}:{author}:{text}".encode("utf-8")).hexdigest()[:12]
+        items.append(
+            ContentItem(
+                id=f"itm_{platform.value}_{fingerprint}",
+                case_id=case_id,
+                platform=platform,
+                author=author,
+                text=text,
+                url=f"https://intel.local/{platform.value}/{fingerprint}",
+                observed_at=now - timedelta(seconds=rng.randrange(7 * 24 * 3600)),
+                language=language,
+                engagement=int(rng.paretovariate(1.2) * 50),
+                source_name=f"{platform.value}-collector",
+                media_hash=media_hash,
+                narrative_key="energy-claims-wave" if "claims" in text.lower() else "coordinated-amplification",
+                entities=_entity_extract(text),
+            )
+        )
+    return items
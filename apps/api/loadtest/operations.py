@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+
+PLATFORMS = ["x", "telegram", "youtube", "instagram", "web"]
+QUERIES = ["energy claims", "border incident", "election rumours", "water shortage", "port strike"]
+
+
+@dataclass
+class Sample:
+    route: str
+    status: int
+    latency: float
+
+
+@dataclass
+class Session:
+    """What an operation needs: the client, the shared case pool and somewhere to record samples.
+
+    ``route`` is the template samples are grouped under, so ``/cases/{case_id}/collect``
+    reports as one row however many cases the run touches.
+    """
+
+    client: httpx.AsyncClient
+    rng: random.Random
+    options: Dict[str, Any]
+    case_ids: List[str] = field(default_factory=list)
+    samples: List[Sample] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    async def request(
+        self, method: str, route: str, started: float | None = None, **kwargs: Any
+    ) -> httpx.Response | None:
+        """Send one request and record its latency, measured from ``started`` when given.
+
+        Open-loop operations pass their scheduled arrival time so that time spent
+        queued behind a saturated connection pool counts against the route.
+        """
+        path = route.format(case_id=kwargs.pop("case_id", ""))
+        begin = time.perf_counter() if started is None else started
+        key = f"{method} {route}"
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except httpx.HTTPError as exc:
+            self.errors[f"{key}: {type(exc).__name__}"] += 1
+            self.samples.append(Sample(key, 0, time.perf_counter() - begin))
+            return None
+        self.samples.append(Sample(key, response.status_code, time.perf_counter() - begin))
+        return response
+
+    def pick_case(self) -> str:
+        return self.rng.choice(self.case_ids)
+
+    def new_case_payload(self) -> Dict[str, Any]:
+        number = self.rng.randrange(1_000_000)
+        return {
+            "title": f"Load test case {number}",
+            "query": self.rng.choice(QUERIES),
+            "platforms": self.rng.sample(PLATFORMS, self.rng.randint(1, len(PLATFORMS))),
+        }
+
+
+Operation = Callable[[Session, float], Awaitable[None]]
+
+
+async def dashboard(session: Session, started: float) -> None:
+    """The dashboard's first paint: overview panels, the case list, then one case bundle."""
+    await asyncio.gather(
+        *(
+            session.request("GET", route, started)
+            for route in ("/api/v1/metrics", "/api/v1/connectors", "/api/v1/source-catalog", "/api/v1/cases")
+        )
+    )
+    items_limit = session.options.get("bundle_items_limit", 200)
+    await session.request(
+        "GET", "/api/v1/cases/{case_id}/bundle", case_id=session.pick_case(), params={"items_limit": items_limit}
+    )
+
+
+async def poll_cases(session: Session, started: float) -> None:
+    """The analyze worker's catch-up query."""
+    params = {"status": ["collecting", "analyzing"], "min_items": 1}
+    await session.request("GET", "/api/v1/cases", started, params=params)
+
+
+async def collect(session: Session, started: float) -> None:
+    await session.request("POST", "/api/v1/cases/{case_id}/collect", started, case_id=session.pick_case())
+
+
+async def analyze(session: Session, started: float) -> None:
+    await session.request("POST", "/api/v1/cases/{case_id}/analyze", started, case_id=session.pick_case())
+
+
+async def run_all(session: Session, started: float) -> None:
+    await session.request("POST", "/api/v1/cases/{case_id}/run-all", started, case_id=session.pick_case())
+
+
+async def create_case(session: Session, started: float) -> None:
+    response = await session.request("POST", "/api/v1/cases", started, json=session.new_case_payload())
+    if response is not None and response.status_code == 200:
+        session.case_ids.append(response.json()["id"])
+
+
+async def bulk_create(session: Session, started: float) -> None:
+    cases = [session.new_case_payload() for _ in range(session.options.get("bulk_size", 50))]
+    response = await session.request("POST", "/api/v1/cases:batchCreate", started, json={"cases": cases})
+    if response is not None and response.status_code == 200:
+        session.case_ids.extend(result["case_id"] for result in response.json()["results"] if result["case"])
+
+
+OPERATIONS: Dict[str, Operation] = {
+    "dashboard": dashboard,
+    "poll_cases": poll_cases,
+    "collect": collect,
+    "analyze": analyze,
+    "run_all": run_all,
+    "create_case": create_case,
+    "bulk_create": bulk_create,
+}
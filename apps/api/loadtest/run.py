@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import httpx
+
+from .operations import OPERATIONS, Sample, Session
+
+
+API_DIR = Path(__file__).resolve().parents[1]
+SCENARIO_DIR = Path(__file__).resolve().parent / "scenarios"
+# Seeding goes through the batch endpoints, which cap each call at this many cases.
+BATCH_LIMIT = 500
+# Latency differences below this many seconds are treated as noise when comparing runs.
+MIN_REGRESSION_SECONDS = 0.005
+# Error rates may rise by this much (absolute) before a comparison flags them.
+MAX_ERROR_RATE_INCREASE = 0.01
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class Stage:
+    duration: float
+    rate: float
+
+
+@dataclass
+class Scenario:
+    """A traffic script: arrival-rate stages, a weighted operation mix and the cases to seed first."""
+
+    name: str
+    stages: List[Stage]
+    mix: Dict[str, float]
+    seed_cases: int = 20
+    seed: int = 7
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Scenario":
+        unknown = sorted(set(data.get("mix", {})) - set(OPERATIONS))
+        if unknown:
+            raise ValueError(f"unknown operations in mix: {', '.join(unknown)}")
+        if not any(weight > 0 for weight in data.get("mix", {}).values()):
+            raise ValueError("mix needs at least one operation with a positive weight")
+        return cls(
+            name=data.get("name", "scenario"),
+            stages=[Stage(float(stage["duration"]), float(stage["rate"])) for stage in data["stages"]],
+            mix={name: float(weight) for name, weight in data["mix"].items()},
+            seed_cases=int(data.get("seed_cases", 20)),
+            seed=int(data.get("seed", 7)),
+            options=dict(data.get("options", {})),
+        )
+
+    def scaled(self, rate_scale: float) -> "Scenario":
+        stages = [Stage(stage.duration, stage.rate * rate_scale) for stage in self.stages]
+        return Scenario(self.name, stages, self.mix, self.seed_cases, self.seed, self.options)
+
+
+def load_scenario(name_or_path: str) -> Scenario:
+    """Read a scenario file, or one of the bundled ``scenarios/<name>.json``."""
+    path = Path(name_or_path)
+    if not path.exists():
+        path = SCENARIO_DIR / f"{name_or_path}.json"
+    with open(path, encoding="utf-8") as handle:
+        return Scenario.from_dict(json.load(handle))
+
+
+async def seed(client: httpx.AsyncClient, count: int) -> List[str]:
+    """Create and run-all ``count`` cases so reads and re-analysis have data to work on."""
+    case_ids: List[str] = []
+    for start in range(0, count, BATCH_LIMIT):
+        cases = [
+            {"title": f"Load test seed {n}", "query": "energy claims", "platforms": ["x", "telegram", "web"]}
+            for n in range(start, min(count, start + BATCH_LIMIT))
+        ]
+        response = await client.post("/api/v1/cases:batchCreate", json={"cases": cases})
+        response.raise_for_status()
+        batch = [result["case_id"] for result in response.json()["results"] if result["case"]]
+        for action in ("batchCollect", "batchAnalyze"):
+            (await client.post(f"/api/v1/cases:{action}", json={"case_ids": batch})).raise_for_status()
+        case_ids += batch
+    return case_ids
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> List[Dict[str, Any]]:
+    """One row per route, plus a ``total`` row: throughput, status counts and latency percentiles."""
+    by_route: Dict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_route[sample.route].append(sample)
+    rows: List[Dict[str, Any]] = []
+    for route, group in sorted(by_route.items()) + [("total", samples)]:
+        latencies = sorted(sample.latency for sample in group)
+        statuses: Dict[str, int] = defaultdict(int)
+        for sample in group:
+            statuses[str(sample.status)] += 1
+        failed = sum(1 for sample in group if sample.status == 0 or sample.status >= 500)
+        rows.append(
+            {
+                "route": route,
+                "requests": len(group),
+                "throughput": round(len(group) / elapsed, 3) if elapsed else 0.0,
+                "error_rate": round(failed / len(group), 4) if group else 0.0,
+                "statuses": dict(sorted(statuses.items())),
+                **{f"p{pct}_ms": round(percentile(latencies, pct) * 1000, 2) for pct in PERCENTILES},
+                "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            }
+        )
+    return rows
+
+
+async def drive(client: httpx.AsyncClient, scenario: Scenario) -> Dict[str, Any]:
+    """Seed the API, then replay the scenario open-loop and summarize what came back.
+
+    Arrivals follow a Poisson process at each stage's rate and are started on
+    schedule whether or not earlier requests have finished, so a server that
+    falls behind shows up as growing latency rather than a politely slower
+    client. Latency is measured from the scheduled arrival.
+    """
+    rng = random.Random(scenario.seed)
+    session = Session(client, rng, scenario.options, await seed(client, scenario.seed_cases))
+    names = list(scenario.mix)
+    weights = [scenario.mix[name] for name in names]
+    tasks: set[asyncio.Task] = set()
+    offered: Dict[str, int] = defaultdict(int)
+
+    started = time.perf_counter()
+    next_at = started
+    stage_end = started
+    for stage in scenario.stages:
+        stage_end += stage.duration
+        if stage.rate <= 0:
+            next_at = stage_end
+            await asyncio.sleep(max(0.0, stage_end - time.perf_counter()))
+            continue
+        while True:
+            next_at += rng.expovariate(stage.rate)
+            if next_at >= stage_end:
+                next_at = stage_end
+                break
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+            name = rng.choices(names, weights)[0]
+            offered[name] += 1
+            task = asyncio.create_task(OPERATIONS[name](session, next_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    arrivals_done = time.perf_counter()
+
+    unfinished = 0
+    if tasks:
+        _, pending = await asyncio.wait(set(tasks), timeout=scenario.options.get("drain_timeout", 60))
+        unfinished = len(pending)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "scenario": scenario.name,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "stages": [{"duration": stage.duration, "rate": stage.rate} for stage in scenario.stages],
+            "seed_cases": scenario.seed_cases,
+            "elapsed_seconds": round(elapsed, 3),
+            "arrival_seconds": round(arrivals_done - started, 3),
+        },
+        "offered": dict(sorted(offered.items())),
+        "unfinished": unfinished,
+        "errors": dict(sorted(session.errors.items())),
+        "routes": summarize(session.samples, elapsed),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve(port: int = 0, workers: int = 1, startup_timeout: float = 30.0) -> Iterator[str]:
+    """Run ``app.main:app`` under uvicorn in a subprocess and yield its base URL once healthy."""
+    port = port or _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+    ]  # fmt: skip
+    process = subprocess.Popen(command, cwd=API_DIR, env=os.environ.copy())
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            try:
+                if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn did not become healthy within {startup_timeout}s")
+            time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+async def run(base_url: str, scenario: Scenario) -> Dict[str, Any]:
+    max_connections = int(scenario.options.get("max_connections", 100))
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    timeout = float(scenario.options.get("timeout", 60))
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        return await drive(client, scenario)
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Routes whose p95 latency grew by more than ``tolerance`` or whose error rate rose, against the baseline."""
+    previous = {row["route"]: row for row in baseline["routes"]}
+    regressions: List[Dict[str, Any]] = []
+    for row in current["routes"]:
+        before = previous.get(row["route"])
+        if before is None:
+            continue
+        checks = (
+            ("p95_ms", row["p95_ms"] > before["p95_ms"] * (1 + tolerance)
+             and row["p95_ms"] - before["p95_ms"] > MIN_REGRESSION_SECONDS * 1000),
+            ("error_rate", row["error_rate"] > before["error_rate"] + MAX_ERROR_RATE_INCREASE),
+        )  # fmt: skip
+        for metric, worse in checks:
+            if worse:
+                regressions.append(
+                    {"route": row["route"], "metric": metric, "baseline": before[metric], "current": row[metric]}
+                )
+    return regressions
+
+
+def _print_table(report: Dict[str, Any]) -> None:
+    print(
+        f"{'route':<48} {'reqs':>7} {'req/s':>8} {'err%':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+        file=sys.stderr,
+    )
+    for row in report["routes"]:
+        print(
+            f"{row['route']:<48} {row['requests']:>7} {row['throughput']:>8.2f} {row['error_rate'] * 100:>6.2f} "
+            f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}",
+            file=sys.stderr,
+        )
+    if report["unfinished"]:
+        print(f"{report['unfinished']} operations still running at the drain timeout", file=sys.stderr)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Open-loop HTTP load test.")
+    parser.add_argument("scenario", nargs="?", default="mixed", help="scenario JSON path or bundled name")
+    parser.add_argument("--url", help="target a running API instead of booting a local uvicorn")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes for the local server")
+    parser.add_argument("--port", type=int, default=0, help="port for the local server (default: any free port)")
+    parser.add_argument("--rate-scale", type=float, default=1.0, help="multiply every stage's arrival rate")
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="results JSON to compare against; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 growth ratio over the baseline")
+    args = parser.parse_args(argv)
+
+    try:
+        scenario = load_scenario(args.scenario).scaled(args.rate_scale)
+    except (OSError, ValueError, KeyError) as exc:
+        parser.error(f"cannot load scenario {args.scenario!r}: {exc}")
+
+    if args.url:
+        report = asyncio.run(run(args.url, scenario))
+    else:
+        with serve(args.port, args.workers) as base_url:
+            report = asyncio.run(run(base_url, scenario))
+    _print_table(report)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['route']}: {regression['metric']} "
+                f"{regression['baseline']} -> {regression['current']}",
+                file=sys.stderr,
+            )
+        status = 1 if regressions else 0
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+    return status
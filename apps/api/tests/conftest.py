@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import pytest
+
+from app.schemas import CaseRecord, Platform, Status
+
+
+@pytest.fixture
+def make_case() -> Callable[..., CaseRecord]:
+    """Build draft case records; keyword arguments override any field."""
+
+    def make(case_id: str, **fields: Any) -> CaseRecord:
+        now = datetime.now(timezone.utc)
+        values = {
+            "id": case_id,
+            "title": "Test case",
+            "query": "energy claims",
+            "platforms": list(Platform),
+            "status": Status.draft,
+            "created_at": now,
+            "updated_at": now,
+        }
+        return CaseRecord(**{**values, **fields})
+
+    return make
@@ -1,6 +1,9 @@
 from fastapi.testclient import TestClient
 
+from app.changes import ChangeLog
 from app.main import app
+from app.schemas import CaseBundle, CaseRecord, ContentItem
+from app.storage import InMemoryStore, store
 
 
 client = TestClient(app)
@@ -20,7 +23,11 @@ def test_case_flow() -> None:
 
     collect_resp = client.post(f"/api/v1/cases/{case_id}/collect")
     assert collect_resp.status_code == 200
-    assert collect_resp.json()["item_count"] > 0
+    item_count = collect_resp.json()["item_count"]
+    assert item_count > 0
+
+    recollect_resp = client.post(f"/api/v1/cases/{case_id}/collect")
+    assert recollect_resp.json()["item_count"] == item_count
 
     analyze_resp = client.post(f"/api/v1/cases/{case_id}/analyze")
     assert analyze_resp.status_code == 200
@@ -31,6 +38,17 @@ def test_case_flow() -> None:
     assert graph_resp.status_code == 200
     assert len(graph_resp.json()["nodes"]) > 0
 
+    subgraph_resp = client.get(
+        f"/api/v1/cases/{case_id}/graph/subgraph",
+        params={"seeds": "platform:telegram", "hops": 2, "max_nodes": 10},
+    )
+    assert subgraph_resp.status_code == 200
+    assert subgraph_resp.json()["nodes"][0]["id"] == "platform:telegram"
+
+    duplicates_resp = client.get(f"/api/v1/cases/{case_id}/duplicates")
+    assert duplicates_resp.status_code == 200
+    assert all(cluster["size"] > 1 for cluster in duplicates_resp.json())
+
     items_resp = client.get(f"/api/v1/cases/{case_id}/items")
     assert items_resp.status_code == 200
     assert len(items_resp.json()) > 0
@@ -43,9 +61,19 @@ def test_case_flow() -> None:
     assert evidence_resp.status_code == 200
     assert len(evidence_resp.json()) > 0
 
+    evidence_id = evidence_resp.json()[0]["id"]
+    root_resp = client.get(f"/api/v1/cases/{case_id}/evidence/root")
+    assert root_resp.json()["leaf_count"] == len(evidence_resp.json())
+    proof_resp = client.get(f"/api/v1/cases/{case_id}/evidence/{evidence_id}/proof")
+    assert proof_resp.status_code == 200
+    assert proof_resp.json()["root_hash"] == root_resp.json()["root_hash"]
+
     timeline_resp = client.get(f"/api/v1/cases/{case_id}/timeline")
     assert timeline_resp.status_code == 200
     assert len(timeline_resp.json()) > 0
+    recollect_event = [e for e in timeline_resp.json() if e["event_type"] == "collection_completed"][1]
+    assert recollect_event["metadata"]["inserted"] == 0
+    assert recollect_event["metadata"]["skipped"] == item_count
 
     report_resp = client.get(f"/api/v1/cases/{case_id}/report")
     assert report_resp.status_code == 200
@@ -54,6 +82,27 @@ def test_case_flow() -> None:
     media_resp = client.get(f"/api/v1/cases/{case_id}/media-verification")
     assert media_resp.status_code == 200
 
+    media_hash = next(item["media_hash"] for item in items_resp.json() if item["media_hash"])
+    lookup_resp = client.get("/api/v1/media/lookup", params={"media_hash": media_hash, "max_distance": 2})
+    assert lookup_resp.status_code == 200
+    assert any(match["case_id"] == case_id and match["distance"] == 0 for match in lookup_resp.json())
+
+
+def test_recollect_that_inserts_nothing_leaves_an_analyzed_case_ready() -> None:
+    case_id = client.post(
+        "/api/v1/cases", json={"title": "Quiet recollect", "query": "quiet narrative", "platforms": ["x", "web"]}
+    ).json()["id"]
+    client.post(f"/api/v1/cases/{case_id}/collect")
+    analyzed = client.post(f"/api/v1/cases/{case_id}/analyze").json()
+    etag = client.get(f"/api/v1/cases/{case_id}").headers["etag"]
+
+    recollected = client.post(f"/api/v1/cases/{case_id}/collect").json()
+    assert recollected["status"] == "ready"
+    assert recollected["updated_at"] == analyzed["updated_at"]
+    assert client.get(f"/api/v1/cases/{case_id}", headers={"If-None-Match": etag}).status_code == 304
+    event = client.get(f"/api/v1/cases/{case_id}/timeline").json()[-1]
+    assert (event["event_type"], event["metadata"]["inserted"]) == ("collection_completed", 0)
+
 
 def test_global_catalog_and_connectors() -> None:
     metrics = client.get("/api/v1/metrics")
@@ -67,3 +116,189 @@ def test_global_catalog_and_connectors() -> None:
     catalog = client.get("/api/v1/source-catalog")
     assert catalog.status_code == 200
     assert len(catalog.json()) > 0
+
+
+def test_cursor_pagination_and_ndjson_stream() -> None:
+    case_id = client.post(
+        "/api/v1/cases",
+        json={"title": "Paginated case review", "query": "paged narrative", "platforms": ["x", "web", "telegram"]},
+    ).json()["id"]
+    client.post(f"/api/v1/cases/{case_id}/collect")
+    full = client.get(f"/api/v1/cases/{case_id}/items").json()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 5, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/api/v1/cases/{case_id}/items", params=params)
+        assert page.status_code == 200
+        seen.extend(page.json())
+        cursor = page.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert sorted(item["id"] for item in seen) == sorted(item["id"] for item in full)
+    keys = [(item["observed_at"], item["id"]) for item in seen]
+    assert keys == sorted(keys)
+
+    stream = client.get(f"/api/v1/cases/{case_id}/timeline", headers={"Accept": "application/x-ndjson"})
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    assert len(stream.text.splitlines()) == len(client.get(f"/api/v1/cases/{case_id}/timeline").json())
+
+    assert client.get(f"/api/v1/cases/{case_id}/evidence", params={"cursor": "%%%"}).status_code == 400
+
+
+def test_fast_json_reads_match_models_and_track_changes() -> None:
+    case = client.post(
+        "/api/v1/cases",
+        json={"title": "Encoded case cache", "query": "cache narrative", "platforms": ["x"]},
+    ).json()
+    listed = {c["id"]: c for c in client.get("/api/v1/cases").json()}
+    assert CaseRecord.model_validate(listed[case["id"]]).status.value == "draft"
+
+    client.post(f"/api/v1/cases/{case['id']}/collect")
+    listed = {c["id"]: c for c in client.get("/api/v1/cases").json()}
+    assert listed[case["id"]]["status"] == "collecting"
+    assert client.get(f"/api/v1/cases/{case['id']}").json()["item_count"] == listed[case["id"]]["item_count"]
+    items = client.get(f"/api/v1/cases/{case['id']}/items").json()
+    assert [ContentItem.model_validate(item).id for item in items]
+
+    active = client.get("/api/v1/cases", params={"status": ["collecting", "analyzing"], "min_items": 1}).json()
+    assert case["id"] in {c["id"] for c in active}
+    assert all(c["status"] in ("collecting", "analyzing") and c["item_count"] >= 1 for c in active)
+    assert case["id"] not in {c["id"] for c in client.get("/api/v1/cases", params={"status": "draft"}).json()}
+
+    schema = client.get("/openapi.json").json()
+    listing = schema["paths"]["/api/v1/cases"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert listing["items"]["$ref"].endswith("/CaseRecord")
+
+
+def test_conditional_get_with_case_etags() -> None:
+    case_id = client.post(
+        "/api/v1/cases",
+        json={"title": "ETag case", "query": "etag narrative", "platforms": ["telegram"]},
+    ).json()["id"]
+
+    first = client.get(f"/api/v1/cases/{case_id}/items")
+    etag = first.headers["etag"]
+    cached = client.get(f"/api/v1/cases/{case_id}/items", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    client.post(f"/api/v1/cases/{case_id}/collect")
+    fresh = client.get(f"/api/v1/cases/{case_id}/items", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert fresh.json()
+
+    case_etag = client.get(f"/api/v1/cases/{case_id}").headers["etag"]
+    client.post(f"/api/v1/cases/{case_id}/analyze")
+    assert client.get(f"/api/v1/cases/{case_id}", headers={"If-None-Match": case_etag}).status_code == 200
+
+    listing = client.get("/api/v1/cases")
+    assert client.get("/api/v1/cases", headers={"If-None-Match": listing.headers["etag"]}).status_code == 304
+
+    # A restarted store counts versions from scratch under a new epoch, so tags from before never match.
+    assert store.epoch in case_etag and store.epoch in listing.headers["etag"]
+    assert InMemoryStore().epoch != store.epoch
+    assert client.get("/api/v1/cases/missing/items", headers={"If-None-Match": "*"}).status_code == 404
+
+
+def test_change_feed_and_event_stream() -> None:
+    head = client.get("/api/v1/changes/head").json()["head"]
+    assert head == client.get("/api/v1/changes", params={"since": 10**9}).json()["cursor"]
+    case_id = client.post(
+        "/api/v1/cases",
+        json={"title": "Feed case", "query": "feed narrative", "platforms": ["x"]},
+    ).json()["id"]
+    client.post(f"/api/v1/cases/{case_id}/collect")
+
+    page = client.get("/api/v1/changes", params={"since": head}).json()
+    assert [(c["case_id"], c["event_type"]) for c in page["changes"]][:2] == [
+        (case_id, "case_created"),
+        (case_id, "collection_completed"),
+    ]
+    assert page["cursor"] == page["changes"][-1]["seq"]
+
+    filtered = client.get("/api/v1/changes", params={"since": head, "types": "collection_completed"}).json()
+    assert [c["event_type"] for c in filtered["changes"]] == ["collection_completed"]
+    assert filtered["cursor"] == page["cursor"]
+    assert client.get("/api/v1/changes", params={"since": page["cursor"]}).json()["changes"] == []
+
+    stream = client.get(
+        "/api/v1/changes/stream",
+        params={"since": head, "types": ["case_created", "collection_completed"], "limit": 2},
+    )
+    assert stream.headers["content-type"].startswith("text/event-stream")
+    frames = [frame for frame in stream.text.split("\n\n") if frame]
+    assert [frame.splitlines()[1] for frame in frames] == ["event: case_created", "event: collection_completed"]
+    assert frames[0].splitlines()[0] == f"id: {page['changes'][0]['seq']}"
+
+
+def test_change_feed_rejects_cursors_outside_the_retained_window(monkeypatch) -> None:
+    monkeypatch.setattr(store, "changes", ChangeLog(retention=4))
+    for n in range(6):
+        client.post("/api/v1/cases", json={"title": f"Retention case {n}", "query": "retention", "platforms": ["x"]})
+
+    expired = client.get("/api/v1/changes", params={"since": 0})
+    assert expired.status_code == 410
+    oldest = expired.json()["detail"]["oldest"]
+    assert oldest == 2
+    assert client.get("/api/v1/changes/stream", params={"since": 1}).status_code == 410
+
+    page = client.get("/api/v1/changes", params={"since": oldest}).json()
+    assert [change["seq"] for change in page["changes"]] == [3, 4, 5, 6]
+    assert page["cursor"] == 6
+    assert client.get("/api/v1/changes/head").json() == {"head": 6, "tail": 2}
+
+
+def test_batch_create_collect_and_analyze() -> None:
+    created = client.post(
+        "/api/v1/cases:batchCreate",
+        json={"cases": [{"title": f"Batch case {n}", "query": "batch narrative", "platforms": ["x"]} for n in range(3)]},
+    ).json()
+    assert created["succeeded"] == 3 and created["failed"] == 0
+    case_ids = [result["case_id"] for result in created["results"]]
+
+    collected = client.post("/api/v1/cases:batchCollect", json={"case_ids": case_ids + [case_ids[0], "missing"]}).json()
+    assert (collected["succeeded"], collected["failed"]) == (3, 1)
+    assert [result["case_id"] for result in collected["results"]] == case_ids + ["missing"]
+    assert collected["results"][-1]["status_code"] == 404
+    assert all(result["case"]["item_count"] > 0 for result in collected["results"][:3])
+
+    analyzed = client.post("/api/v1/cases:batchAnalyze", json={"case_ids": case_ids}).json()
+    assert analyzed["succeeded"] == 3
+    assert all(client.get(f"/api/v1/cases/{case_id}").json()["status"] == "ready" for case_id in case_ids)
+    assert client.post("/api/v1/cases:batchAnalyze", json={"case_ids": []}).status_code == 422
+
+
+def test_case_bundle_sections_match_individual_endpoints() -> None:
+    case_id = client.post(
+        "/api/v1/cases",
+        json={"title": "Bundle case", "query": "bundle narrative", "platforms": ["x", "telegram"]},
+    ).json()["id"]
+    client.post(f"/api/v1/cases/{case_id}/run-all")
+
+    bundle = client.get(f"/api/v1/cases/{case_id}/bundle")
+    assert bundle.status_code == 200
+    full = bundle.json()
+    assert CaseBundle.model_validate(full).case.id == case_id
+    for section, path in [
+        ("items", "items"),
+        ("graph", "graph"),
+        ("alerts", "alerts"),
+        ("evidence", "evidence"),
+        ("timeline", "timeline"),
+        ("media_verification", "media-verification"),
+        ("report", "report"),
+    ]:
+        assert full[section] == client.get(f"/api/v1/cases/{case_id}/{path}").json()
+
+    partial = client.get(f"/api/v1/cases/{case_id}/bundle", params={"include": "alerts,items", "items_limit": 2}).json()
+    assert set(partial) == {"case", "version", "alerts", "items", "items_cursor"}
+    assert len(partial["items"]) == 2
+    assert partial["version"] == full["version"]
+
+    etag = bundle.headers["etag"]
+    assert client.get(f"/api/v1/cases/{case_id}/bundle", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(f"/api/v1/cases/{case_id}/bundle", params={"include": "secrets"}).status_code == 400
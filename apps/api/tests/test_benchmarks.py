@@ -0,0 +1,24 @@
+from benchmarks.run import TARGETS, compare, run
+from benchmarks.synthetic import SyntheticSpec, generate_items
+
+
+def test_synthetic_generator_honours_reuse_knobs() -> None:
+    spec = SyntheticSpec(author_ratio=0.05, media_ratio=1.0, media_reuse=0.5, duplicate_ratio=0.5)
+    items = generate_items("case_synth", 400, spec)
+    assert len({item.id for item in items}) == 400
+    assert len({item.author for item in items}) <= 20 * len(spec.platform_mix)
+    assert all(item.media_hash for item in items)
+    assert len({item.text for item in items}) < 400
+    assert {item.language for item in items} <= set(spec.language_mix)
+    assert generate_items("case_synth", 400, spec)[0].text == items[0].text
+
+
+def test_benchmark_run_reports_every_target_and_flags_regressions() -> None:
+    report = run([200], list(TARGETS), SyntheticSpec(), repeat=1)
+    assert {entry["target"] for entry in report["results"]} == set(TARGETS)
+    assert all(entry["seconds"] >= 0 and entry["peak_bytes"] > 0 for entry in report["results"])
+
+    assert compare(report, report, tolerance=0.25) == []
+    faster = {"results": [dict(entry, seconds=entry["seconds"] - 1.0) for entry in report["results"]]}
+    regressions = compare(report, faster, tolerance=0.25)
+    assert {r["target"] for r in regressions if r["metric"] == "seconds"} == set(TARGETS)
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+
+from app.connectors import CollectionEngine, collect_platform_items
+from app.dedup import IngestIndex
+from app.jobs import JobManager, LocalJobQueue
+from app.schemas import JobStatus, Platform
+
+
+def _fake(latency: float, fail: bool = False):
+    async def connector(case_id: str, query: str, platform: Platform):
+        await asyncio.sleep(latency)
+        if fail:
+            raise RuntimeError("upstream 503")
+        return collect_platform_items(case_id, query, platform)
+
+    return connector
+
+
+def test_collection_fans_out_and_returns_partial_results() -> None:
+    engine = CollectionEngine(
+        connectors={
+            Platform.x: _fake(0.2),
+            Platform.telegram: _fake(0.2),
+            Platform.youtube: _fake(0.2),
+            Platform.instagram: _fake(0.05, fail=True),
+            Platform.web: _fake(5.0),
+        },
+        timeout=0.4,
+    )
+    started = time.perf_counter()
+    items, errors = asyncio.run(engine.collect("case_async", "energy claims", list(Platform)))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.8
+    assert {item.platform for item in items} == {Platform.x, Platform.telegram, Platform.youtube}
+    assert errors["instagram"] == "upstream 503"
+    assert "timed out" in errors["web"]
+
+
+def test_collection_respects_per_connector_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def connector(case_id: str, query: str, platform: Platform):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return []
+
+    engine = CollectionEngine(connectors={Platform.x: connector}, concurrency=2)
+
+    async def many() -> None:
+        await asyncio.gather(*(engine.collect(f"case_{i}", "q", [Platform.x]) for i in range(8)))
+
+    asyncio.run(many())
+    assert peak == 2
+
+
+def test_connector_limit_holds_across_background_jobs_and_requests() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    async def connector(case_id: str, query: str, platform: Platform):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return []
+
+    engine = CollectionEngine(connectors={Platform.x: connector}, concurrency=2)
+
+    async def many(prefix: str) -> None:
+        await asyncio.gather(*(engine.collect(f"{prefix}_{i}", "q", [Platform.x]) for i in range(6)))
+
+    # Job threads run collects on their own event loops, alongside the server's loop.
+    manager = JobManager(
+        {"collect": lambda case_id, stage: many(case_id)}, {}, backend=LocalJobQueue(), workers=2
+    )
+    jobs = [manager.submit("collect", f"case_job_{n}") for n in range(2)]
+    asyncio.run(many("case_request"))
+    deadline = time.monotonic() + 5
+    while any(manager.get(job.id).status not in (JobStatus.succeeded, JobStatus.failed) for job in jobs):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert all(manager.get(job.id).status == JobStatus.succeeded for job in jobs)
+    assert peak == 2
+
+
+def test_timed_out_blocking_connector_keeps_its_slot_until_the_thread_returns() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def connector(case_id: str, query: str, platform: Platform):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.2)
+        with lock:
+            in_flight -= 1
+        return collect_platform_items(case_id, query, platform)
+
+    engine = CollectionEngine(connectors={Platform.x: connector}, timeout=0.05, concurrency=1)
+
+    async def many() -> list:
+        return await asyncio.gather(*(engine.collect(f"case_slow_{i}", "q", [Platform.x]) for i in range(3)))
+
+    started = time.perf_counter()
+    results = asyncio.run(many())
+    assert all("timed out" in errors["x"] for _, errors in results)
+    # Each call after the first waited for the previous thread, not for its caller's timeout.
+    assert time.perf_counter() - started >= 0.4
+    engine.executors[Platform.x].shutdown(wait=True)
+    assert peak == 1
+
+
+def test_ingest_index_skips_repeated_and_fingerprinted_items() -> None:
+    items = collect_platform_items("case_dedup", "energy claims", Platform.x)
+    index = IngestIndex()
+    assert index.filter(items) == (items, 0)
+    assert index.filter(items) == ([], len(items))
+
+    renamed = items[0].model_copy(update={"id": "itm_x_other_connector"})
+    assert index.filter([renamed]) == ([], 1)
+
+
+def test_ingest_index_bloom_front_keeps_dedup_after_threshold() -> None:
+    items = collect_platform_items("case_bloom", "energy claims", Platform.telegram, count=50)
+    index = IngestIndex(bloom_threshold=10)
+    fresh, skipped = index.filter(items)
+    assert len(fresh) == 50 and skipped == 0
+    assert index.bloom is not None and len(index.sealed) + len(index.fingerprints) == 50
+
+    renamed = [item.model_copy(update={"id": item.id + "_copy"}) for item in items]
+    assert index.filter(renamed) == ([], 50)
+
+    # A saturated filter answers "maybe" for everything; new items must still get in.
+    index.bloom.bits = bytearray(b"\xff" * len(index.bloom.bits))
+    more = collect_platform_items("case_bloom_more", "energy claims", Platform.telegram, count=20)
+    assert index.filter(more) == (more, 0)
+    assert index.filter(renamed + more) == ([], 70)
@@ -0,0 +1,99 @@
+import json
+import threading
+
+from app.connectors import collect_platform_items
+from app.graph import CaseGraphIndex
+from app.graph_analytics import CSRGraph, analyze_graph
+from app.schemas import Platform
+from benchmarks.synthetic import generate_items
+
+
+def test_repeated_relations_collapse_into_weighted_edges() -> None:
+    items = collect_platform_items("case_graph", "energy claims", Platform.x, count=12)
+    graph = CaseGraphIndex().add(items)
+
+    posts_on = [e for e in graph.to_dict()["edges"] if e["type"] == "posts_on"]
+    assert len(posts_on) == 12
+    repeated = [item.model_copy(update={"id": f"{item.id}_again"}) for item in items[:1] * 5]
+    graph.add(repeated)
+    edge = graph.edges[("acct:x_account_1", "platform:x", "posts_on")]
+    assert edge[0] == 6
+    assert edge[1] <= edge[2]
+
+
+def test_serialized_graph_is_cached_per_version() -> None:
+    graph = CaseGraphIndex().add(collect_platform_items("case_graph", "q", Platform.web))
+    payload = graph.to_json()
+    assert graph.to_json() is payload
+
+    graph.add(collect_platform_items("case_graph", "other query", Platform.telegram))
+    refreshed = graph.to_json()
+    assert refreshed is not payload
+    assert any(node["id"] == "platform:telegram" for node in json.loads(refreshed)["nodes"])
+
+
+def test_graph_analytics_components_centrality_and_bridges() -> None:
+    items = collect_platform_items("case_graph", "energy claims", Platform.x, count=3)
+    items += [
+        item.model_copy(update={"id": f"{item.id}_tg", "platform": Platform.telegram})
+        for item in items[:1]
+    ]
+    graph = CaseGraphIndex().add(items)
+    graph._node("acct:isolated", "isolated", "account")
+
+    analytics = analyze_graph(graph)
+    assert analytics.node_count == len(graph.nodes)
+    assert analytics.component_count == 2
+    assert analytics.largest_component == len(graph.nodes) - 1
+    assert analytics.top_central[0].type in {"platform", "narrative", "entity", "account"}
+    assert [b.id for b in analytics.bridge_accounts] == ["acct:x_account_1"]
+    assert analytics.bridge_accounts[0].platforms == 2
+    assert analyze_graph(graph) is analytics
+
+
+def test_csr_pagerank_sums_to_one() -> None:
+    graph = CaseGraphIndex().add(collect_platform_items("case_graph", "energy claims", Platform.web, count=30))
+    rank = CSRGraph.from_index(graph).pagerank()
+    assert abs(rank.sum() - 1.0) < 1e-6
+
+
+def test_k_hop_subgraph_filters_budget_and_pagination() -> None:
+    graph = CaseGraphIndex().add(collect_platform_items("case_graph", "energy claims", Platform.x, count=12))
+
+    one_hop = graph.subgraph(["acct:x_account_1"], hops=1)
+    assert {node["type"] for node in one_hop["nodes"]} >= {"account", "platform"}
+    assert all("acct:x_account_1" in (e["source"], e["target"]) for e in one_hop["edges"])
+
+    accounts_via_platform = graph.subgraph(
+        ["acct:x_account_1"], hops=2, node_types={"account", "platform"}, edge_types={"posts_on"}
+    )
+    assert accounts_via_platform["total_nodes"] == 13
+    assert not accounts_via_platform["truncated"]
+
+    budget = graph.subgraph(["platform:x"], hops=1, max_nodes=5, limit=3)
+    assert budget["truncated"] and budget["total_nodes"] == 5
+    assert len(budget["nodes"]) == 3 and budget["next_offset"] == 3
+    second_page = graph.subgraph(["platform:x"], hops=1, max_nodes=5, offset=3, limit=3)
+    assert len(second_page["nodes"]) == 2 and second_page["next_offset"] is None
+
+
+def test_graph_reads_and_analytics_are_safe_while_items_are_added() -> None:
+    graph = CaseGraphIndex()
+    batches = [generate_items(f"case_graph_{n}", 2_000) for n in range(6)]
+    done = threading.Event()
+
+    def writer() -> None:
+        for batch in batches:
+            graph.add(batch)
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not done.is_set():
+        payload = graph.to_dict()
+        assert {edge["source"] for edge in payload["edges"]} <= {node["id"] for node in payload["nodes"]}
+        graph.subgraph([node["id"] for node in payload["nodes"][:3]], hops=2)
+        analytics = analyze_graph(graph)
+        assert analytics.edge_count <= len(graph.edges)
+    thread.join()
+    assert len(json.loads(graph.to_json())["edges"]) == len(graph.edges)
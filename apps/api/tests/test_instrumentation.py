@@ -0,0 +1,64 @@
+import time
+
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.instrumentation import Histogram, MetricsRegistry, SamplingProfiler
+
+
+client = TestClient(main.app)
+
+
+def test_histogram_renders_cumulative_prometheus_buckets() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo.", stage="x")
+    assert registry.histogram("demo_seconds", "Demo.", stage="x") is histogram
+    for value in (0.0002, 0.003, 0.003, 20.0):
+        histogram.observe(value)
+
+    text = registry.render([("demo_gauge", "Gauge.", {}, 3)])
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{stage="x",le="0.00025"} 1' in text
+    assert 'demo_seconds_bucket{stage="x",le="0.005"} 3' in text
+    assert 'demo_seconds_bucket{stage="x",le="10.0"} 3' in text
+    assert 'demo_seconds_bucket{stage="x",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{stage="x"} 4' in text
+    assert "demo_gauge 3" in text
+    assert Histogram().snapshot() == ([0] * 17, 0.0)
+
+
+def test_prometheus_endpoint_reports_stages_routes_and_store_sizes() -> None:
+    case_id = client.post(
+        "/api/v1/cases",
+        json={"title": "Metrics case", "query": "metrics narrative", "platforms": ["x", "web"]},
+    ).json()["id"]
+    client.post(f"/api/v1/cases/{case_id}/run-all")
+    client.get(f"/api/v1/cases/{case_id}/graph")
+
+    response = client.get("/api/v1/metrics/prometheus")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    for stage in ("collect_case_items", "analyze_items", "build_alerts", "build_evidence",
+                  "verify_media", "build_case_report", "graph_index_add", "build_case_graph"):
+        assert f'nexus_stage_duration_seconds_count{{stage="{stage}"}}' in text
+    assert 'stage="collect_case_items_async"' not in text
+    assert 'route="/api/v1/cases/{case_id}/run-all",status="200"' in text
+    assert "nexus_store_items " in text
+    assert 'nexus_store_items_per_case{quantile="0.5"}' in text
+    size = next(line for line in text.splitlines() if line.startswith("nexus_store_size_bytes "))
+    assert int(size.split()[1]) > 0
+
+
+def test_sampling_profiler_is_toggleable(monkeypatch) -> None:
+    assert client.post("/api/v1/profiler/start").status_code == 404
+
+    monkeypatch.setattr(main, "PROFILER_ENABLED", True)
+    monkeypatch.setattr(main, "profiler", SamplingProfiler())
+    assert client.post("/api/v1/profiler/start", params={"interval_ms": 1}).json()["running"] is True
+    deadline = time.monotonic() + 2
+    while not main.profiler.samples and time.monotonic() < deadline:
+        time.sleep(0.01)
+    status = client.post("/api/v1/profiler/stop").json()
+    assert status["running"] is False and status["samples"] > 0
+    stacks = client.get("/api/v1/profiler").text.splitlines()
+    assert stacks and all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
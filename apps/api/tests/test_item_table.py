@@ -0,0 +1,81 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from app.item_table import ItemTable, value_counts, with_value
+from app.schemas import CaseRecord, ContentItem, Platform, Status
+from app.storage import InMemoryStore
+from benchmarks.synthetic import SyntheticSpec, generate_items
+
+
+def test_item_table_round_trips_items_and_slices() -> None:
+    items = generate_items("case_table", 500, SyntheticSpec(media_ratio=0.5))
+    table = ItemTable(items[:200])
+    table.append(items[200:])
+
+    assert len(table) == 500
+    assert [item.model_dump_json() for item in table] == [item.model_dump_json() for item in items]
+    assert table[-1] == items[-1]
+    assert table[10:20:3] == items[10:20:3]
+    assert table.take([42, 7]) == [items[42], items[7]]
+    assert table.sort_key(3) == (items[3].observed_at, items[3].id)
+    assert 0 < table.nbytes
+
+
+def test_item_table_counts_match_counters_over_models() -> None:
+    items = generate_items("case_table", 800, SyntheticSpec(author_ratio=0.05))
+    table = ItemTable(items)
+
+    authors = Counter(item.author for item in items)
+    assert table.counts("author") == authors
+    assert list(table.counts("language")) == list(Counter(item.language for item in items))
+    assert table.distinct("author") == len(authors)
+    assert table.top("author", 5) == [name for name, _ in authors.most_common(5)]
+    entities = Counter(entity for item in items for entity in item.entities)
+    assert table.top("entities", 6) == [name for name, _ in entities.most_common(6)]
+    assert int(table.column("engagement").sum()) == sum(item.engagement for item in items)
+    assert value_counts(table, "platform") == value_counts(items, "platform")
+    assert with_value(table, "media_hash") == with_value(items, "media_hash")
+
+
+def test_store_pages_items_from_the_table_in_time_order() -> None:
+    store = InMemoryStore()
+    now = datetime.now(timezone.utc)
+    case = store.create_case(
+        CaseRecord(
+            id="case_pages",
+            title="Paging",
+            query="q",
+            platforms=[Platform.x],
+            status=Status.draft,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    items = [
+        ContentItem(
+            id=f"itm_{n}", case_id=case.id, platform=Platform.x, author="a", text=f"post {n}",
+            url=f"https://x.local/{n}", observed_at=now - timedelta(minutes=n), language="en",
+            engagement=n, source_name="x-collector",
+        )
+        for n in range(10)
+    ]  # fmt: skip
+    store.append_items(case.id, items)
+
+    first = store.page_items(case.id, None, 4)
+    assert [item.id for item in first] == ["itm_9", "itm_8", "itm_7", "itm_6"]
+    rest = store.page_items(case.id, (first[-1].observed_at, first[-1].id), 10)
+    assert [item.id for item in rest] == [f"itm_{n}" for n in range(5, -1, -1)]
+    assert store.get_store_stats()["items_per_case"] == [10]
+
+    # Later appends merge into the order, ties on the timestamp broken by id.
+    store.append_items(case.id, [item.model_copy(update={"id": f"{item.id}b", "text": f"{item.text}b"}) for item in reversed(items)])
+    expected = sorted(store.get_items(case.id), key=lambda item: (item.observed_at, item.id))
+    pages, after = [], None
+    while page := store.page_items(case.id, after, 3):
+        pages += page
+        after = (page[-1].observed_at, page[-1].id)
+    assert [item.id for item in pages] == [item.id for item in expected]
+    assert [item.id for item in store.page_items(case.id, (now - timedelta(minutes=2), "itm_2"), 2)] == [
+        "itm_2b",
+        "itm_1",
+    ]
@@ -0,0 +1,80 @@
+import time
+from threading import Event
+
+from fastapi.testclient import TestClient
+
+from app.jobs import JobManager, LocalJobQueue
+from app.main import app
+from app.schemas import JobStatus
+
+
+client = TestClient(app)
+
+
+def _wait(fetch, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = fetch()
+        status = job["status"] if isinstance(job, dict) else job.status.value
+        if status in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_duplicate_jobs_coalesce_and_record_stage_timings() -> None:
+    release = Event()
+    calls = []
+
+    def slow(case_id, stage):
+        calls.append(case_id)
+        with stage("first"):
+            release.wait(5)
+        with stage("second"):
+            pass
+        return None
+
+    def broken(case_id, stage):
+        raise RuntimeError("connector down")
+
+    manager = JobManager({"slow": slow, "broken": broken}, {"slow": ["first", "second"]}, backend=LocalJobQueue())
+    first = manager.submit("slow", "case_a")
+    again = manager.submit("slow", "case_a")
+    other = manager.submit("slow", "case_b")
+    assert again.id == first.id
+    assert other.id != first.id
+
+    release.set()
+    done = _wait(lambda: manager.get(first.id))
+    assert done.status == JobStatus.succeeded
+    assert done.progress == 1.0
+    assert [stage.name for stage in done.stages] == ["first", "second"]
+    assert all(stage.duration_ms is not None for stage in done.stages)
+    _wait(lambda: manager.get(other.id))
+    assert sorted(calls) == ["case_a", "case_b"]
+    assert manager.submit("slow", "case_a").id != first.id
+
+    broken_job = manager.submit("broken", "case_a")
+    failed = _wait(lambda: manager.get(broken_job.id))
+    assert failed.status == JobStatus.failed
+    assert failed.error == "connector down"
+    manager.shutdown()
+
+
+def test_background_run_all_returns_job_and_reports_progress() -> None:
+    case_id = client.post(
+        "/api/v1/cases",
+        json={"title": "Queued case", "query": "queued narrative", "platforms": ["x", "web"]},
+    ).json()["id"]
+
+    accepted = client.post(f"/api/v1/cases/{case_id}/run-all", params={"background": True})
+    assert accepted.status_code == 202
+    job_id = accepted.json()["id"]
+
+    job = _wait(lambda: client.get(f"/api/v1/jobs/{job_id}").json())
+    assert job["status"] == "succeeded", job["error"]
+    assert [stage["name"] for stage in job["stages"]] == ["collect", "analyze", "alerts", "media", "report"]
+    assert job["result"]["status"] == "ready"
+    assert client.get(f"/api/v1/cases/{case_id}/report").status_code == 200
+    assert [j["id"] for j in client.get(f"/api/v1/cases/{case_id}/jobs").json()] == [job_id]
+    assert client.get("/api/v1/jobs/job_missing").status_code == 404
@@ -0,0 +1,33 @@
+from app.connectors import collect_platform_items
+from app.intelligence import build_evidence
+from app.ledger import EvidenceLedger, leaf_hash, verify_proof
+from app.schemas import Platform
+
+
+def test_every_record_has_a_valid_logarithmic_inclusion_proof() -> None:
+    items = collect_platform_items("case_ledger", "energy claims", Platform.x, count=13)
+    ledger = EvidenceLedger()
+    ledger.append(build_evidence("case_ledger", items))
+    root = ledger.root()
+
+    for record in ledger.records:
+        index, path = ledger.proof(record.id)
+        assert ledger.records[index] is record
+        assert len(path) <= 2 * len(items).bit_length()
+        assert verify_proof(leaf_hash(record), path, root)
+
+    tampered = ledger.records[5].model_copy(update={"evidence_hash": "0" * 40})
+    _, path = ledger.proof(tampered.id)
+    assert not verify_proof(leaf_hash(tampered), path, root)
+
+
+def test_ledger_is_append_only_and_keeps_capture_times() -> None:
+    items = collect_platform_items("case_ledger", "energy claims", Platform.telegram, count=6)
+    ledger = EvidenceLedger()
+    first = ledger.append(build_evidence("case_ledger", items[:4]))
+    root_before = ledger.root()
+
+    added = ledger.append(build_evidence("case_ledger", items))
+    assert len(added) == 2 and len(ledger) == 6
+    assert ledger.records[:4] == first
+    assert ledger.root() != root_before
@@ -0,0 +1,28 @@
+from app.lexicon import DEFAULT_LEXICON, Lexicon, normalize
+
+
+def test_matches_every_overlapping_term_in_one_pass() -> None:
+    lexicon = Lexicon({"he": ["a"], "she": ["b"], "hers": ["c"], "his": ["d"]})
+    assert sorted(term for _, term in lexicon.find("ushers")) == ["he", "hers", "she"]
+    assert lexicon.tags("ushers") == ("a", "b", "c")
+
+
+def test_arabic_normalization_folds_letters_and_strips_diacritics() -> None:
+    assert normalize("إعادةُ") == "اعاده"
+    assert normalize("مُعَادٌ على") == "معاد علي"
+
+    lexicon = Lexicon(DEFAULT_LEXICON)
+    tags = lexicon.tags("صورةٌ قديمة تُنشر مع ادعاءات غير موثقة عن ضحايا")
+    assert "cluster:media-recontextualization" in tags
+    assert "cluster:claims-propagation" in tags
+    assert "flag:unverifiable" in tags
+    assert "flag:casualty" in tags
+
+
+def test_english_terms_keep_substring_semantics() -> None:
+    lexicon = Lexicon(DEFAULT_LEXICON)
+    assert lexicon.tags("Re-uploaded clip WITHOUT context") == (
+        "flag:suspicious-caption",
+        "cluster:media-recontextualization",
+    )
+    assert lexicon.tags("nothing to see") == ()
@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+
+import app.main as main
+from loadtest.run import Scenario, compare, drive, load_scenario, percentile
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(n) for n in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 95) == 0.0
+
+
+def test_open_loop_driver_reports_every_route_in_the_mix() -> None:
+    scenario = Scenario.from_dict(
+        {
+            "name": "smoke",
+            "seed_cases": 3,
+            "stages": [{"duration": 0.5, "rate": 40}],
+            "mix": {name: 1 for name in ("dashboard", "poll_cases", "collect", "analyze", "run_all", "bulk_create")},
+            "options": {"bulk_size": 2},
+        }
+    )
+
+    async def go() -> dict:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            return await drive(client, scenario)
+
+    report = asyncio.run(go())
+    rows = {row["route"]: row for row in report["routes"]}
+    assert report["unfinished"] == 0 and not report["errors"]
+    assert rows["total"]["requests"] == sum(row["requests"] for route, row in rows.items() if route != "total")
+    assert rows["total"]["error_rate"] == 0
+    assert rows["total"]["p50_ms"] <= rows["total"]["p95_ms"] <= rows["total"]["p99_ms"] <= rows["total"]["max_ms"]
+    for operation, route in (("poll_cases", "GET /api/v1/cases"), ("collect", "POST /api/v1/cases/{case_id}/collect")):
+        if report["offered"].get(operation):
+            assert rows[route]["requests"] >= report["offered"][operation]
+
+    slower = {"routes": [dict(row, p95_ms=row["p95_ms"] * 2 + 10) for row in report["routes"]]}
+    assert compare(report, report, tolerance=0.25) == []
+    assert {entry["metric"] for entry in compare(slower, report, tolerance=0.25)} == {"p95_ms"}
+
+
+def test_bundled_scenarios_load() -> None:
+    for name in ("mixed", "dashboard", "ingest"):
+        scenario = load_scenario(name).scaled(2)
+        assert scenario.stages and all(stage.rate > 0 for stage in scenario.stages)
@@ -0,0 +1,52 @@
+import random
+
+from app.analysis import CaseAccumulator
+from app.connectors import collect_platform_items
+from app.intelligence import verify_media
+from app.media_index import MediaHashIndex
+from app.schemas import Platform, VerificationVerdict
+
+
+def test_multi_index_hashing_matches_linear_scan() -> None:
+    rng = random.Random(7)
+    index = MediaHashIndex()
+    hashes = [rng.getrandbits(64) for _ in range(2000)]
+    base = hashes[0]
+    for flips in (1, 3, 6):
+        near = base
+        for bit in rng.sample(range(64), flips):
+            near ^= 1 << bit
+        hashes.append(near)
+    for i, value in enumerate(hashes):
+        index.add(f"case_{i % 7}", f"itm_{i}", f"{value:016x}")
+
+    for max_distance in (0, 3, 7):
+        found = {item_id for _, item_id, _, _ in index.query(f"{base:016x}", max_distance)}
+        expected = {f"itm_{i}" for i, value in enumerate(hashes) if (value ^ base).bit_count() <= max_distance}
+        assert found == expected
+
+
+def test_verify_media_flags_cross_case_reuse() -> None:
+    first = collect_platform_items("case_a", "energy claims", Platform.instagram, count=1)
+    second = collect_platform_items("case_b", "other story", Platform.instagram, count=1)
+    index = MediaHashIndex()
+    for item in first + second:
+        index.add(item.case_id, item.id, item.media_hash)
+
+    (result,) = verify_media(first, index)
+    assert result.verdict == VerificationVerdict.reused
+    assert result.checks["cross_case_reuse"] is True
+
+    (alone,) = verify_media(first)
+    assert alone.checks["hash_reused"] is False
+
+
+def test_verify_media_reads_caption_flags_recorded_at_ingest() -> None:
+    items = collect_platform_items("case_flags", "energy claims", Platform.telegram)
+    flagged = CaseAccumulator().add(items).suspicious_captions
+    assert flagged and flagged < {item.id for item in items}
+
+    scanned = verify_media(items)
+    assert verify_media(items, suspicious_captions=flagged) == scanned
+    # The recorded flags are trusted rather than the captions rescanned.
+    assert all(not result.checks["suspicious_caption"] for result in verify_media(items, suspicious_captions=()))
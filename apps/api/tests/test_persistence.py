@@ -0,0 +1,188 @@
+import json
+import threading
+
+import pytest
+
+from app import spill, storage
+from app.analysis import analyze_accumulator
+from app.intelligence import verify_media
+from app.persistence import MutationLog
+from app.schemas import Severity, Status
+from app.storage import InMemoryStore
+from benchmarks.synthetic import generate_items
+
+
+def _state(store: InMemoryStore) -> dict:
+    return {
+        case.id: (
+            case.model_dump(exclude={"updated_at"}),
+            [item.model_dump_json() for item in store.get_items(case.id)],
+            store.get_ledger(case.id).root(),
+            analyze_accumulator(store.get_accumulator(case.id)).model_dump(exclude={"generated_at"}),
+            store.get_media_verification(case.id),
+            [(event.event_type, event.metadata) for event in store.timeline[case.id]],
+        )
+        for case in store.list_cases()
+    }
+
+
+def test_restart_restores_snapshot_plus_logged_mutations(tmp_path, make_case) -> None:
+    store = InMemoryStore(data_dir=tmp_path)
+    for n in range(2):
+        case = store.create_case(make_case(f"case_persist_{n}"))
+        store.append_items(case.id, generate_items(case.id, 200), {"source": "seed"})
+    store.snapshot()
+
+    # Logged after the snapshot: a duplicate-heavy append, analysis and media verification.
+    repeats = list(store.get_items("case_persist_0"))[:50]
+    store.append_items("case_persist_0", repeats + generate_items("case_persist_0_more", 30))
+    analysis = analyze_accumulator(store.get_accumulator("case_persist_0"))
+    store.save_analysis("case_persist_0", 0.5, Severity.r2, analysis)
+    store.save_media_verification("case_persist_1", verify_media(store.get_items("case_persist_1")))
+    store.create_case(make_case("case_persist_2"))
+    expected = _state(store)
+    head = len(store.changes)
+
+    restored = InMemoryStore(data_dir=tmp_path)
+    assert _state(restored) == expected
+    assert len(restored.changes) == head
+    assert restored.timeline["case_persist_0"][-3].metadata["skipped"] == 50
+
+    # Replaying compacted the log into a new snapshot, and the restored store keeps logging.
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["log-2", "snapshot-2"]
+    restored.append_items("case_persist_2", generate_items("case_persist_2", 20))
+    restored.close()
+
+    # After a clean shutdown, nothing is replayed and case bulk stays on disk until first accessed.
+    reopened = InMemoryStore(data_dir=tmp_path)
+    assert reopened.get_store_stats()["spilled_cases"] == 3
+    assert len(reopened.get_items("case_persist_2")) == 20
+
+
+def test_torn_log_tail_is_ignored(tmp_path, make_case) -> None:
+    store = InMemoryStore(data_dir=tmp_path)
+    store.create_case(make_case("case_torn"))
+    store.append_items("case_torn", generate_items("case_torn", 50))
+    store.log.close()
+    with open(tmp_path / "log-0", "ab") as handle:
+        handle.write(b"\x40\x00\x00\x00partial")
+
+    restored = InMemoryStore(data_dir=tmp_path)
+    assert len(restored.get_items("case_torn")) == 50
+    assert restored.cases["case_torn"].item_count == 50
+
+
+def test_mutations_proceed_while_a_snapshot_is_written(tmp_path, monkeypatch, make_case) -> None:
+    store = InMemoryStore(data_dir=tmp_path)
+    for case_id in ("case_busy", "case_idle"):
+        store.create_case(make_case(case_id))
+        store.append_items(case_id, generate_items(case_id, 40))
+
+    capturing, captured = threading.Event(), threading.Event()
+    writing, crash = threading.Event(), threading.Event()
+    real_capture = spill.capture_bulk
+
+    def stalled_capture(bulk):
+        if threading.current_thread() is snapshotter and not capturing.is_set():
+            capturing.set()
+            captured.wait(5)
+        return real_capture(bulk)
+
+    def stalled_write(directory, payload):
+        writing.set()
+        crash.wait(5)
+        raise OSError("disk full")
+
+    failures = []
+
+    def snapshot() -> None:
+        try:
+            store.snapshot()
+        except OSError as exc:
+            failures.append(exc)
+
+    monkeypatch.setattr(spill, "capture_bulk", stalled_capture)
+    monkeypatch.setattr(storage, "write_state", stalled_write)
+    snapshotter = threading.Thread(target=snapshot)
+    snapshotter.start()
+    assert capturing.wait(5)
+
+    # While the first case is pickled, a write to it waits for that case alone.
+    blocked = threading.Thread(target=store.append_items, args=("case_busy", generate_items("case_busy_more", 10)))
+    blocked.start()
+    store.append_items("case_idle", generate_items("case_idle_more", 5))
+    store.create_case(make_case("case_new"))
+    assert json.loads(store.get_case_json("case_idle"))["item_count"] == 45
+    assert blocked.is_alive()
+    captured.set()
+    blocked.join(5)
+    assert not blocked.is_alive()
+
+    assert writing.wait(5)
+    writer = threading.Thread(
+        target=store.append_items, args=("case_busy", generate_items("case_busy_last", 10))
+    )
+    writer.start()
+    writer.join(2)
+    assert not writer.is_alive()
+    crash.set()
+    snapshotter.join(5)
+    assert failures
+
+    # The unfinished snapshot is ignored; both logs since the last complete one are replayed.
+    monkeypatch.undo()
+    restored = InMemoryStore(data_dir=tmp_path)
+    assert len(restored.get_items("case_busy")) == 60
+    assert _state(restored) == _state(store)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["log-2", "snapshot-2"]
+
+
+def test_snapshot_holds_each_case_as_of_its_cut(tmp_path, monkeypatch, make_case) -> None:
+    store = InMemoryStore(data_dir=tmp_path)
+    for case_id in ("case_first", "case_second"):
+        store.create_case(make_case(case_id))
+        store.append_items(case_id, generate_items(case_id, 30))
+
+    capturing, captured = threading.Event(), threading.Event()
+    real_capture = spill.capture_bulk
+
+    def stalled_capture(bulk):
+        if threading.current_thread() is snapshotter and not capturing.is_set():
+            capturing.set()
+            captured.wait(5)
+        return real_capture(bulk)
+
+    monkeypatch.setattr(spill, "capture_bulk", stalled_capture)
+    snapshotter = threading.Thread(target=store.snapshot)
+    snapshotter.start()
+    assert capturing.wait(5)
+    # The snapshot has not reached this case yet, so the write serializes it first and lands in the new log.
+    store.append_items("case_second", generate_items("case_second_more", 20))
+    store.save_media_verification("case_second", verify_media(store.get_items("case_second")))
+    captured.set()
+    snapshotter.join(5)
+    monkeypatch.undo()
+
+    restored = InMemoryStore(data_dir=tmp_path)
+    assert _state(restored) == _state(store)
+    assert len(restored.get_items("case_second")) == 50
+
+
+def test_replay_rejects_unknown_operations(tmp_path) -> None:
+    log = MutationLog(tmp_path / "log-0")
+    log.append("snapshot")
+    log.close()
+    with pytest.raises(ValueError, match="snapshot"):
+        InMemoryStore(data_dir=tmp_path)
+
+
+def test_analysis_start_is_versioned_and_logged(tmp_path, make_case) -> None:
+    store = InMemoryStore(data_dir=tmp_path)
+    store.create_case(make_case("case_started"))
+    version = store.get_version("case_started")
+    assert store.start_analysis("case_started").status == Status.analyzing
+    assert store.get_version("case_started") > version
+    assert store.get_changes(0, 10, ["analysis_started"])[0][0].case_id == "case_started"
+
+    restored = InMemoryStore(data_dir=tmp_path)
+    assert restored.get_case("case_started").status == Status.analyzing
@@ -1,5 +1,6 @@
-from app.analysis import analyze_items
+from app.analysis import CaseAccumulator, analyze_accumulator, analyze_items
 from app.connectors import collect_case_items
+from app.minhash import NearDuplicateIndex
 from app.schemas import Platform
 
 
@@ -13,3 +14,28 @@ def test_analysis_score_in_expected_range() -> None:
     assert 0 <= analysis.score <= 100
     assert analysis.severity.value in {"R1", "R2", "R3", "R4"}
     assert analysis.narrative_clusters
+
+
+def test_incremental_accumulator_matches_full_analysis() -> None:
+    first = collect_case_items("case_test", "casualty claims", [Platform.x, Platform.telegram])
+    second = collect_case_items("case_test", "unverifiable energy", [Platform.youtube, Platform.web])
+    acc = CaseAccumulator().add(first)
+    acc.add(second)
+    incremental = analyze_accumulator(acc)
+    full = analyze_items(first + second)
+    assert incremental.model_dump(exclude={"generated_at"}) == full.model_dump(exclude={"generated_at"})
+
+
+def test_near_duplicate_index_groups_copy_paste_across_accounts() -> None:
+    index = NearDuplicateIndex()
+    campaign = "Officials confirm the energy grid collapse was staged, share before it is deleted"
+    for i in range(6):
+        index.add(f"copy_{i}", f"{campaign} #{i}", f"account_{i}", "x" if i % 2 else "telegram")
+    index.add("unrelated", "Weather update for the coastal region this weekend", "account_9", "web")
+
+    clusters = index.clusters()
+    assert len(clusters) == 1
+    assert sorted(clusters[0]["item_ids"]) == [f"copy_{i}" for i in range(6)]
+    assert index.duplicated_items == 6
+    assert index.max_author_spread == 6
+    assert index.max_platform_spread == 2
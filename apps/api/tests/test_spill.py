@@ -0,0 +1,96 @@
+import threading
+
+from app import storage
+from app.analysis import analyze_accumulator
+from app.intelligence import verify_media
+from app.spill import read_bulk
+from app.storage import InMemoryStore
+from benchmarks.synthetic import generate_items
+
+
+def test_cold_cases_spill_to_disk_and_load_back_unchanged(tmp_path, make_case) -> None:
+    store = InMemoryStore(memory_budget=3_000_000, spill_dir=tmp_path)
+    snapshots = {}
+    for n in range(4):
+        case = store.create_case(make_case(f"case_spill_{n}"))
+        store.append_items(case.id, generate_items(case.id, 300))
+        store.save_media_verification(case.id, verify_media(store.get_items(case.id)))
+        snapshots[case.id] = (
+            [item.model_dump_json() for item in store.get_items(case.id)],
+            store.get_ledger(case.id).root(),
+            analyze_accumulator(store.get_accumulator(case.id)).model_dump(exclude={"generated_at"}),
+            store.get_media_verification(case.id),
+        )
+
+    assert store.resident_bytes <= 3_000_000
+    assert "case_spill_0" in store.spilled and "case_spill_0" not in store.bulk
+    assert [case.id for case in store.list_cases()] and store.get_store_stats()["spilled_cases"] >= 2
+    assert store.get_store_stats()["evidence"] == 1200
+
+    for case_id, (items, root, analysis, media) in snapshots.items():
+        assert [item.model_dump_json() for item in store.get_items(case_id)] == items
+        assert store.get_ledger(case_id).root() == root
+        assert analyze_accumulator(store.get_accumulator(case_id)).model_dump(exclude={"generated_at"}) == analysis
+        assert store.get_media_verification(case_id) == media
+
+    # A reloaded case accepts appends and re-spills with its new items.
+    store.append_items("case_spill_0", generate_items("case_spill_0", 310)[300:])
+    for case_id in snapshots:
+        store.get_items(case_id)
+    assert len(store.get_items("case_spill_0")) == 310
+    assert store.cases["case_spill_0"].item_count == 310
+    assert len(list(tmp_path.iterdir())) == len(store.spilled)
+
+
+def test_budget_counts_measured_indexes_and_read_caches(tmp_path, make_case) -> None:
+    store = InMemoryStore(memory_budget=1 << 30, spill_dir=tmp_path)
+    store.create_case(make_case("case_sized"))
+    store.append_items("case_sized", generate_items("case_sized", 300))
+    table = store.get_items("case_sized")
+    derived = store.resident["case_sized"] - table.nbytes
+    assert store.derived_sizes["case_sized"][0] == 300 and derived > 300 * 1_000
+
+    store.get_items_json("case_sized")
+    assert store.resident["case_sized"] == table.nbytes + derived + store.item_json["case_sized"].nbytes
+    store.page_items("case_sized", None, 10)
+    index = store.page_indexes[("items", "case_sized")]
+    assert store.resident_bytes == table.nbytes + derived + store.item_json["case_sized"].nbytes + index.nbytes
+
+    # Growing past the re-measure factor measures the derived structures again.
+    store.append_items("case_sized", generate_items("case_sized_more", 300))
+    assert store.derived_sizes["case_sized"][0] == 600
+
+
+def test_spilled_case_loads_once_without_holding_the_store(tmp_path, monkeypatch, make_case) -> None:
+    store = InMemoryStore(memory_budget=3_000_000, spill_dir=tmp_path)
+    for n in range(4):
+        store.create_case(make_case(f"case_load_{n}"))
+        store.append_items(f"case_load_{n}", generate_items(f"case_load_{n}", 300))
+    assert "case_load_0" not in store.bulk
+
+    reading, release = threading.Event(), threading.Event()
+    loads = []
+
+    def stalled_read(directory):
+        loads.append(directory)
+        reading.set()
+        release.wait(5)
+        return read_bulk(directory)
+
+    monkeypatch.setattr(storage, "read_bulk", stalled_read)
+    counts = []
+    readers = [
+        threading.Thread(target=lambda: counts.append(len(store.get_items("case_load_0")))) for _ in range(2)
+    ]
+    for reader in readers:
+        reader.start()
+    assert reading.wait(5)
+
+    writer = threading.Thread(target=store.create_case, args=(make_case("case_load_new"),))
+    writer.start()
+    writer.join(2)
+    assert not writer.is_alive()
+    release.set()
+    for reader in readers:
+        reader.join(5)
+    assert counts == [300, 300] and len(loads) == 1
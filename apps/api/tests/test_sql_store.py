@@ -0,0 +1,151 @@
+from app.analysis import CaseAccumulator, analyze_accumulator, analyze_items
+from app.connectors import collect_case_items, collect_platform_items
+from app.intelligence import build_alerts
+from app.schemas import Platform, Status
+from app.sql_store import SQLStore
+
+
+def test_sql_store_round_trip(tmp_path, make_case) -> None:
+    url = f"sqlite:///{tmp_path / 'nexus.db'}"
+    store = SQLStore(url)
+    store.create_case(make_case("case_sql_1", platforms=[Platform.x, Platform.telegram]))
+    items = collect_case_items("case_sql_1", "energy claims", [Platform.x, Platform.telegram])
+    case = store.append_items("case_sql_1", items)
+    assert case.item_count == len(items)
+
+    analysis = analyze_items(store.get_items("case_sql_1"))
+    store.save_analysis("case_sql_1", analysis.score, analysis.severity, analysis)
+    store.save_alerts("case_sql_1", build_alerts("case_sql_1", analysis))
+    store.close()
+
+    reopened = SQLStore(url)
+    case = reopened.get_case("case_sql_1")
+    assert case.status == Status.ready
+    assert case.analysis is not None and case.analysis.score == analysis.score
+    assert case.platforms == [Platform.x, Platform.telegram]
+    assert len(reopened.get_items("case_sql_1")) == len(items)
+    assert len(reopened.get_evidence("case_sql_1")) == len(items)
+    assert len(reopened.get_ledger("case_sql_1")) == len(items)
+    assert reopened.get_global_metrics().open_alerts == len(reopened.get_alerts("case_sql_1"))
+    assert [e.event_type for e in reopened.get_timeline("case_sql_1")][0] == "case_created"
+    assert reopened.get_version("case_sql_1") == 4
+    assert reopened.get_global_version() == 4
+
+    changes, cursor = reopened.get_changes(0, 100, ["case_created", "alerts_generated"])
+    assert [c.event_type for c in changes] == ["case_created", "alerts_generated"]
+    assert changes[0].seq < changes[1].seq
+    assert cursor == reopened.get_change_head() and reopened.get_change_tail() == 0
+    assert reopened.get_changes(cursor, 100) == ([], cursor)
+
+    first_page = reopened.page_items("case_sql_1", None, 3)
+    last = first_page[-1]
+    second_page = reopened.page_items("case_sql_1", (last.observed_at, last.id), 100)
+    assert [i.id for i in first_page + second_page] == [i.id for i in reopened.get_items("case_sql_1")]
+
+
+def test_sql_store_batches_item_inserts(tmp_path, make_case) -> None:
+    store = SQLStore(f"sqlite:///{tmp_path / 'nexus.db'}")
+    store.create_case(make_case("case_sql_2"))
+    items = collect_platform_items("case_sql_2", "energy claims", Platform.x, count=10_000)
+
+    statements = []
+    with store.pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+    store.append_items("case_sql_2", items)
+
+    inserts = [s for s in statements if s.startswith("insert into content_items")]
+    assert len(inserts) <= -(-len(items) * 14 // store.max_params)
+    assert store.get_case("case_sql_2").item_count == 10_000
+
+
+def test_sql_store_dedups_on_content_fingerprint(tmp_path, make_case) -> None:
+    url = f"sqlite:///{tmp_path / 'nexus.db'}"
+    store = SQLStore(url)
+    store.create_case(make_case("case_sql_3"))
+    items = collect_platform_items("case_sql_3", "energy claims", Platform.x, count=20)
+    store.append_items("case_sql_3", items[:10])
+    # Databases from before the fingerprint column are backfilled on open.
+    with store.pool.connection() as conn:
+        conn.execute("drop index content_items_fingerprint_idx")
+        conn.execute("update content_items set fingerprint = null")
+    store.close()
+
+    reopened = SQLStore(url)
+    renamed = [item.model_copy(update={"id": item.id + "_mirror"}) for item in items[:10]]
+    case = reopened.append_items("case_sql_3", renamed + items[10:] + items[10:12])
+    assert case.item_count == 20
+    assert len(reopened.get_evidence("case_sql_3")) == 20
+    event = [e for e in reopened.get_timeline("case_sql_3") if e.event_type == "collection_completed"][-1]
+    assert (event.metadata["inserted"], event.metadata["skipped"]) == (10, 12)
+
+    # A re-collection that inserts nothing leaves the status and version alone.
+    reopened.start_analysis("case_sql_3")
+    version = reopened.get_version("case_sql_3")
+    assert reopened.append_items("case_sql_3", items).status == Status.analyzing
+    assert reopened.get_version("case_sql_3") == version
+
+
+def test_sql_store_processes_share_a_database(tmp_path, make_case) -> None:
+    url = f"sqlite:///{tmp_path / 'nexus.db'}"
+    first, second = SQLStore(url), SQLStore(url)
+    first.create_case(make_case("case_sql_4"))
+    items = collect_platform_items("case_sql_4", "energy claims", Platform.x)
+    first.append_items("case_sql_4", items[:2])
+    second.append_items("case_sql_4", items[2:])
+    second.touch("case_sql_4")
+
+    timeline = first.get_timeline("case_sql_4")
+    assert len({event.id for event in timeline}) == len(timeline) == 5
+    evidence = first.get_evidence("case_sql_4")
+    assert [record.item_id for record in evidence] == [item.id for item in items]
+    with first.pool.connection() as conn:
+        observed = dict(conn.execute("select item_id, observed_at from evidence").fetchall())
+    assert observed == {item.id: item.observed_at.isoformat() for item in items}
+    assert all(record.captured_at > items[0].observed_at for record in evidence)
+    # Versions come from the shared database, and so does the epoch the ETags carry; a new database gets another.
+    assert first.epoch == second.epoch != SQLStore(f"sqlite:///{tmp_path / 'other.db'}").epoch
+
+
+def test_sql_store_media_lookups_see_other_processes(tmp_path, make_case) -> None:
+    url = f"sqlite:///{tmp_path / 'nexus.db'}"
+    first, second = SQLStore(url), SQLStore(url)
+    first.create_case(make_case("case_sql_media"))
+    items = collect_platform_items("case_sql_media", "energy claims", Platform.telegram)
+    first.append_items("case_sql_media", items[:2])
+    assert len(second.media_index.query(items[0].media_hash, 0)) == 2
+
+    # Items the other process adds later are picked up on the next read.
+    first.append_items("case_sql_media", items[2:])
+    assert {item_id for _, item_id, _, _ in second.media_index.query(items[2].media_hash, 0)} == {
+        item.id for item in items[2:]
+    }
+
+
+def test_sql_store_tops_up_cached_analysis_state(tmp_path, make_case) -> None:
+    url = f"sqlite:///{tmp_path / 'nexus.db'}"
+    store, other = SQLStore(url), SQLStore(url)
+    store.create_case(make_case("case_sql_5"))
+    items = collect_platform_items("case_sql_5", "energy claims", Platform.telegram, count=30)
+    store.append_items("case_sql_5", items[:20])
+    accumulator = store.get_accumulator("case_sql_5")
+    assert accumulator.count == 20
+
+    # Rows written by another process are picked up on the next read, into the same state.
+    other.append_items("case_sql_5", items[20:])
+    statements = []
+    with store.pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+    assert store.get_accumulator("case_sql_5") is accumulator
+    assert accumulator.count == 30
+    assert store.get_graph("case_sql_5").to_dict() == other.get_graph("case_sql_5").to_dict()
+    rebuilt = CaseAccumulator().add(items)
+    assert analyze_accumulator(accumulator).model_dump(exclude={"generated_at"}) == analyze_accumulator(
+        rebuilt
+    ).model_dump(exclude={"generated_at"})
+    assert any("rowid > " in statement for statement in statements)
+
+    ledger = store.get_ledger("case_sql_5")
+    assert len(ledger) == 30 and store.get_ledger("case_sql_5") is ledger
+    evidence = store.get_evidence("case_sql_5")
+    assert ledger.root() == other.get_ledger("case_sql_5").root()
+    assert ledger.records == evidence
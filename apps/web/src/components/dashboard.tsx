@@ -7,13 +7,7 @@ import {
   collectCase,
   createCase,
   generateProducts,
-  getCaseAlerts,
-  getCaseEvidence,
-  getCaseGraph,
-  getCaseItems,
-  getCaseMediaVerification,
-  getCaseReport,
-  getCaseTimeline,
+  getCaseBundle,
   getConnectorStatus,
   getGlobalMetrics,
   getSourceCatalog,
@@ -132,23 +126,14 @@ export default function Dashboard() {
     }
 
     async function loadCaseProducts() {
-      const [graphData, itemData, alertData, evidenceData, timelineData, mediaData, reportData] =
-        await Promise.all([
-          getCaseGraph(activeCaseId).catch(() => null),
-          getCaseItems(activeCaseId).catch(() => []),
-          getCaseAlerts(activeCaseId).catch(() => []),
-          getCaseEvidence(activeCaseId).catch(() => []),
-          getCaseTimeline(activeCaseId).catch(() => []),
-          getCaseMediaVerification(activeCaseId).catch(() => []),
-          getCaseReport(activeCaseId).catch(() => null),
-        ]);
-      setGraph(graphData);
-      setItems(itemData);
-      setAlerts(alertData);
-      setEvidence(evidenceData);
-      setTimeline(timelineData);
-      setMediaChecks(mediaData);
-      setReport(reportData);
+      const bundle = await getCaseBundle(activeCaseId).catch(() => null);
+      setGraph(bundle?.graph ?? null);
+      setItems(bundle?.items ?? []);
+      setAlerts(bundle?.alerts ?? []);
+      setEvidence(bundle?.evidence ?? []);
+      setTimeline(bundle?.timeline ?? []);
+      setMediaChecks(bundle?.media_verification ?? []);
+      setReport(bundle?.report ?? null);
     }
 
     void loadCaseProducts();
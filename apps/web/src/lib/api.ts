@@ -1,5 +1,6 @@
 import {
   AlertRecord,
+  CaseBundle,
   CaseRecord,
   CaseReport,
   ConnectorStatus,
@@ -101,6 +102,18 @@ export function getCaseReport(caseId: string): Promise<CaseReport> {
   return request<CaseReport>(`/api/v1/cases/${caseId}/report`);
 }
 
+export function getCaseBundle(caseId: string, include?: string[], itemsLimit?: number): Promise<CaseBundle> {
+  const params = new URLSearchParams();
+  if (include) {
+    params.set("include", include.join(","));
+  }
+  if (itemsLimit) {
+    params.set("items_limit", String(itemsLimit));
+  }
+  const query = params.toString();
+  return request<CaseBundle>(`/api/v1/cases/${caseId}/bundle${query ? `?${query}` : ""}`);
+}
+
 export function getGlobalMetrics(): Promise<GlobalMetrics> {
   return request<GlobalMetrics>("/api/v1/metrics");
 }
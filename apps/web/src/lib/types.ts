@@ -40,7 +40,14 @@ export interface CaseRecord {
 
 export interface GraphData {
   nodes: { id: string; label: string; type: string }[];
-  edges: { source: string; target: string; type: string }[];
+  edges: {
+    source: string;
+    target: string;
+    type: string;
+    weight: number;
+    first_seen: string;
+    last_seen: string;
+  }[];
 }
 
 export interface ContentItem {
@@ -132,3 +139,16 @@ export interface GlobalMetrics {
   avg_risk: number;
   high_severity_cases: number;
 }
+
+export interface CaseBundle {
+  case: CaseRecord;
+  version: number;
+  items?: ContentItem[];
+  items_cursor?: string;
+  graph?: GraphData;
+  alerts?: AlertRecord[];
+  evidence?: EvidenceRecord[];
+  timeline?: TimelineEvent[];
+  media_verification?: MediaVerificationResult[];
+  report?: CaseReport | null;
+}
@@ -0,0 +1,59 @@
+-- Columns and tables required by the API's SQL store backend
+
+alter table cases add column if not exists item_count int not null default 0;
+alter table cases add column if not exists analysis jsonb;
+
+alter table content_items add column if not exists source_name text not null default '';
+alter table content_items add column if not exists media_hash text;
+alter table content_items add column if not exists narrative_key text;
+alter table content_items add column if not exists entities jsonb not null default '[]'::jsonb;
+
+create index if not exists content_items_case_idx on content_items (case_id, observed_at);
+
+alter table evidence add column if not exists record_id text unique;
+alter table evidence add column if not exists note text not null default '';
+
+create index if not exists evidence_case_idx on evidence (case_id);
+
+create table if not exists alerts (
+  id text primary key,
+  case_id text not null references cases(id) on delete cascade,
+  severity text not null,
+  status text not null default 'open',
+  title text not null,
+  summary text not null,
+  recommended_action text not null,
+  created_at timestamptz not null default now()
+);
+
+create table if not exists timeline_events (
+  id text primary key,
+  case_id text not null references cases(id) on delete cascade,
+  event_type text not null,
+  summary text not null,
+  metadata jsonb not null default '{}'::jsonb,
+  created_at timestamptz not null default now()
+);
+
+create index if not exists timeline_events_case_idx on timeline_events (case_id, created_at);
+
+create table if not exists media_verifications (
+  case_id text not null references cases(id) on delete cascade,
+  item_id text not null,
+  verdict text not null,
+  confidence numeric not null default 0,
+  checks jsonb not null default '{}'::jsonb,
+  explanation text not null,
+  primary key (case_id, item_id)
+);
+
+create table if not exists case_reports (
+  case_id text primary key references cases(id) on delete cascade,
+  payload jsonb not null,
+  generated_at timestamptz not null default now()
+);
+
+alter table alerts enable row level security;
+alter table timeline_events enable row level security;
+alter table media_verifications enable row level security;
+alter table case_reports enable row level security;
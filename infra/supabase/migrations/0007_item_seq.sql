@@ -0,0 +1,6 @@
+-- Insertion order of content items, so the API's SQL store can read only the rows added since its last read
+
+alter table content_items add column if not exists seq bigserial;
+
+create unique index if not exists content_items_seq_idx on content_items (seq);
+create index if not exists content_items_case_seq_idx on content_items (case_id, seq);
@@ -0,0 +1,3 @@
+-- Lets the API's SQL store read only the evidence added to a case since its last read
+
+create index if not exists evidence_case_id_idx on evidence (case_id, id);
@@ -0,0 +1,3 @@
+-- Per-case change counter backing the API's ETags
+
+alter table cases add column if not exists version bigint not null default 0;
@@ -0,0 +1,5 @@
+-- Store-wide ordering for the API's change feed (SQLite uses the implicit rowid)
+
+alter table timeline_events add column if not exists seq bigserial;
+
+create unique index if not exists timeline_events_seq_idx on timeline_events (seq);
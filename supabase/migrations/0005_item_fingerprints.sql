@@ -0,0 +1,5 @@
+-- Content fingerprints for ingest dedup; the API store backfills existing rows on start-up
+
+alter table content_items add column if not exists fingerprint text;
+
+create unique index if not exists content_items_fingerprint_idx on content_items (case_id, fingerprint);
@@ -0,0 +1,8 @@
+-- Evidence capture time, kept apart from the source item's observed_at
+
+alter table evidence add column if not exists captured_at timestamptz;
+
+-- The API store used to write the capture time into observed_at.
+update evidence set captured_at = observed_at where captured_at is null;
+
+alter table evidence alter column captured_at set not null;
@@ -0,0 +1,9 @@
+-- A token set once per database; the API puts it in ETags so versions counted in a recreated database never match old tags
+
+create table if not exists store_meta (
+  key text primary key,
+  value text not null
+);
+
+insert into store_meta (key, value) values ('epoch', left(replace(gen_random_uuid()::text, '-', ''), 12))
+on conflict (key) do nothing;
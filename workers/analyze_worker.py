@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-import os
-import time
+import asyncio
 
 import httpx
 
+from runner import run_worker
 
-API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
-POLL_SECONDS = int(os.getenv("ANALYZE_POLL_SECONDS", "45"))
+
+# Statuses of cases with items the current analysis has not seen yet.
+UNANALYZED = ("collecting", "analyzing")
+
+
+async def needs_analysis(client: httpx.AsyncClient, event: dict) -> bool:
+    # A re-collection that found nothing new leaves the case's status, and so its analysis, unchanged.
+    try:
+        response = await client.get(f"/api/v1/cases/{event['case_id']}")
+    except httpx.TransportError as exc:
+        print(f"[analyze] could not read case={event['case_id']} ({exc!r}); analyzing anyway")
+        return True
+    return response.status_code == 200 and response.json()["status"] in UNANALYZED
 
 
 def run() -> None:
-    while True:
-        with httpx.Client(timeout=20) as client:
-            cases = client.get(f"{API_BASE_URL}/api/v1/cases").json()
-            for case in cases:
-                if case["item_count"] > 0 and case["status"] != "ready":
-                    client.post(f"{API_BASE_URL}/api/v1/cases/{case['id']}/analyze")
-                    print(f"[analyze] analyzed case={case['id']}")
-        time.sleep(POLL_SECONDS)
+    asyncio.run(
+        run_worker(
+            "analyze",
+            "analyze",
+            catch_up={"status": list(UNANALYZED), "min_items": 1},
+            event_types=["collection_completed"],
+            should_handle=needs_analysis,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, List
+
+import httpx
+
+
+async def head(client: httpx.AsyncClient) -> int:
+    response = await client.get("/api/v1/changes/head")
+    response.raise_for_status()
+    return response.json()["head"]
+
+
+async def follow(
+    client: httpx.AsyncClient, types: List[str], since: int, resync: Callable[[], Awaitable[None]]
+) -> AsyncIterator[dict]:
+    """Yield change events from the API's SSE stream, reconnecting from the last seen ID.
+
+    The API keeps a bounded window of changes. When ``since`` falls out of it
+    (a ``410`` or a ``resync`` event), the feed restarts from the current head
+    and ``resync`` is awaited so the caller can re-list whatever it missed.
+    """
+    while True:
+        expired = False
+        try:
+            async with client.stream(
+                "GET",
+                "/api/v1/changes/stream",
+                params={"since": since, "types": types},
+                timeout=httpx.Timeout(10, read=None),
+            ) as response:
+                if response.status_code == 410:
+                    expired = True
+                else:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if line == "event: resync":
+                            expired = True
+                        elif line.startswith("data: ") and not expired:
+                            event = json.loads(line[len("data: ") :])
+                            since = event["seq"]
+                            yield event
+        except httpx.HTTPError as exc:
+            print(f"[change-feed] stream interrupted ({exc!r}); reconnecting")
+            await asyncio.sleep(1)
+        if expired:
+            print(f"[change-feed] cursor {since} expired; resyncing")
+            try:
+                latest = await head(client)
+                await resync()
+                since = latest
+            except httpx.HTTPError as exc:
+                print(f"[change-feed] resync failed ({exc!r}); retrying")
+                await asyncio.sleep(1)
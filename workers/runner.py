@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from typing import Awaitable, Callable, Dict, List, Set
+
+import httpx
+
+from change_feed import follow, head
+
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "16"))
+MAX_RETRIES = int(os.getenv("WORKER_MAX_RETRIES", "5"))
+BACKOFF_SECONDS = float(os.getenv("WORKER_BACKOFF_SECONDS", "0.5"))
+REQUEST_TIMEOUT_SECONDS = float(os.getenv("WORKER_TIMEOUT_SECONDS", "60"))
+
+
+class CaseRunner:
+    """POSTs one case action with bounded concurrency, retries and a per-case in-flight guard.
+
+    A case that is triggered again while its request is running is re-run
+    once afterwards rather than concurrently, so bursts of events for the
+    same case collapse into at most one extra call.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        name: str,
+        action: str,
+        concurrency: int = CONCURRENCY,
+        max_retries: int = MAX_RETRIES,
+        backoff: float = BACKOFF_SECONDS,
+    ) -> None:
+        self.client = client
+        self.name = name
+        self.action = action
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.in_flight: Set[str] = set()
+        self.rerun: Set[str] = set()
+        self.tasks: Set[asyncio.Task] = set()
+        self.stats: Dict[str, int] = {"succeeded": 0, "failed": 0, "retried": 0}
+
+    def submit(self, case_id: str) -> None:
+        if case_id in self.in_flight:
+            self.rerun.add(case_id)
+            return
+        self.in_flight.add(case_id)
+        task = asyncio.create_task(self._run(case_id))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def drain(self) -> None:
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks))
+
+    async def _run(self, case_id: str) -> None:
+        try:
+            async with self.semaphore:
+                await self._post(case_id)
+        finally:
+            self.in_flight.discard(case_id)
+            if case_id in self.rerun:
+                self.rerun.discard(case_id)
+                self.submit(case_id)
+
+    async def _post(self, case_id: str) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.client.post(f"/api/v1/cases/{case_id}/{self.action}")
+                if response.status_code < 500 and response.status_code != 429:
+                    response.raise_for_status()
+                    self.stats["succeeded"] += 1
+                    print(f"[{self.name}] {self.action} case={case_id}")
+                    return
+                error = f"HTTP {response.status_code}"
+            except httpx.HTTPStatusError as exc:
+                # Client errors (unknown case, not analyzable yet) will not succeed on retry.
+                self.stats["failed"] += 1
+                print(f"[{self.name}] {self.action} case={case_id} rejected: HTTP {exc.response.status_code}")
+                return
+            except httpx.TransportError as exc:
+                error = repr(exc)
+            if attempt < self.max_retries:
+                self.stats["retried"] += 1
+                # Full jitter keeps retries from many cases from arriving in lockstep.
+                await asyncio.sleep(random.uniform(0, self.backoff * 2**attempt))
+        self.stats["failed"] += 1
+        print(f"[{self.name}] {self.action} case={case_id} failed after {self.max_retries + 1} attempts: {error}")
+
+
+async def submit_matching(client: httpx.AsyncClient, runner: CaseRunner, filters: Dict[str, object]) -> None:
+    """Submit every case the API lists for ``filters`` (a server-side ``status=``/``min_items=`` query)."""
+    response = await client.get("/api/v1/cases", params=filters)
+    response.raise_for_status()
+    for case in response.json():
+        runner.submit(case["id"])
+
+
+async def refresh(client: httpx.AsyncClient, runner: CaseRunner, filters: Dict[str, object], interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await submit_matching(client, runner, filters)
+        except httpx.HTTPError as exc:
+            print(f"[{runner.name}] refresh failed ({exc!r}); retrying in {interval}s")
+
+
+async def run_worker(
+    name: str,
+    action: str,
+    catch_up: Dict[str, object],
+    event_types: List[str],
+    should_handle: Callable[[httpx.AsyncClient, dict], Awaitable[bool]] | None = None,
+    refresh_seconds: float | None = None,
+) -> None:
+    """Catch up on matching cases, then act on change-feed events as they arrive.
+
+    ``should_handle``, if given, is awaited per event to decide whether to
+    act on it. With ``refresh_seconds``, the catch-up query is also re-run
+    on that interval, so matching cases keep being re-processed even when
+    no event arrives for them.
+    """
+    limits = httpx.Limits(max_connections=CONCURRENCY + 1, max_keepalive_connections=CONCURRENCY + 1)
+    async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=REQUEST_TIMEOUT_SECONDS, limits=limits) as client:
+        runner = CaseRunner(client, name, action)
+        since = await head(client)
+        await submit_matching(client, runner, catch_up)
+        refresher = asyncio.create_task(refresh(client, runner, catch_up, refresh_seconds)) if refresh_seconds else None
+        try:
+            async for event in follow(client, event_types, since, lambda: submit_matching(client, runner, catch_up)):
+                if should_handle is None or await should_handle(client, event):
+                    runner.submit(event["case_id"])
+        finally:
+            if refresher is not None:
+                refresher.cancel()